@@ -1,5 +1,20 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate, pre_migrate
 
 
 class AccountsConfig(AppConfig):
     name = 'accounts'
+
+    def ready(self):
+        from accounts import authentication
+        from utils import activity_log, counter_cache, model_versions
+        from utils.auth_housekeeping import create_auth_indexes
+        from utils.postgres import create_extensions
+        from utils.response_cache import view_models
+
+        model_versions.track(*view_models())
+        counter_cache.connect_signals()
+        activity_log.connect_signals()
+        authentication.connect_signals()
+        pre_migrate.connect(create_extensions, sender=self)
+        post_migrate.connect(create_auth_indexes, sender=self)
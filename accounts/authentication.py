@@ -0,0 +1,160 @@
+"""
+JWT authentication without a users query per request.
+
+`CachedJWTAuthentication` rebuilds `request.user` from a snapshot of the
+fields the API reads (id, email, names, role and flags) kept in the cache,
+with a small in-process LRU in front of it. Snapshots are keyed by the
+user's version counter (see utils/model_versions.py), bumped whenever the
+user is saved or deleted, and by the version of the users table, bumped by
+`QuerySet.update()` callers. Reading the two counters is the only cache
+round trip of a steady-state request; as soon as a user is deactivated,
+changes role or password, the next request misses and reloads the row.
+
+That only holds when every process reads the same counters. With a
+per-process cache (locmem, the default without `CACHE_URL`) a bump in one
+worker is not seen by the others, so the user is then read from the
+database on every request, as plain `JWTAuthentication` does.
+`JWT_USER_CACHE_SHARED` overrides the detection.
+
+Other fields are deferred on the rebuilt user and load on first access.
+"""
+
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ValidationError
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.signals import post_delete, post_save
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from utils.model_versions import bump_version, get_versions, track
+
+from .models import User
+
+# In the model's field order, which Model.from_db() expects.
+SNAPSHOT_FIELDS = [
+    field.attname
+    for field in User._meta.concrete_fields
+    if field.attname
+    in {"id", "email", "first_name", "last_name", "role", "is_active", "is_staff", "is_superuser"}
+]
+
+KEY_PREFIX = "jwt-user"
+
+
+def user_version_key(user_id):
+    return f"{User._meta.db_table}:{user_id}"
+
+
+class _LRU:
+    def __init__(self, size):
+        self.size = size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+local_snapshots = _LRU(getattr(settings, "JWT_USER_CACHE_LOCAL_SIZE", 1024))
+
+
+def cache_is_shared():
+    shared = getattr(settings, "JWT_USER_CACHE_SHARED", None)
+    if shared is None:
+        return not isinstance(caches["default"], (LocMemCache, DummyCache))
+    return shared
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN or not cache_is_shared():
+            # Needs the password hash, which is not part of the snapshot,
+            # or revocations would not reach the other processes.
+            return super().get_user(validated_token)
+
+        try:
+            user_id = str(validated_token[api_settings.USER_ID_CLAIM])
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        versions = get_versions([User._meta.db_table, user_version_key(user_id)])
+        key = f"{KEY_PREFIX}:{user_id}:" + ":".join(map(str, versions.values()))
+
+        snapshot = local_snapshots.get(key)
+        if snapshot is None:
+            snapshot = cache.get(key)
+            if snapshot is None:
+                snapshot = self.load_snapshot(user_id)
+                cache.set(
+                    key,
+                    snapshot,
+                    timeout=getattr(settings, "JWT_USER_CACHE_TIMEOUT", 300),
+                )
+            local_snapshots.set(key, snapshot)
+
+        if snapshot is False:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        user = User.from_db(DEFAULT_DB_ALIAS, SNAPSHOT_FIELDS, snapshot)
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
+
+    def load_snapshot(self, user_id):
+        """
+        The snapshot field values of the user, or False when there is none
+        (cached too, so bad tokens do not hit the database on every call).
+        """
+        try:
+            values = (
+                User.objects.filter(**{api_settings.USER_ID_FIELD: user_id})
+                .values_list(*SNAPSHOT_FIELDS)
+                .get()
+            )
+        except (User.DoesNotExist, ValidationError):
+            return False
+        return list(values)
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    target_class = "accounts.authentication.CachedJWTAuthentication"
+
+
+def _on_user_change(sender, instance, using, **kwargs):
+    bump_version(user_version_key(instance.pk), using)
+
+
+def connect_signals():
+    track(User)
+    post_save.connect(
+        _on_user_change, sender=User, dispatch_uid="jwt_user_cache_post_save"
+    )
+    post_delete.connect(
+        _on_user_change, sender=User, dispatch_uid="jwt_user_cache_post_delete"
+    )
@@ -0,0 +1,38 @@
+import os
+
+from django.core.management.base import BaseCommand
+
+from accounts.models import ActivityLogArchive
+from utils.activity_archive import archive_activity_logs, retention_cutoff
+
+
+class Command(BaseCommand):
+    help = (
+        "Move activity log entries older than ACTIVITY_LOG_RETENTION_DAYS into "
+        "monthly compressed archives, optionally writing them out as "
+        "NDJSON.gz files."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--export-dir",
+            help="Write every archive missing from this directory as NDJSON.gz.",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Keeping entries from {retention_cutoff():%Y-%m-%d}")
+        for archive in archive_activity_logs():
+            self.stdout.write(f"Archived {archive}")
+
+        if options["export_dir"]:
+            self.export(options["export_dir"])
+
+    def export(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        for archive in ActivityLogArchive.objects.iterator(chunk_size=10):
+            path = os.path.join(directory, archive.filename)
+            if os.path.exists(path):
+                continue
+            with open(path, "wb") as stream:
+                stream.write(bytes(archive.data))
+            self.stdout.write(f"Wrote {path}")
@@ -1,14 +1,33 @@
-import uuid
-
 from django.contrib.auth.models import (
     AbstractBaseUser,
     BaseUserManager,
     PermissionsMixin,
 )
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
+from django.db.models.fields.json import KT
+from django.db.backends.utils import names_digest
+from django.db.models.signals import class_prepared
 from django.utils import timezone
 from django.conf import settings
 
+from utils.general_codes import uuid7
+from utils.postgres import postgres_only
+
+
+class TimeOrderedUUIDField(models.UUIDField):
+    """
+    UUID primary key defaulting to a UUIDv7, so new rows land at the right
+    end of the primary key and foreign key indexes instead of anywhere in
+    them. The column is a plain uuid: existing v4 ids stay valid.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("primary_key", True)
+        kwargs.setdefault("default", uuid7)
+        kwargs.setdefault("editable", False)
+        super().__init__(*args, **kwargs)
+
 
 class SoftDeleteManager(models.Manager):
     def get_queryset(self):
@@ -22,6 +41,11 @@ class SoftDeleteModel(models.Model):
     objects = SoftDeleteManager()
     all_objects = models.Manager()
 
+    # Field lists to index over live rows only. Each becomes a partial index
+    # WHERE NOT is_deleted, the predicate SoftDeleteManager adds to every
+    # query, so deleted rows never enter the index.
+    live_indexes = ()
+
     def delete(self, using=None, keep_parents=False):
         self.is_deleted = True
         self.deleted_on = timezone.now()
@@ -31,10 +55,37 @@ class SoftDeleteModel(models.Model):
         abstract = True
 
 
+def live_index(model, fields):
+    table = model._meta.db_table
+    column = fields[0].lstrip("-")
+    digest = names_digest(table, *fields, "live", length=6)
+    return models.Index(
+        fields=list(fields),
+        condition=models.Q(is_deleted=False),
+        name=f"{table[:10]}_{column[:7]}_{digest}_live",
+    )
+
+
+def add_live_indexes(sender, **kwargs):
+    if not issubclass(sender, SoftDeleteModel) or sender._meta.abstract:
+        return
+    sender._meta.indexes = [
+        *sender._meta.indexes,
+        *(live_index(sender, fields) for fields in sender.live_indexes),
+    ]
+
+
+class_prepared.connect(add_live_indexes)
+
+
 class TimeStampedModel(models.Model):
     created_on = models.DateTimeField(auto_now_add=True)
     updated_on = models.DateTimeField(auto_now=True)
 
+    # Large text columns that list views defer unless the serializer renders
+    # them (see utils.query_planner.DeferHeavyFieldsMixin).
+    heavy_fields = ()
+
     class Meta:
         abstract = True
 
@@ -69,7 +120,7 @@ class User(AbstractBaseUser, PermissionsMixin, TimeStampedModel):
         (IFASHE_MANAGER, "Ifashe Manager"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     email = models.EmailField(max_length=255, unique=True)
     first_name = models.CharField(max_length=100, blank=True)
     last_name = models.CharField(max_length=100, blank=True)
@@ -125,7 +176,7 @@ class VerificationCode(models.Model):
         (PASSWORD_CHANGE, "Change Password"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="verification_codes"
     )
@@ -137,6 +188,8 @@ class VerificationCode(models.Model):
     class Meta:
         indexes = [
             models.Index(fields=["code", "purpose"]),
+            # Expiry predicate of the purge job.
+            models.Index(fields=["created_on"], name="verification_code_created_idx"),
         ]
 
     def __str__(self):
@@ -159,7 +212,8 @@ class ActivityLog(models.Model):
     action = models.CharField(max_length=255)
     resource = models.CharField(max_length=255, null=True, blank=True)
     resource_id = models.CharField(max_length=255, null=True, blank=True)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Set when the activity is recorded, not when a buffered batch is written.
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
     details = models.JSONField(null=True, blank=True)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
 
@@ -168,6 +222,58 @@ class ActivityLog(models.Model):
         ordering = ["-timestamp"]
         verbose_name = "Activity Log"
         verbose_name_plural = "Activity Logs"
+        indexes = [
+            models.Index(fields=["-timestamp"], name="activity_log_timestamp_idx"),
+            models.Index(
+                fields=["resource", "resource_id"], name="activity_log_resource_idx"
+            ),
+            *postgres_only(
+                # The keys record_activity writes, filtered on with
+                # ?details__name= / ?details__email= (details ->> 'name').
+                models.Index(KT("details__name"), name="activity_log_detail_name_idx"),
+                models.Index(
+                    KT("details__email"), name="activity_log_detail_email_idx"
+                ),
+                # ?details__contains={...} compiles to details @> '{...}'.
+                GinIndex(
+                    fields=["details"],
+                    opclasses=["jsonb_path_ops"],
+                    name="activity_log_details_gin",
+                ),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user} - {self.action} - {self.timestamp}"
+
+
+class ActivityLogArchive(models.Model):
+    """
+    Activity log entries of one month moved out of `activity_logs` by the
+    retention job, stored as gzip-compressed NDJSON (see
+    utils/activity_archive.py).
+    """
+
+    id = TimeOrderedUUIDField()
+    month = models.DateField()
+    entry_count = models.PositiveIntegerField()
+    first_timestamp = models.DateTimeField()
+    last_timestamp = models.DateTimeField()
+    data = models.BinaryField()
+    created_on = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "activity_log_archives"
+        ordering = ["-month", "-created_on"]
+        verbose_name = "Activity Log Archive"
+        verbose_name_plural = "Activity Log Archives"
+        indexes = [
+            models.Index(fields=["month"], name="activity_archive_month_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} ({self.entry_count} entries)"
+
+    @property
+    def filename(self):
+        return f"activity-log-{self.month:%Y-%m}-{self.id.hex[:8]}.ndjson.gz"
@@ -9,7 +9,7 @@ from utils.general_codes import generate_manager_password, generate_verification
 
 from utils.validators import validate_rwanda_phone
 
-from .models import User, VerificationCode, ActivityLog
+from .models import User, VerificationCode, ActivityLog, ActivityLogArchive
 
 
 class ActivityLogSerializer(serializers.ModelSerializer):
@@ -33,6 +33,20 @@ class ActivityLogSerializer(serializers.ModelSerializer):
         read_only_fields = ["timestamp"]
 
 
+class ActivityLogArchiveSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ActivityLogArchive
+        fields = [
+            "id",
+            "month",
+            "entry_count",
+            "first_timestamp",
+            "last_timestamp",
+            "filename",
+            "created_on",
+        ]
+
+
 class ManagerSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -75,6 +89,7 @@ class LoginSerializer(serializers.Serializer):
         if not user.is_active:
             raise AuthenticationFailed("Account is disabled")
 
+        self.user = user
         refresh = RefreshToken.for_user(user)
 
         to_return = {
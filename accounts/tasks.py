@@ -1,9 +1,13 @@
+import logging
+
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
 from django.utils.timezone import now
 from celery import shared_task
 
+logger = logging.getLogger(__name__)
+
 @shared_task
 def send_temporary_credentials_task(email, password):
     subject = "Account created at Hameau des Jeunes"
@@ -47,4 +51,28 @@ def send_password_reset_email_task(email, code):
     )
 
     email_message.attach_alternative(html_content, "text/html")
-    return email_message.send()
\ No newline at end of file
+    return email_message.send()
+
+@shared_task
+def archive_activity_logs_task():
+    from utils.activity_archive import archive_activity_logs
+
+    archives = archive_activity_logs()
+    return sum(archive.entry_count for archive in archives)
+
+
+@shared_task
+def purge_auth_tables_task():
+    from utils.auth_housekeeping import (
+        auth_table_metrics,
+        purge_expired_tokens,
+        purge_expired_verification_codes,
+    )
+
+    purged = {
+        "tokens": purge_expired_tokens(),
+        "verification_codes": purge_expired_verification_codes(),
+    }
+    metrics = auth_table_metrics()
+    logger.info(f"Purged auth tables: {purged}, sizes: {metrics}")
+    return {"purged": purged, "tables": metrics}
@@ -0,0 +1,78 @@
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from accounts.models import ActivityLog, ActivityLogArchive, User
+from utils.activity_archive import archive_activity_logs, read_archive
+
+
+@override_settings(ACTIVITY_LOG_RETENTION_DAYS=60)
+class ActivityLogArchiveTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser(
+            email="archive@example.com", password="password123"
+        )
+        self.now = timezone.now().replace(year=2025, month=6, day=15)
+        for month, count in [(1, 3), (2, 2), (5, 1)]:
+            for number in range(count):
+                ActivityLog.objects.create(
+                    user=self.user,
+                    action=f"ACTION_{month}_{number}",
+                    timestamp=self.now.replace(month=month, day=number + 1),
+                    details={"month": month},
+                )
+
+    def test_old_months_are_moved_to_archives(self):
+        archives = archive_activity_logs(now=self.now)
+
+        self.assertEqual([archive.entry_count for archive in archives], [3, 2])
+        self.assertEqual(
+            list(ActivityLog.objects.values_list("action", flat=True)), ["ACTION_5_0"]
+        )
+        entries = list(read_archive(archives[0]))
+        self.assertEqual(entries[0]["action"], "ACTION_1_0")
+        self.assertEqual(entries[0]["user__email"], "archive@example.com")
+        self.assertEqual(entries[2]["details"], {"month": 1})
+
+    def test_archiving_twice_is_a_no_op(self):
+        archive_activity_logs(now=self.now)
+        self.assertEqual(archive_activity_logs(now=self.now), [])
+        self.assertEqual(ActivityLogArchive.objects.count(), 2)
+
+    def test_command_exports_archives(self):
+        # The seeded months are well past the retention window.
+        with tempfile.TemporaryDirectory() as directory:
+            call_command(
+                "archive_activity_logs", export_dir=directory, stdout=StringIO()
+            )
+            archives = ActivityLogArchive.objects.all()
+            self.assertEqual(
+                sorted(os.listdir(directory)),
+                sorted(archive.filename for archive in archives),
+            )
+        self.assertEqual(ActivityLogArchive.objects.count(), 3)
+
+    def test_download_archive(self):
+        archive = archive_activity_logs(now=self.now)[0]
+        self.client.force_authenticate(self.user)
+
+        response = self.client.get(f"/api/activity-log-archives/{archive.id}/download/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertIn(archive.filename, response["Content-Disposition"])
+
+    def test_activity_logs_filter_by_window(self):
+        self.client.force_authenticate(self.user)
+        since = self.now.replace(month=2, day=1).isoformat()
+
+        response = self.client.get("/api/activity-logs/", {"timestamp__gte": since})
+
+        self.assertEqual(response.status_code, 200)
+        actions = {entry["action"] for entry in response.data["results"]}
+        self.assertEqual(actions, {"ACTION_2_0", "ACTION_2_1", "ACTION_5_0"})
@@ -0,0 +1,74 @@
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from accounts.models import ActivityLog, User
+from utils.activity_log import ActivityLogMiddleware, buffer, record_activity
+
+
+class BufferedActivityLogTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="buffer@example.com",
+            password="password123",
+            role=User.ADMIN,
+        )
+        self.factory = RequestFactory()
+        self.addCleanup(buffer.flush)
+
+    def handle(self, count):
+        def view(request):
+            for number in range(count):
+                record_activity(request, action=f"BUFFERED_{number}")
+            return None
+
+        request = self.factory.get("/")
+        request.user = self.user
+        ActivityLogMiddleware(view)(request)
+
+    @override_settings(ACTIVITY_LOG_BUFFER_SIZE=3, ACTIVITY_LOG_FLUSH_INTERVAL=0)
+    def test_request_activities_are_buffered(self):
+        with self.assertNumQueries(0):
+            self.handle(2)
+        self.assertFalse(ActivityLog.objects.exists())
+
+        self.assertEqual(buffer.flush(), 2)
+        self.assertEqual(ActivityLog.objects.filter(user=self.user).count(), 2)
+
+    @override_settings(ACTIVITY_LOG_BUFFER_SIZE=3, ACTIVITY_LOG_FLUSH_INTERVAL=0)
+    def test_full_buffer_is_written_in_one_query(self):
+        self.handle(2)
+        with CaptureQueriesContext(connection) as queries:
+            self.handle(1)
+        # One INSERT, between the SAVEPOINT and RELEASE of its atomic block.
+        inserts = [q for q in queries if q["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(ActivityLog.objects.count(), 3)
+
+    def test_failed_batch_drops_only_bad_entries(self):
+        # The test runs in a transaction, like a flush at the end of an
+        # atomic request: the failed insert must not abort it.
+        self.handle(2)
+        buffer.entries[0].action = None
+        self.assertEqual(buffer.flush(), 1)
+        self.assertEqual(
+            list(ActivityLog.objects.values_list("action", flat=True)),
+            ["BUFFERED_1"],
+        )
+
+    def test_timestamp_is_recording_time(self):
+        self.handle(1)
+        recorded = buffer.entries[0].timestamp
+        buffer.flush()
+        self.assertEqual(ActivityLog.objects.get().timestamp, recorded)
+
+    @override_settings(ACTIVITY_LOG_FLUSH_INTERVAL=0)
+    def test_login_is_written_after_response(self):
+        response = self.client.post(
+            "/api/managers/login/",
+            {"email": "buffer@example.com", "password": "password123"},
+        )
+        self.assertEqual(response.status_code, 200)
+        log = ActivityLog.objects.get(action="LOGIN")
+        self.assertEqual(log.user, self.user)
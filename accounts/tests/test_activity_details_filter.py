@@ -0,0 +1,40 @@
+from rest_framework.test import APITestCase
+
+from accounts.models import ActivityLog, User
+
+
+class ActivityLogDetailsFilterTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser(
+            email="details@example.com", password="password123"
+        )
+        ActivityLog.objects.create(
+            action="CREATE", resource="Child", details={"name": "Jane Doe"}
+        )
+        ActivityLog.objects.create(
+            action="LOGIN", resource="User", details={"email": "jane@example.com"}
+        )
+        self.client.force_authenticate(self.user)
+
+    def actions(self, params):
+        response = self.client.get("/api/activity-logs/", params)
+        self.assertEqual(response.status_code, 200)
+        return [entry["action"] for entry in response.data["results"]]
+
+    def test_filter_by_details_key(self):
+        self.assertEqual(self.actions({"details__name": "Jane Doe"}), ["CREATE"])
+        self.assertEqual(
+            self.actions({"details__email": "jane@example.com"}), ["LOGIN"]
+        )
+        self.assertEqual(self.actions({"details__name": "Jane"}), [])
+
+    def test_filter_by_details_containment(self):
+        self.assertEqual(
+            self.actions({"details__contains": '{"name": "Jane Doe"}'}), ["CREATE"]
+        )
+
+    def test_invalid_containment_document(self):
+        response = self.client.get(
+            "/api/activity-logs/", {"details__contains": "[1, 2]"}
+        )
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,102 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.authentication import local_snapshots
+from accounts.models import User
+
+
+@override_settings(JWT_USER_CACHE_SHARED=True)
+class CachedJWTAuthenticationTests(APITestCase):
+    url = "/api/activity-logs/"
+
+    def setUp(self):
+        cache.clear()
+        local_snapshots.clear()
+        self.user = User.objects.create_superuser(
+            email="jwt@example.com",
+            password="password123",
+            first_name="Jwt",
+            last_name="User",
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def user_queries(self, context):
+        return [
+            query["sql"]
+            for query in context.captured_queries
+            if 'FROM "users"' in query["sql"]
+        ]
+
+    def test_steady_state_requests_do_not_query_users(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.user_queries(context), [])
+
+    def test_first_request_loads_the_user(self):
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.url)
+
+        self.assertEqual(len(self.user_queries(context)), 1)
+
+    def test_snapshot_survives_local_cache_loss(self):
+        self.client.get(self.url)
+        local_snapshots.clear()
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.url)
+
+        self.assertEqual(self.user_queries(context), [])
+
+    def test_deactivation_is_immediate(self):
+        self.client.get(self.url)
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_role_change_is_immediate(self):
+        self.client.get(self.url)
+        self.user.is_superuser = False
+        self.user.role = User.RESIDENTIAL_MANAGER
+        self.user.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_update_queryset_invalidates_snapshots(self):
+        from utils.model_versions import bump_version
+
+        self.client.get(self.url)
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        bump_version(User)
+
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+    def test_deleted_user_is_rejected(self):
+        self.client.get(self.url)
+        self.user.delete()
+
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+    @override_settings(JWT_USER_CACHE_SHARED=None)
+    def test_per_process_cache_reads_the_user(self):
+        # The test cache is locmem: another worker would not see the bump.
+        self.client.get(self.url)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.user_queries(context)), 1)
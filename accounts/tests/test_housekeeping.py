@@ -0,0 +1,82 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from accounts.models import User, VerificationCode
+from accounts.tasks import purge_auth_tables_task
+from utils.auth_housekeeping import (
+    OUTSTANDING_TOKEN_EXPIRY_INDEX,
+    purge_expired_tokens,
+    purge_expired_verification_codes,
+)
+
+
+class AuthHousekeepingTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="housekeeping@example.com", password="password123"
+        )
+        now = timezone.now()
+        for number in range(5):
+            token = OutstandingToken.objects.create(
+                user=self.user,
+                jti=f"expired-{number}",
+                token="token",
+                expires_at=now - timedelta(days=1),
+            )
+            BlacklistedToken.objects.create(token=token)
+        OutstandingToken.objects.create(
+            user=self.user,
+            jti="live",
+            token="token",
+            expires_at=now + timedelta(days=1),
+        )
+
+    def test_expired_tokens_are_purged_in_batches(self):
+        with self.assertNumQueries(10):
+            # 3 batches of 3 queries (ids and 2 deletes) and the empty final
+            # batch.
+            self.assertEqual(purge_expired_tokens(batch_size=2), 5)
+
+        self.assertEqual(
+            list(OutstandingToken.objects.values_list("jti", flat=True)), ["live"]
+        )
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+    def test_expired_codes_are_purged(self):
+        fresh = VerificationCode.objects.create(
+            user=self.user, code="111111", purpose=VerificationCode.PASSWORD_RESET
+        )
+        old = VerificationCode.objects.create(
+            user=self.user, code="222222", purpose=VerificationCode.PASSWORD_RESET
+        )
+        VerificationCode.objects.filter(pk=old.pk).update(
+            created_on=timezone.now() - settings.VERIFICATION_CODE_LIFETIME * 2
+        )
+
+        self.assertEqual(purge_expired_verification_codes(), 1)
+        self.assertEqual(list(VerificationCode.objects.all()), [fresh])
+
+    def test_task_reports_table_metrics(self):
+        result = purge_auth_tables_task()
+
+        self.assertEqual(result["purged"], {"tokens": 5, "verification_codes": 0})
+        self.assertEqual(
+            result["tables"][OutstandingToken._meta.db_table]["rows"], 1
+        )
+
+    def test_expiry_index_exists(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, OutstandingToken._meta.db_table
+            )
+        self.assertEqual(
+            constraints[OUTSTANDING_TOKEN_EXPIRY_INDEX]["columns"], ["expires_at"]
+        )
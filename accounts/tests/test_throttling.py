@@ -0,0 +1,151 @@
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from utils.throttling import SlidingWindowThrottle
+
+REST_FRAMEWORK = {
+    **settings.REST_FRAMEWORK,
+    "DEFAULT_THROTTLE_RATES": {
+        "login": "3/min",
+        "login_email": "2/min",
+        "public": "2/min",
+    },
+}
+
+
+@override_settings(REST_FRAMEWORK=REST_FRAMEWORK)
+class ThrottlingTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.user = User.objects.create_user(
+            email="throttle@example.com", password="password123"
+        )
+
+    def login(self, email, ip="10.0.0.1", **extra):
+        return self.client.post(
+            "/api/managers/login/",
+            {"email": email, "password": "wrong-password"},
+            REMOTE_ADDR=ip,
+            **extra,
+        )
+
+    def test_login_is_throttled_per_email(self):
+        self.assertEqual(self.login("throttle@example.com", "10.0.0.1").status_code, 403)
+        self.assertEqual(self.login("Throttle@example.com", "10.0.0.2").status_code, 403)
+
+        response = self.login("throttle@example.com", "10.0.0.3")
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+
+    def test_login_is_throttled_per_ip(self):
+        for number in range(3):
+            self.login(f"user{number}@example.com")
+
+        self.assertEqual(self.login("other@example.com").status_code, 429)
+        self.assertEqual(
+            self.login("other@example.com", ip="10.0.0.9").status_code, 403
+        )
+
+    def test_spoofed_forwarded_for_keeps_the_bucket(self):
+        for num_proxies in (0, None):
+            cache.clear()
+            rest_framework = {**REST_FRAMEWORK, "NUM_PROXIES": num_proxies}
+            with self.settings(REST_FRAMEWORK=rest_framework):
+                statuses = [
+                    self.login(
+                        f"user{number}@example.com",
+                        HTTP_X_FORWARDED_FOR=f"192.0.2.{number}",
+                    ).status_code
+                    for number in range(4)
+                ]
+            self.assertEqual(statuses[-1], 429, num_proxies)
+
+    def test_forwarded_for_behind_a_trusted_proxy(self):
+        rest_framework = {**REST_FRAMEWORK, "NUM_PROXIES": 1}
+        with self.settings(REST_FRAMEWORK=rest_framework):
+            for number in range(3):
+                self.login(
+                    f"user{number}@example.com",
+                    HTTP_X_FORWARDED_FOR="203.0.113.7, 192.0.2.1",
+                )
+            response = self.login(
+                "other@example.com", HTTP_X_FORWARDED_FOR="192.0.2.2"
+            )
+        self.assertEqual(response.status_code, 403)
+
+    def test_throttled_login_does_not_check_password(self):
+        for number in range(3):
+            self.login(f"user{number}@example.com")
+
+        with mock.patch("accounts.serializers.authenticate") as authenticate:
+            self.login("throttle@example.com")
+
+        authenticate.assert_not_called()
+
+    def test_public_gallery_is_throttled_for_anonymous_clients_only(self):
+        for _ in range(2):
+            self.assertEqual(self.client.get("/api/gallery-categories/").status_code, 200)
+        self.assertEqual(self.client.get("/api/gallery-categories/").status_code, 429)
+
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.client.get("/api/gallery-categories/").status_code, 200)
+
+
+class StaleReadCache:
+    """
+    The cache as seen by requests that all read their counts before any of
+    them wrote: reads return nothing, writes go through.
+    """
+
+    def get(self, key, default=None):
+        return default
+
+    def get_many(self, keys):
+        return {}
+
+    def __getattr__(self, name):
+        return getattr(cache, name)
+
+
+class SlidingWindowTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def make_throttle(self, now):
+        class Throttle(SlidingWindowThrottle):
+            timer = staticmethod(lambda: now)
+
+            def get_rate(self, view):
+                return "test", "10/min"
+
+            def get_ident_value(self, request, view):
+                return "client"
+
+        return Throttle()
+
+    def test_previous_window_counts_while_it_overlaps(self):
+        for _ in range(10):
+            self.assertTrue(self.make_throttle(60 * 100 + 30).allow_request(None, None))
+
+        # Half-way into the next window half of the previous count remains.
+        throttle = self.make_throttle(60 * 101 + 30)
+        allowed = [throttle.allow_request(None, None) for _ in range(6)]
+
+        self.assertEqual(allowed, [True] * 5 + [False])
+        self.assertGreater(throttle.wait(), 0)
+        self.assertLessEqual(throttle.wait(), 30)
+
+    def test_concurrent_requests_cannot_overshoot(self):
+        throttle = self.make_throttle(60 * 100 + 30)
+        throttle.cache = StaleReadCache()
+        allowed = [throttle.allow_request(None, None) for _ in range(15)]
+
+        self.assertEqual(allowed, [True] * 10 + [False] * 5)
@@ -0,0 +1,40 @@
+import time
+import uuid
+
+from rest_framework.test import APITestCase
+
+from accounts.models import User, VerificationCode
+from utils.general_codes import uuid7
+
+
+class TimeOrderedUUIDTests(APITestCase):
+    def test_uuid7_version_and_variant(self):
+        value = uuid7()
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_uuid7_carries_current_time(self):
+        before = int(time.time() * 1000)
+        value = uuid7()
+        after = int(time.time() * 1000)
+        self.assertTrue(before <= value.int >> 80 <= after + 1)
+
+    def test_uuid7_increases(self):
+        values = [uuid7() for _ in range(5000)]
+        self.assertEqual(values, sorted(values))
+        self.assertEqual(len(set(values)), len(values))
+
+    def test_models_default_to_uuid7(self):
+        user = User.objects.create_user(email="ordered@example.com", password="x")
+        code = VerificationCode.objects.create(
+            user=user, code="123456", purpose=VerificationCode.PASSWORD_RESET
+        )
+        self.assertEqual(user.id.version, 7)
+        self.assertLess(user.id, code.id)
+
+    def test_existing_uuid4_ids_still_valid(self):
+        legacy_id = uuid.uuid4()
+        User.objects.create_user(
+            id=legacy_id, email="legacy@example.com", password="x"
+        )
+        self.assertTrue(User.objects.filter(pk=legacy_id).exists())
@@ -1,10 +1,11 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
-from .views import ManagerViewset, LoginView, RequestPasswordResetView, ResetPasswordConfirmView, LogoutAPIView, ChangePasswordView, ActivityLogViewSet
+from .views import ManagerViewset, LoginView, RequestPasswordResetView, ResetPasswordConfirmView, LogoutAPIView, ChangePasswordView, ActivityLogViewSet, ActivityLogArchiveViewSet
 
 router = DefaultRouter()
 router.register('managers', ManagerViewset)
 router.register('activity-logs', ActivityLogViewSet, basename='activity-logs')
+router.register('activity-log-archives', ActivityLogArchiveViewSet, basename='activity-log-archives')
 
 
 urlpatterns = [
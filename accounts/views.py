@@ -14,7 +14,9 @@ from drf_spectacular.utils import (
 from django_filters.rest_framework import DjangoFilterBackend
 
 
-from .models import User, ActivityLog
+from django.http import HttpResponse
+
+from .models import User, ActivityLog, ActivityLogArchive
 from utils.activity_log import record_activity
 from .permissions import (
     CanDestroyManager,
@@ -28,11 +30,15 @@ from .serializers import (
     ResetPasswordConfirmSerializer,
     ChangePasswordSerializer,
     ActivityLogSerializer,
+    ActivityLogArchiveSerializer,
 )
 
 from utils.bulk_operations.mixins import BulkActionMixin
+from utils.filters.activity_log_filters import ActivityLogFilter
+from utils.throttling import ScopedEmailThrottle, ScopedIPThrottle
 from utils.bulk_operations.tasks import generic_bulk_task
 from utils.bulk_operations.serializers import BulkActionSerializer
+from utils.conditional_get import ConditionalGetMixin
 
 
 logger = logging.getLogger(__name__)
@@ -58,21 +64,64 @@ logger = logging.getLogger(__name__)
         },
     ),
 )
-class ActivityLogViewSet(viewsets.ReadOnlyModelViewSet):
+class ActivityLogViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = ActivityLog.objects.all().select_related("user")
     serializer_class = ActivityLogSerializer
+    last_modified_field = "timestamp"
     permission_classes = [IsAuthenticated, IsSystemAdmin]
     filter_backends = [
         DjangoFilterBackend,
         filters.SearchFilter,
         filters.OrderingFilter,
     ]
-    filterset_fields = ["user", "action", "resource"]
-    search_fields = ["action", "resource", "resource_id", "details"]
+    # Bounding searches with timestamp__gte keeps them on the recent end of
+    # the timestamp index. Entries older than the retention window are in
+    # the activity log archives. `details` is filtered with the structured
+    # details__* filters rather than searched as text.
+    filterset_class = ActivityLogFilter
+    search_fields = ["action", "resource", "resource_id"]
     ordering_fields = ["timestamp"]
     ordering = ["-timestamp"]
 
 
+@extend_schema_view(
+    list=extend_schema(
+        tags=["Activity Logs"],
+        summary="List activity log archives",
+        description="Months of activity moved out of the activity log by the retention job.",
+    ),
+    retrieve=extend_schema(
+        tags=["Activity Logs"],
+        summary="Retrieve activity log archive",
+    ),
+)
+class ActivityLogArchiveViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = ActivityLogArchive.objects.defer("data")
+    serializer_class = ActivityLogArchiveSerializer
+    last_modified_field = "created_on"
+    permission_classes = [IsAuthenticated, IsSystemAdmin]
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "download":
+            # The archive body is what the download sends: load it with the row.
+            queryset = queryset.defer(None)
+        return queryset
+
+    @extend_schema(
+        tags=["Activity Logs"],
+        summary="Download activity log archive",
+        description="The archived entries as gzip-compressed NDJSON.",
+        responses={(200, "application/gzip"): OpenApiResponse(description="NDJSON.gz file")},
+    )
+    @action(detail=True, methods=["get"])
+    def download(self, request, pk=None):
+        archive = self.get_object()
+        response = HttpResponse(bytes(archive.data), content_type="application/gzip")
+        response["Content-Disposition"] = f'attachment; filename="{archive.filename}"'
+        return response
+
+
 @extend_schema_view(
     list=extend_schema(
         tags=["Managers"],
@@ -135,7 +184,7 @@ class ActivityLogViewSet(viewsets.ReadOnlyModelViewSet):
         },
     ),
 )
-class ManagerViewset(BulkActionMixin, viewsets.ModelViewSet):
+class ManagerViewset(ConditionalGetMixin, BulkActionMixin, viewsets.ModelViewSet):
     serializer_class = ManagerSerializer
     queryset = User.objects.order_by("first_name")
     permission_classes = [IsAuthenticated]
@@ -258,6 +307,8 @@ class LoginView(APIView):
 
     authentication_classes = []
     permission_classes = [AllowAny]
+    throttle_classes = [ScopedIPThrottle, ScopedEmailThrottle]
+    throttle_scope = "login"
 
     @extend_schema(
         summary="Login Manager",
@@ -284,18 +335,15 @@ class LoginView(APIView):
         serializer.is_valid(raise_exception=True)
 
         # Record activity after successful authentication
-        try:
-            user = User.objects.get(email=request.data.get("email"))
-            record_activity(
-                request,
-                action="LOGIN",
-                user=user,
-                resource="User",
-                resource_id=str(user.id),
-                details={"email": user.email},
-            )
-        except User.DoesNotExist:
-            pass
+        user = serializer.user
+        record_activity(
+            request,
+            action="LOGIN",
+            user=user,
+            resource="User",
+            resource_id=str(user.id),
+            details={"email": user.email},
+        )
 
         return Response(
             serializer.validated_data,
@@ -316,6 +364,8 @@ class LoginView(APIView):
 class RequestPasswordResetView(APIView):
     permission_classes = [AllowAny]
     authentication_classes = []
+    throttle_classes = [ScopedIPThrottle, ScopedEmailThrottle]
+    throttle_scope = "password_reset"
 
     def post(self, request):
         logger.info("Initializing user password request")
@@ -342,6 +392,8 @@ class RequestPasswordResetView(APIView):
 class ResetPasswordConfirmView(APIView):
     permission_classes = [AllowAny]
     authentication_classes = []
+    throttle_classes = [ScopedIPThrottle, ScopedEmailThrottle]
+    throttle_scope = "password_reset_confirm"
 
     def post(self, request):
         serializer = ResetPasswordConfirmSerializer(data=request.data)
@@ -20,6 +20,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     'rest_framework',
     'rest_framework.authtoken',
@@ -45,12 +46,14 @@ SITE_ID = 1
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware', 
     'django.middleware.security.SecurityMiddleware',
+    'utils.compression.CompressionMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
+    'utils.activity_log.ActivityLogMiddleware',
 ]
 
 
@@ -88,3 +91,13 @@ USE_TZ = True
 VERIFICATION_CODE_LIFETIME = timedelta(minutes=15)
 
 
+
+# Activities recorded during a request or task are buffered and written in
+# batches (see utils/activity_log.py).
+ACTIVITY_LOG_BUFFER_SIZE = 100
+ACTIVITY_LOG_FLUSH_INTERVAL = 5  # seconds
+# Older months are moved to compressed archives (see utils/activity_archive.py).
+ACTIVITY_LOG_RETENTION_DAYS = 180
+
+# Smaller responses are sent uncompressed (see utils/compression.py).
+RESPONSE_COMPRESSION_MIN_SIZE = 1024  # bytes
@@ -0,0 +1,21 @@
+from .base import env
+
+# Shared cache (Redis) in deployments; a per-process memory cache otherwise.
+# Without a shared cache, CachedJWTAuthentication reads the user from the
+# database on every request (see accounts/authentication.py).
+CACHE_URL = env("CACHE_URL", default="")
+
+if CACHE_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_URL,
+            "KEY_PREFIX": "hameau",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
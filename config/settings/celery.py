@@ -25,4 +25,12 @@ CELERY_BEAT_SCHEDULE = {
         "task": "donations.tasks.process_recurring_donations_task",
         "schedule": crontab(hour=0, minute=0),
     },
+    "purge-auth-tables": {
+        "task": "accounts.tasks.purge_auth_tables_task",
+        "schedule": crontab(hour=3, minute=0),
+    },
+    "archive-activity-logs": {
+        "task": "accounts.tasks.archive_activity_logs_task",
+        "schedule": crontab(day_of_month=1, hour=2, minute=0),
+    },
 }
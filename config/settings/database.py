@@ -19,3 +19,7 @@ DATABASES = {
 #         "NAME": BASE_DIR / "dbc.sqlite3",
 #     }
 # }
+
+# Text search configuration of the stored search vectors. "simple" does no
+# stemming, which suits records written in several languages.
+FULL_TEXT_SEARCH_CONFIG = "simple"
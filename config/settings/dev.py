@@ -7,6 +7,7 @@ from .static import *
 from .cors import *
 from .third_party import *
 from .celery import *
+from .cache import *
 from .logging import *
 
 from .base import env
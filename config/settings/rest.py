@@ -1,18 +1,54 @@
 from datetime import timedelta
 
+from .base import env
+
 REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.CachedJWTAuthentication",
     ),
+    "DEFAULT_RENDERER_CLASSES": [
+        "utils.fast_json.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "utils.fast_json.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_PAGINATION_CLASS": "utils.paginators.StandardResultsSetPagination",
     "PAGE_SIZE": 10,
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # Per throttle_scope, see utils/throttling.py. "<scope>_email" rates
+    # apply per submitted email address, the others per client IP.
+    "DEFAULT_THROTTLE_RATES": {
+        "login": "10/min",
+        "login_email": "5/min",
+        "password_reset": "5/hour",
+        "password_reset_email": "3/hour",
+        "password_reset_confirm": "10/hour",
+        "password_reset_confirm_email": "5/hour",
+        "internship_application": "10/hour",
+        "public": "120/min",
+    },
+    # Proxies in front of the app that append to X-Forwarded-For: the client
+    # IP throttles key on the address the last of them saw. 0 uses
+    # REMOTE_ADDR; a client can put anything in the header itself.
+    "NUM_PROXIES": env.int("NUM_PROXIES", default=0),
 }
 
 
+# Snapshot of the authenticated user kept in the cache, see
+# accounts/authentication.py.
+JWT_USER_CACHE_TIMEOUT = 300
+JWT_USER_CACHE_LOCAL_SIZE = 1024
+
+# Seconds a cached GET response is kept, see utils/response_cache.py.
+# 0 disables the response cache.
+RESPONSE_CACHE_TIMEOUT = 300
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=1),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
@@ -38,5 +74,12 @@ SPECTACULAR_SETTINGS = {
         {"name": "Managers"},
         {"name": "Public Modules"},
         {"name": "Residential Care Program"},
+        {"name": "Search"},
     ],
 }
+
+# Paginated responses report the planner's row estimate instead of an exact
+# COUNT(*) when it is at least this large (Postgres only, None to disable).
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = 100_000
+# Seconds an exact count is cached for; saves and deletes invalidate earlier.
+PAGINATION_COUNT_CACHE_TIMEOUT = 60
@@ -1,7 +1,7 @@
-import uuid
 from django.db import models
 from django.utils import timezone
-from accounts.models import TimeStampedModel, SoftDeleteModel
+from accounts.models import TimeStampedModel, SoftDeleteModel, TimeOrderedUUIDField
+from utils.postgres import postgres_only, trigram_index
 
 class Donor(TimeStampedModel, SoftDeleteModel):
     """
@@ -18,7 +18,7 @@ class Donor(TimeStampedModel, SoftDeleteModel):
         (ANONYMOUS, "Anonymous"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     fullname = models.CharField(max_length=200, help_text="Full name of the donor or organization.")
     email = models.EmailField(max_length=255, unique=True, null=True, blank=True, help_text="Contact email for report delivery.")
     phone = models.CharField(max_length=20, blank=True)
@@ -27,11 +27,18 @@ class Donor(TimeStampedModel, SoftDeleteModel):
         max_length=50, choices=DONOR_TYPE_CHOICES, default=INDIVIDUAL
     )
 
+    live_indexes = [["fullname"], ["-created_on"]]
+
     class Meta:
         db_table = "donors"
         ordering = ["fullname"]
         verbose_name = "Donor"
         verbose_name_plural = "Donors"
+        indexes = postgres_only(
+            trigram_index("fullname", "donors_fullname_trgm"),
+            trigram_index("email", "donors_email_trgm"),
+            trigram_index("phone", "donors_phone_trgm"),
+        )
 
     def __str__(self):
         return self.fullname
@@ -73,7 +80,7 @@ class Donation(TimeStampedModel):
         (YEARLY, "Yearly"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     donor = models.ForeignKey(
         Donor, on_delete=models.SET_NULL, null=True, blank=True, related_name="donations"
     )
@@ -119,11 +126,27 @@ class Donation(TimeStampedModel):
     receipt_image = models.ImageField(upload_to="donations_receipts/", blank=True, null=True)
     notes = models.TextField(blank=True)
 
+    heavy_fields = ["notes"]
+
     class Meta:
         db_table = "donations"
         ordering = ["-donation_date"]
         verbose_name = "Donation"
         verbose_name_plural = "Donations"
+        indexes = [
+            # Donor/child pairs scanned by the monthly sponsor emails.
+            models.Index(
+                fields=["child", "donor"],
+                condition=models.Q(child__isnull=False, donor__isnull=False),
+                name="donation_child_donor_idx",
+            ),
+            # Subscriptions due for the daily recurring charge.
+            models.Index(
+                fields=["next_deduction_date"],
+                condition=models.Q(is_recurring=True),
+                name="donation_recurring_due_idx",
+            ),
+        ]
 
     def __str__(self):
         donor_name = self.donor.fullname if self.donor else "Anonymous"
@@ -135,7 +158,7 @@ class SponsorEmailLog(TimeStampedModel):
     Log of monthly progress reports sent to donors.
     Prevents duplicate emails and tracks delivery status.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     donor = models.ForeignKey(
         Donor, on_delete=models.CASCADE, related_name="email_logs"
     )
@@ -153,6 +176,12 @@ class SponsorEmailLog(TimeStampedModel):
         ordering = ["-sent_at"]
         verbose_name = "Donor Email Log"
         verbose_name_plural = "Donor Email Logs"
+        indexes = [
+            models.Index(
+                fields=["donor", "child", "year", "month", "status"],
+                name="email_log_period_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.donor.fullname} - {self.child.full_name} - {self.month}/{self.year}"
@@ -162,7 +191,7 @@ class ChildMonthlySummary(TimeStampedModel):
     AI-generated text summary of a child's progress for a specific month.
     Used to cache OpenAI API results for inclusion in sponsor emails.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     child = models.ForeignKey(
         "programs.Child", on_delete=models.CASCADE, related_name="monthly_summaries"
     )
@@ -15,6 +15,35 @@ from utils.services import (
 logger = logging.getLogger(__name__)
 
 
+# The queries below are also planned by `manage.py explain_hot_queries`
+# (see utils/hot_queries.py). Meta orderings are stripped: DISTINCT would
+# otherwise select donation_date too and repeat the donor/child pairs.
+
+
+def sponsor_pairs():
+    """Distinct donor/child pairs of the donations made to a child."""
+    return (
+        Donation.objects.filter(child__isnull=False, donor__isnull=False)
+        .values("donor", "child")
+        .distinct()
+        .order_by()
+    )
+
+
+def sponsor_email_logs(donor, child, month, year):
+    """Successful sponsor emails of a donor/child pair for a month."""
+    return SponsorEmailLog.objects.filter(
+        donor=donor, child=child, month=month, year=year, status="SUCCESS"
+    ).order_by()
+
+
+def due_recurring_donations(today):
+    """Recurring donations whose next deduction is due."""
+    return Donation.objects.filter(
+        is_recurring=True, next_deduction_date__lte=today
+    ).order_by()
+
+
 @shared_task
 def send_monthly_donor_emails_task(month=None, year=None, force=False, refresh_ai=False):
     """Automated task to send monthly progress reports to donors."""
@@ -29,10 +58,7 @@ def send_monthly_donor_emails_task(month=None, year=None, force=False, refresh_a
     logger.info(f"Processing donor reports for {target_month}/{target_year}...")
 
     # Find donors linked to children
-    active_donor_child_pairs = Donation.objects.filter(
-        child__isnull=False,
-        donor__isnull=False
-    ).values('donor', 'child').distinct()
+    active_donor_child_pairs = sponsor_pairs()
 
     total_sent = 0
     total_errors = 0
@@ -48,12 +74,8 @@ def send_monthly_donor_emails_task(month=None, year=None, force=False, refresh_a
 
             # Check if already sent
             if not force:
-                if SponsorEmailLog.objects.filter(
-                    donor=donor,
-                    child=child_obj,
-                    month=target_month,
-                    year=target_year,
-                    status="SUCCESS"
+                if sponsor_email_logs(
+                    donor, child_obj, target_month, target_year
                 ).exists():
                     logger.info(f"Skipping {donor.fullname} for {child_obj.full_name} (Already sent)")
                     continue
@@ -130,10 +152,7 @@ def send_monthly_donor_emails_task(month=None, year=None, force=False, refresh_a
 def process_recurring_donations_task():
     """Daily task to process automatic deductions for recurring donations."""
     today = timezone.now().date()
-    due_recurring = Donation.objects.filter(
-        is_recurring=True,
-        next_deduction_date__lte=today
-    )
+    due_recurring = due_recurring_donations(today)
 
     processed_count = 0
     error_count = 0
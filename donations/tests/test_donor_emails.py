@@ -97,3 +97,18 @@ class TestDonorEmails:
         # Should send again with force
         send_monthly_donor_emails_task(force=True)
         assert len(mail.outbox) == 2
+
+    @patch("donations.tasks.get_ai_summary")
+    def test_one_email_per_pair(self, mock_get_summary, setup_data):
+        mock_get_summary.return_value = "Summary content."
+        Donation.objects.create(
+            donor=self.donor,
+            child=self.child,
+            amount=5000.00,
+            currency="RWF",
+            donation_purpose="School Fees",
+            donation_date=timezone.now() - datetime.timedelta(days=40),
+        )
+
+        send_monthly_donor_emails_task(force=True)
+        assert len(mail.outbox) == 1
@@ -5,6 +5,7 @@ from django_filters.rest_framework import DjangoFilterBackend
 from .models import Donor, Donation, SponsorEmailLog
 from .serializers import DonorSerializer, DonationSerializer, SponsorEmailLogSerializer
 from drf_spectacular.utils import extend_schema
+from utils.query_planner import AutoPrefetchMixin, DeferHeavyFieldsMixin
 
 
 @extend_schema(
@@ -26,7 +27,9 @@ class DonorViewSet(viewsets.ModelViewSet):
 @extend_schema(
     tags=["Donations"],
 )
-class DonationViewSet(viewsets.ModelViewSet):
+class DonationViewSet(
+    DeferHeavyFieldsMixin, AutoPrefetchMixin, viewsets.ModelViewSet
+):
     queryset = Donation.objects.all()
     serializer_class = DonationSerializer
     filter_backends = [
@@ -52,7 +55,9 @@ class DonationViewSet(viewsets.ModelViewSet):
 @extend_schema(
     tags=["Donations"],
 )
-class SponsorEmailLogViewSet(viewsets.ReadOnlyModelViewSet):
+class SponsorEmailLogViewSet(
+    DeferHeavyFieldsMixin, AutoPrefetchMixin, viewsets.ReadOnlyModelViewSet
+):
     queryset = SponsorEmailLog.objects.all()
     serializer_class = SponsorEmailLogSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
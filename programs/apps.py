@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class ProgramsConfig(AppConfig):
     name = 'programs'
+
+    def ready(self):
+        from utils import school_ledger
+
+        school_ledger.connect_signals()
@@ -0,0 +1,138 @@
+import datetime
+import statistics
+import time
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils.text import compress_string
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import User
+from programs.models import Child, HealthRecord
+from programs.views import (
+    ChildViewSet,
+    HealthRecordViewSet,
+    ResidentialFinanceViewSet,
+)
+from utils import compression
+from utils.fast_json import ORJSONRenderer
+
+
+class _Rollback(Exception):
+    pass
+
+
+ENDPOINTS = [
+    ("children", ChildViewSet, "list", {"page_size": 100}),
+    ("health-records", HealthRecordViewSet, "list", {"page_size": 100}),
+    ("health-statistics", HealthRecordViewSet, "statistics", {}),
+    ("cost-report", ResidentialFinanceViewSet, "cost_report", {}),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare encode time of the stdlib and orjson JSON renderers and the "
+        "raw, gzip and brotli sizes of representative endpoint payloads. "
+        "Uses generated rows that are rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--children", type=int, default=200)
+        parser.add_argument(
+            "--records", type=int, default=10, help="Health records per child."
+        )
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'endpoint':<20}{'json ms':>9}{'orjson ms':>11}{'bytes':>10}"
+            f"{'gzip':>9}{'brotli':>9}"
+        )
+        try:
+            with transaction.atomic():
+                user = self.populate(options["children"], options["records"])
+                for endpoint in ENDPOINTS:
+                    self.report(user, *endpoint, repeat=options["repeat"])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def populate(self, children, records):
+        user = User.objects.create_superuser(
+            email="json-benchmark@example.com",
+            password=None,
+            first_name="Benchmark",
+            last_name="User",
+        )
+        created = Child.objects.bulk_create(
+            [
+                Child(
+                    first_name=f"Child{index}",
+                    last_name="Benchmark",
+                    date_of_birth=datetime.date(2015, 1, 1),
+                    gender=Child.FEMALE,
+                    start_date=datetime.date(2023, 1, 1),
+                    story="A long story about the child. " * 20,
+                )
+                for index in range(children)
+            ]
+        )
+        HealthRecord.objects.bulk_create(
+            [
+                HealthRecord(
+                    child=child,
+                    record_type=HealthRecord.MEDICAL_VISIT,
+                    visit_date=datetime.date(2024, 1, 1)
+                    + datetime.timedelta(days=index * 30),
+                    diagnosis="Routine check",
+                    cost=Decimal("1500.00"),
+                )
+                for child in created
+                for index in range(records)
+            ],
+            batch_size=1000,
+        )
+        return user
+
+    def report(self, user, label, viewset, action, params, repeat):
+        data = self.fetch(user, viewset, action, params)
+        stdlib_ms = self.time(lambda: JSONRenderer().render(data), repeat)
+        orjson_ms = self.time(lambda: ORJSONRenderer().render(data), repeat)
+
+        body = ORJSONRenderer().render(data)
+        gzip_size = len(compress_string(body))
+        if compression.brotli is None:
+            brotli_size = "n/a"
+        else:
+            brotli_size = len(
+                compression.brotli.compress(
+                    body, quality=compression.BROTLI_QUALITY
+                )
+            )
+        self.stdout.write(
+            f"{label:<20}{stdlib_ms:>9.2f}{orjson_ms:>11.2f}{len(body):>10}"
+            f"{gzip_size:>9}{brotli_size:>9}"
+        )
+
+    def fetch(self, user, viewset, action, params):
+        host = next(
+            (host.lstrip(".") for host in settings.ALLOWED_HOSTS if host != "*"),
+            "localhost",
+        )
+        request = APIRequestFactory(SERVER_NAME=host).get("/", params)
+        force_authenticate(request, user=user)
+        response = viewset.as_view({"get": action})(request)
+        return response.data
+
+    @staticmethod
+    def time(func, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
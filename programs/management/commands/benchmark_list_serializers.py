@@ -0,0 +1,134 @@
+import datetime
+import statistics
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from accounts.models import User
+from programs.models import Child, HealthRecord
+from programs.serializers import HealthRecordListSerializer
+from public_modules.models.gallery_models import GalleryCategory, GalleryMedia
+from public_modules.serializers.gallery_serializers import GalleryMediaListSerializer
+from utils.query_planner import plan_queryset
+from utils.values_reader import ValuesReader
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the per-row cost of ModelSerializer and values()-based "
+        "(ValuesReader) list rendering, query included. Uses generated rows "
+        "that are rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=10)
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'serializer':<28}{'rows':>7}{'model us/row':>14}"
+            f"{'values us/row':>15}{'speedup':>9}"
+        )
+        try:
+            with transaction.atomic():
+                self.populate(options["rows"])
+                # The querysets the list views start from.
+                self.report(
+                    HealthRecordListSerializer,
+                    HealthRecord.objects.select_related("child").order_by(
+                        "-visit_date"
+                    ),
+                    options["repeat"],
+                )
+                self.report(
+                    GalleryMediaListSerializer,
+                    GalleryMedia.objects.order_by("-created_on"),
+                    options["repeat"],
+                )
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def populate(self, rows):
+        user = User.objects.create_superuser(
+            email="list-benchmark@example.com",
+            password=None,
+            first_name="Benchmark",
+            last_name="User",
+        )
+        child = Child.objects.create(
+            first_name="Benchmark",
+            last_name="Child",
+            date_of_birth=datetime.date(2015, 1, 1),
+            gender=Child.FEMALE,
+            start_date=datetime.date(2023, 1, 1),
+        )
+        HealthRecord.objects.bulk_create(
+            [
+                HealthRecord(
+                    child=child,
+                    record_type=HealthRecord.MEDICAL_VISIT,
+                    visit_date=datetime.date(2024, 1, 1)
+                    + datetime.timedelta(days=index % 365),
+                    hospital_name="District Hospital",
+                    diagnosis="Routine check",
+                    cost=Decimal("1500.00"),
+                )
+                for index in range(rows)
+            ],
+            batch_size=1000,
+        )
+        category = GalleryCategory.objects.create(name="Benchmark")
+        GalleryMedia.objects.bulk_create(
+            [
+                GalleryMedia(
+                    category=category,
+                    title=f"Photo {index}",
+                    media_url=f"media_gallery/benchmark{index}.jpg",
+                    uploaded_by=user,
+                )
+                for index in range(rows)
+            ],
+            batch_size=1000,
+        )
+
+    def report(self, serializer_class, queryset, repeat):
+        context = {"request": Request(APIRequestFactory().get("/"))}
+        serializer = serializer_class(context=context)
+        planned = plan_queryset(queryset, serializer)
+        reader = ValuesReader(serializer)
+        values = reader.queryset(queryset)
+
+        def model_path():
+            return serializer_class(planned.all(), many=True, context=context).data
+
+        def values_path():
+            return reader.rows(values.all())
+
+        if model_path() != values_path():
+            self.stderr.write(f"{serializer_class.__name__}: outputs differ")
+
+        rows = queryset.count()
+        model_us = self.time(model_path, repeat) * 1000 / rows
+        values_us = self.time(values_path, repeat) * 1000 / rows
+        self.stdout.write(
+            f"{serializer_class.__name__:<28}{rows:>7}{model_us:>14.2f}"
+            f"{values_us:>15.2f}{model_us / values_us:>8.1f}x"
+        )
+
+    @staticmethod
+    def time(func, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
@@ -0,0 +1,125 @@
+import datetime
+import statistics
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from programs.models import Child, HealthRecord
+from utils.postgres import is_postgres
+from utils.query_audit import sequential_scans
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the first list page and count of soft-deleted models while the "
+        "share of deleted rows grows. Everything is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--live", type=int, default=2000, help="Live rows per model."
+        )
+        parser.add_argument(
+            "--shares",
+            default="0,50,90,99",
+            help="Comma separated percentages of deleted rows.",
+        )
+        parser.add_argument("--page-size", type=int, default=10)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        shares = [int(share) for share in options["shares"].split(",")]
+        try:
+            with transaction.atomic():
+                self.run(options["live"], shares, options)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def run(self, live, shares, options):
+        self.child = Child.objects.create(
+            first_name="Benchmark",
+            last_name="Child",
+            date_of_birth=datetime.date(2015, 1, 1),
+            gender=Child.FEMALE,
+            start_date=datetime.date(2023, 1, 1),
+        )
+        builders = {
+            Child: self.build_child,
+            HealthRecord: self.build_health_record,
+        }
+        for model, build in builders.items():
+            model.all_objects.bulk_create(
+                [build(index, deleted=False) for index in range(live)],
+                batch_size=1000,
+            )
+
+        self.stdout.write(
+            f"{'model':<14}{'deleted':>9}{'rows':>9}{'page ms':>10}{'count ms':>10}  plan"
+        )
+        for share in shares:
+            for model, build in builders.items():
+                self.grow_deleted(model, build, live, share)
+                self.report(model, share, options)
+
+    def grow_deleted(self, model, build, live, share):
+        target = int(live * share / (100 - share)) if share < 100 else live * 100
+        missing = target - model.all_objects.filter(is_deleted=True).count()
+        if missing > 0:
+            model.all_objects.bulk_create(
+                [build(index, deleted=True) for index in range(missing)],
+                batch_size=1000,
+            )
+        if is_postgres():
+            with connection.cursor() as cursor:
+                cursor.execute(f'ANALYZE "{model._meta.db_table}"')
+
+    def report(self, model, share, options):
+        ordering = model._meta.ordering or ["-created_on"]
+        page = model.objects.order_by(*ordering)[: options["page_size"]]
+        page_ms = self.time(lambda: list(page), options["repeat"])
+        count_ms = self.time(model.objects.count, options["repeat"])
+        scans = sequential_scans(page)
+        plan = f"seq scan on {', '.join(scans)}" if scans else "indexed"
+        self.stdout.write(
+            f"{model.__name__:<14}{share:>8}%{model.all_objects.count():>9}"
+            f"{page_ms:>10.2f}{count_ms:>10.2f}  {plan}"
+        )
+
+    @staticmethod
+    def time(func, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    def build_child(self, index, deleted):
+        return Child(
+            first_name=f"Child{index}",
+            last_name="Benchmark",
+            date_of_birth=datetime.date(2015, 1, 1),
+            gender=Child.FEMALE,
+            start_date=datetime.date(2023, 1, 1),
+            is_deleted=deleted,
+            deleted_on=timezone.now() if deleted else None,
+        )
+
+    def build_health_record(self, index, deleted):
+        return HealthRecord(
+            child=self.child,
+            record_type=HealthRecord.ILLNESS,
+            visit_date=datetime.date(2024, 1, 1) + datetime.timedelta(days=index % 365),
+            diagnosis="Benchmark",
+            cost=Decimal("1000.00"),
+            is_deleted=deleted,
+            deleted_on=timezone.now() if deleted else None,
+        )
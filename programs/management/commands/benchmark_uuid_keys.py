@@ -0,0 +1,93 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connection, transaction
+
+from utils.general_codes import uuid7
+from utils.postgres import is_postgres
+
+
+class _Rollback(Exception):
+    pass
+
+
+GENERATORS = {
+    "uuid4": uuid.uuid4,
+    "uuid7": uuid7,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare bulk insert throughput and primary key index size of random "
+        "(v4) and time-ordered (v7) UUID keys. Uses scratch tables that are "
+        "rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'keys':<8}{'rows':>10}{'seconds':>10}{'rows/s':>12}{'index size':>14}"
+        )
+        try:
+            with transaction.atomic():
+                for label, generate in GENERATORS.items():
+                    self.run(label, generate, options["rows"], options["batch_size"])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def run(self, label, generate, rows, batch_size):
+        table = f"uuid_benchmark_{label}"
+        column = "uuid" if is_postgres() else "char(32)"
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE {table} (id {column} PRIMARY KEY, payload integer)"
+            )
+            start = time.perf_counter()
+            for offset in range(0, rows, batch_size):
+                cursor.executemany(
+                    f"INSERT INTO {table} (id, payload) VALUES (%s, %s)",
+                    [
+                        (self.adapt(generate()), number)
+                        for number in range(offset, min(offset + batch_size, rows))
+                    ],
+                )
+            elapsed = time.perf_counter() - start
+            size = self.index_size(cursor, table)
+
+        self.stdout.write(
+            f"{label:<8}{rows:>10}{elapsed:>10.2f}{rows / elapsed:>12.0f}"
+            f"{self.format_size(size):>14}"
+        )
+
+    def adapt(self, value):
+        return value if is_postgres() else value.hex
+
+    def index_size(self, cursor, table):
+        """
+        Bytes used by the primary key index, or None when the database
+        cannot tell (SQLite without the dbstat table).
+        """
+        if is_postgres():
+            cursor.execute("SELECT pg_indexes_size(%s::regclass)", [table])
+            return cursor.fetchone()[0]
+        try:
+            with transaction.atomic():
+                cursor.execute(
+                    "SELECT SUM(pgsize) FROM dbstat WHERE name LIKE %s",
+                    [f"sqlite_autoindex_{table}%"],
+                )
+                return cursor.fetchone()[0]
+        except DatabaseError:
+            return None
+
+    @staticmethod
+    def format_size(size):
+        if size is None:
+            return "n/a"
+        return f"{size / 1024:.0f} kB"
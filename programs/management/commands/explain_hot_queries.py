@@ -0,0 +1,84 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from accounts.models import User
+from programs.seed import seed_dataset
+from utils.hot_queries import hot_queries
+from utils.query_audit import explain, sequential_scans
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Print the plan and timing of the hot-path queries and flag the ones "
+        "reading a table with a sequential scan."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Seed a dataset of this size first (rolled back afterwards).",
+        )
+        parser.add_argument(
+            "--plans",
+            action="store_true",
+            help="Print the full plan of every query.",
+        )
+        parser.add_argument(
+            "--strict",
+            action="store_true",
+            help="Exit with an error when a sequential scan is found.",
+        )
+
+    def handle(self, *args, **options):
+        flagged = []
+        try:
+            with transaction.atomic():
+                if options["seed"]:
+                    self.seed(options["seed"])
+                flagged = self.report(options["plans"])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        if flagged and options["strict"]:
+            raise CommandError(f"Sequential scans in: {', '.join(flagged)}")
+
+    def seed(self, size):
+        user = User.objects.create_user(
+            email="explain.seed@example.com",
+            password=None,
+            first_name="Explain",
+            last_name="Seed",
+        )
+        seed_dataset(size, user, tag="explain")
+
+    def report(self, show_plans):
+        flagged = []
+        for label, queryset in hot_queries():
+            start = time.perf_counter()
+            list(queryset)
+            elapsed = (time.perf_counter() - start) * 1000
+
+            scans = sequential_scans(queryset)
+            if scans:
+                flagged.append(label)
+                status = self.style.ERROR(f"SEQ SCAN on {', '.join(scans)}")
+            else:
+                status = self.style.SUCCESS("indexed")
+            self.stdout.write(f"{label:<45} {elapsed:8.2f} ms  {status}")
+
+            if show_plans:
+                plan = explain(queryset)
+                if not isinstance(plan, str):
+                    plan = json.dumps(plan, indent=2)
+                self.stdout.write(plan)
+        return flagged
@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from programs.models import ChildProgress, HealthRecord
+from utils.postgres import is_postgres
+
+
+SEARCHABLE_MODELS = {
+    "health_records": HealthRecord,
+    "child_progress": ChildProgress,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the stored full-text search vectors, e.g. after a bulk "
+        "import or an update() that bypassed save()."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models",
+            nargs="*",
+            choices=sorted(SEARCHABLE_MODELS),
+            help="Models to rebuild (default: all).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows updated per statement.",
+        )
+
+    def handle(self, *args, **options):
+        if not is_postgres():
+            raise CommandError("Search vectors are only stored on PostgreSQL.")
+
+        for name in options["models"] or sorted(SEARCHABLE_MODELS):
+            model = SEARCHABLE_MODELS[name]
+            total = self.rebuild(model, options["batch_size"])
+            self.stdout.write(self.style.SUCCESS(f"{name}: {total} rows updated"))
+
+    def rebuild(self, model, batch_size):
+        total = 0
+        last_pk = None
+        while True:
+            queryset = model._base_manager.order_by("pk")
+            if last_pk is not None:
+                queryset = queryset.filter(pk__gt=last_pk)
+            pks = list(queryset.values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                return total
+            batch = model._base_manager.filter(pk__in=pks)
+            total += model.rebuild_search_vectors(batch)
+            last_pk = pks[-1]
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from utils.counter_cache import all_counters, recount
+
+
+def counter_name(counter):
+    return f"{counter.parent._meta.label_lower}.{counter.column}"
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount the denormalized counter columns from the child tables, "
+        "e.g. after a bulk_create() or an update() that bypassed save()."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "counters",
+            nargs="*",
+            choices=sorted(counter_name(counter) for counter in all_counters()),
+            help="Counters to repair, as app_label.model.column (default: all).",
+        )
+
+    def handle(self, *args, **options):
+        selected = set(options["counters"])
+        for counter in sorted(all_counters(), key=counter_name):
+            name = counter_name(counter)
+            if selected and name not in selected:
+                continue
+            with transaction.atomic():
+                fixed = recount(counter)
+            self.stdout.write(self.style.SUCCESS(f"{name}: {fixed} rows fixed"))
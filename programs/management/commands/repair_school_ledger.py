@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from utils.school_ledger import rebuild
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the paid totals and payment statuses of school supports "
+        "from their payments, e.g. after a bulk_create() of payments."
+    )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            fixed = rebuild()
+        self.stdout.write(self.style.SUCCESS(f"school ledger: {fixed} rows fixed"))
@@ -1,13 +1,17 @@
-import uuid
+from decimal import Decimal
 
-from django.db import models
+from django.db import models, router, transaction
+from django.db.models.lookups import GreaterThan, GreaterThanOrEqual
 
 from accounts.models import User
-from accounts.models import TimeStampedModel, SoftDeleteModel
+from accounts.models import TimeStampedModel, SoftDeleteModel, TimeOrderedUUIDField
+from utils.counter_cache import CountedModel, CounterCacheModel
+from utils.model_versions import bump_version
+from utils.postgres import postgres_only, trigram_index
 
 
-class Family(TimeStampedModel, SoftDeleteModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+class Family(TimeStampedModel, SoftDeleteModel, CounterCacheModel):
+    id = TimeOrderedUUIDField()
     family_name = models.CharField(max_length=100)
     address = models.TextField()
     province = models.CharField(max_length=100)
@@ -53,6 +57,13 @@ class Family(TimeStampedModel, SoftDeleteModel):
         upload_to="ifashe/families/residence/", blank=True
     )
 
+    parents_count = models.PositiveIntegerField(default=0, editable=False)
+    children_count = models.PositiveIntegerField(default=0, editable=False)
+
+    counter_caches = {"parents_count": "parents", "children_count": "children"}
+    heavy_fields = ["social_worker_assessment"]
+    live_indexes = [["-created_on"], ["family_name", "created_on"]]
+
     class Meta:
         db_table = "families"
         ordering = ["family_name", "created_on"]
@@ -63,7 +74,7 @@ class Family(TimeStampedModel, SoftDeleteModel):
         return self.family_name
 
 
-class Parent(TimeStampedModel, SoftDeleteModel):
+class Parent(TimeStampedModel, SoftDeleteModel, CountedModel):
     FATHER = "FATHER"
     MOTHER = "MOTHER"
     GUARDIAN = "GUARDIAN"
@@ -96,7 +107,7 @@ class Parent(TimeStampedModel, SoftDeleteModel):
         (DIVORCED, "Divorced"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     family = models.ForeignKey(Family, on_delete=models.CASCADE, related_name="parents")
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
@@ -123,11 +134,19 @@ class Parent(TimeStampedModel, SoftDeleteModel):
         upload_to="ifashe/parents/ids/", blank=True, null=True
     )
 
+    live_indexes = [["-created_on"], ["first_name", "last_name"], ["family"]]
+
     class Meta:
         db_table = "parents"
         ordering = ["first_name", "last_name"]
         verbose_name = "Parent"
         verbose_name_plural = "Parents"
+        indexes = postgres_only(
+            trigram_index("first_name", "parents_first_name_trgm"),
+            trigram_index("last_name", "parents_last_name_trgm"),
+            trigram_index("phone", "parents_phone_trgm"),
+            trigram_index("national_id", "parents_national_id_trgm"),
+        )
 
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
@@ -137,7 +156,7 @@ class Parent(TimeStampedModel, SoftDeleteModel):
         return f"{self.first_name} {self.last_name}"
 
 
-class SponsoredChild(TimeStampedModel, SoftDeleteModel):
+class SponsoredChild(TimeStampedModel, SoftDeleteModel, CountedModel):
     MALE = "MALE"
     FEMALE = "FEMALE"
     GENDER_CHOICES = [
@@ -145,7 +164,7 @@ class SponsoredChild(TimeStampedModel, SoftDeleteModel):
         (FEMALE, "Female"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     family = models.ForeignKey(
         Family, on_delete=models.CASCADE, related_name="children"
     )
@@ -183,11 +202,22 @@ class SponsoredChild(TimeStampedModel, SoftDeleteModel):
         upload_to="ifashe/children/school_reports/", blank=True
     )
 
+    live_indexes = [
+        ["-created_on"],
+        ["first_name", "last_name"],
+        ["family"],
+        ["support_status"],
+    ]
+
     class Meta:
         db_table = "sponsored_children"
         ordering = ["first_name", "last_name"]
         verbose_name = "Sponsored Child"
         verbose_name_plural = "Sponsored Children"
+        indexes = postgres_only(
+            trigram_index("first_name", "sponsored_first_name_trgm"),
+            trigram_index("last_name", "sponsored_last_name_trgm"),
+        )
 
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
@@ -216,7 +246,7 @@ class Sponsorship(TimeStampedModel):
         (PARTIAL, "Partial sponsorship"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     child = models.ForeignKey(
         SponsoredChild, on_delete=models.CASCADE, related_name="sponsorships"
     )
@@ -240,7 +270,7 @@ class Sponsorship(TimeStampedModel):
 
 
 class School(TimeStampedModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     name = models.CharField(max_length=200)
     address = models.TextField(blank=True)
     phone = models.CharField(max_length=20, blank=True)
@@ -256,6 +286,24 @@ class School(TimeStampedModel):
         return self.name
 
 
+class SchoolSupportQuerySet(models.QuerySet):
+    def post_payment(self, amount=0):
+        """
+        Add `amount` to the paid total of the supports and derive their
+        payment status from the new total, in one UPDATE: concurrent
+        payments each add their own amount instead of overwriting a total
+        read earlier. A negative amount takes a payment back; zero only
+        re-derives the status, e.g. after the costs changed.
+        """
+        paid = models.F("total_paid") + Decimal(amount)
+        count = self.update(
+            total_paid=paid, payment_status=self.model.payment_status_for(paid)
+        )
+        if count:
+            bump_version(self.model)
+        return count
+
+
 class SchoolSupport(TimeStampedModel):
     PAID = "PAID"
     PENDING = "PENDING"
@@ -269,7 +317,7 @@ class SchoolSupport(TimeStampedModel):
         (OVERDUE, "Overdue"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     child = models.ForeignKey(
         SponsoredChild, on_delete=models.CASCADE, related_name="school_support"
     )
@@ -283,22 +331,98 @@ class SchoolSupport(TimeStampedModel):
         max_length=20, choices=PAYMENT_STATUS_CHOICES, blank=True, default=PENDING
     )
     notes = models.TextField(blank=True)
+    total_cost = models.GeneratedField(
+        expression=models.F("school_fees") + models.F("materials_cost"),
+        output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        db_persist=True,
+    )
+    # Sum of the payments, kept by SchoolPayment.save() and deletes (see
+    # utils.school_ledger).
+    total_paid = models.DecimalField(
+        max_digits=12, decimal_places=2, default=0, editable=False
+    )
+    balance_due = models.GeneratedField(
+        expression=models.F("school_fees")
+        + models.F("materials_cost")
+        - models.F("total_paid"),
+        output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        db_persist=True,
+    )
+
+    objects = SchoolSupportQuerySet.as_manager()
 
     class Meta:
         db_table = "school_support"
         verbose_name = "School Support"
         verbose_name_plural = "School Support Records"
+        constraints = [
+            # One support per child and year; lets the yearly generation
+            # skip existing rows with ignore_conflicts.
+            models.UniqueConstraint(
+                fields=["child", "academic_year"],
+                name="school_support_child_year_uniq",
+            ),
+        ]
+        indexes = [
+            # Most expensive supports of a year first.
+            models.Index(
+                fields=["academic_year", "-total_cost"],
+                name="school_support_year_total_idx",
+            ),
+            # Largest outstanding balances of a year first.
+            models.Index(
+                fields=["academic_year", "-balance_due"],
+                name="school_support_year_balance_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.child} - {self.academic_year}"
 
-    @property
-    def total_cost(self) -> str:
-        return self.school_fees + self.materials_cost
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            return super().save(*args, **kwargs)
+
+        # total_paid only moves through post_payment(): an instance loaded
+        # before a payment must not write its stale total back.
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            update_fields = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and not field.generated
+            ]
+        kwargs["update_fields"] = [
+            name for name in update_fields if name != "total_paid"
+        ]
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+            # The costs or the status may have changed: derive the status
+            # from the stored total.
+            type(self).objects.using(using).filter(pk=self.pk).post_payment()
+        self.refresh_from_db(using=using, fields=["total_paid", "payment_status"])
+
+    @classmethod
+    def payment_status_for(cls, paid):
+        """
+        The payment status of a support whose paid total is the expression
+        `paid`. An overdue support stays overdue until it is paid off.
+        """
+        return models.Case(
+            models.When(
+                models.Q(GreaterThan(paid, 0))
+                & models.Q(GreaterThanOrEqual(paid, models.F("total_cost"))),
+                then=models.Value(cls.PAID),
+            ),
+            models.When(payment_status=cls.OVERDUE, then=models.Value(cls.OVERDUE)),
+            models.When(GreaterThan(paid, 0), then=models.Value(cls.PARTIAL)),
+            default=models.Value(cls.PENDING),
+        )
 
 
 class SchoolPayment(TimeStampedModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     school_support = models.ForeignKey(
         SchoolSupport, on_delete=models.CASCADE, related_name="payments"
     )
@@ -310,13 +434,49 @@ class SchoolPayment(TimeStampedModel):
         ordering = ["-date"]
         verbose_name = "School Payment"
         verbose_name_plural = "School Payments"
+        indexes = [
+            # Covers SUM(amount) per support without touching the table.
+            models.Index(
+                fields=["school_support", "amount"], name="school_payment_support_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.school_support} - {self.amount}"
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and not {
+            "amount",
+            "school_support",
+            "school_support_id",
+        } & set(update_fields):
+            return super().save(*args, **kwargs)
+
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            before = None
+            if not self._state.adding:
+                # Locked so that concurrent edits of the payment post in turn.
+                before = (
+                    type(self)
+                    ._base_manager.using(using)
+                    .select_for_update()
+                    .filter(pk=self.pk)
+                    .values("school_support_id", "amount")
+                    .first()
+                )
+            super().save(*args, **kwargs)
+            supports = SchoolSupport.objects.using(using)
+            if before:
+                supports.filter(pk=before["school_support_id"]).post_payment(
+                    -before["amount"]
+                )
+            supports.filter(pk=self.school_support_id).post_payment(self.amount)
+
 
 class DressingDistribution(TimeStampedModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     child = models.ForeignKey(
         SponsoredChild, on_delete=models.CASCADE, related_name="dressing_distributions"
     )
@@ -348,7 +508,7 @@ class ParentWorkContract(TimeStampedModel):
         (TERMINATED, "Terminated"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     description = models.TextField(blank=True, null=True)
     parent = models.ForeignKey(
         Parent, on_delete=models.CASCADE, related_name="work_contracts"
@@ -381,7 +541,7 @@ class ParentAttendance(TimeStampedModel):
         (SICK_LEAVE, "Sick Leave"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     work_record = models.ForeignKey(
         ParentWorkContract, on_delete=models.CASCADE, related_name="attendances"
     )
@@ -394,13 +554,18 @@ class ParentAttendance(TimeStampedModel):
         ordering = ["attendance_date"]
         verbose_name = "Parent Attendance"
         verbose_name_plural = "Parent Attendance Records"
+        indexes = [
+            models.Index(
+                fields=["work_record", "status"], name="parent_attendance_status_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.work_record.parent} - {self.attendance_date}"
 
 
 class ParentPerformance(TimeStampedModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     work_record = models.ForeignKey(
         ParentWorkContract, on_delete=models.CASCADE, related_name="performances"
     )
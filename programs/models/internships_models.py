@@ -1,9 +1,8 @@
-import uuid
-
 from django.db import models
 
 from accounts.models import User
-from accounts.models import TimeStampedModel, SoftDeleteModel
+from accounts.models import TimeStampedModel, SoftDeleteModel, TimeOrderedUUIDField
+from utils.postgres import postgres_only, trigram_index
 
 
 class InternshipApplication(TimeStampedModel):
@@ -21,7 +20,7 @@ class InternshipApplication(TimeStampedModel):
         (REJECTED, "Rejected"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
     email = models.EmailField(max_length=254)
@@ -52,11 +51,19 @@ class InternshipApplication(TimeStampedModel):
         related_name="reviewed_applications",
     )
 
+    heavy_fields = ["admin_notes"]
+
     class Meta:
         db_table = "internship_applications"
         ordering = ["applied_on"]
         verbose_name = "Internship Application"
         verbose_name_plural = "Internship Applications"
+        indexes = postgres_only(
+            trigram_index("first_name", "internship_first_name_trgm"),
+            trigram_index("last_name", "internship_last_name_trgm"),
+            trigram_index("email", "internship_email_trgm"),
+            trigram_index("phone", "internship_phone_trgm"),
+        )
 
     def __str__(self):
         return f"{self.first_name} {self.last_name} - {self.status}"
@@ -67,7 +74,7 @@ class InternshipApplication(TimeStampedModel):
 
 
 class Department(TimeStampedModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     name = models.CharField(max_length=100)
     description = models.TextField(blank=True)
 
@@ -82,7 +89,7 @@ class Department(TimeStampedModel):
 
 
 class Supervisor(TimeStampedModel, SoftDeleteModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
     email = models.EmailField(max_length=255)
@@ -117,7 +124,7 @@ class InternshipProgram(TimeStampedModel):
         (TERMINATED, "Terminated"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     application = models.OneToOneField(
         InternshipApplication,
         on_delete=models.CASCADE,
@@ -157,7 +164,7 @@ class InternshipFeedback(models.Model):
         (FINAL, "Final"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     internship = models.ForeignKey(
         InternshipProgram, on_delete=models.CASCADE, related_name="feedbacks"
     )
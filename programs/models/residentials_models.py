@@ -1,12 +1,16 @@
-import uuid
 from decimal import Decimal
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from dateutil.relativedelta import relativedelta
 
-from accounts.models import TimeStampedModel, SoftDeleteModel
+from accounts.models import TimeStampedModel, SoftDeleteModel, TimeOrderedUUIDField
+from utils.counter_cache import CountedModel, CounterCacheModel
+from utils.full_text import SearchVectorModel
+from utils.postgres import postgres_only, trigram_index
 
 
 class Child(TimeStampedModel, SoftDeleteModel):
@@ -27,7 +31,7 @@ class Child(TimeStampedModel, SoftDeleteModel):
         (LEFT, "Left"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
     date_of_birth = models.DateField()
@@ -40,10 +44,17 @@ class Child(TimeStampedModel, SoftDeleteModel):
     vigilant_contact_phone = models.CharField(max_length=20, blank=True)
     story = models.TextField(null=True, blank=True)
 
+    heavy_fields = ["story"]
+    live_indexes = [["-created_on"], ["status", "-created_on"]]
+
     class Meta:
         db_table = "children"
         verbose_name = "Child"
         verbose_name_plural = "Children"
+        indexes = postgres_only(
+            trigram_index("first_name", "children_first_name_trgm"),
+            trigram_index("last_name", "children_last_name_trgm"),
+        )
 
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
@@ -73,21 +84,28 @@ class Child(TimeStampedModel, SoftDeleteModel):
         return None
 
 
-class ChildProgress(TimeStampedModel, SoftDeleteModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+class ChildProgress(TimeStampedModel, SoftDeleteModel, SearchVectorModel):
+    id = TimeOrderedUUIDField()
     notes = models.TextField()
     child = models.ForeignKey(
         Child, on_delete=models.CASCADE, related_name="child_progress"
     )
 
+    search_vector_fields = [("notes", "A")]
+    heavy_fields = ["notes", "search_vector"]
+    live_indexes = [["child", "created_on"], ["-created_on"]]
+
     class Meta:
         ordering = ["created_on"]
         verbose_name = "Progress of the Child"
         verbose_name_plural = "Progresses of the Child"
+        indexes = postgres_only(
+            GinIndex(fields=["search_vector"], name="child_progress_search_gin"),
+        )
 
 
 class ProgressMedia(TimeStampedModel, SoftDeleteModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     progress_image = models.ImageField(
         upload_to="child_progress_images/", null=True, blank=True
     )
@@ -111,7 +129,7 @@ class Caretaker(TimeStampedModel, SoftDeleteModel):
         (FEMALE, "Female"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
     date_of_birth = models.DateField(null=True, blank=True)
@@ -123,11 +141,19 @@ class Caretaker(TimeStampedModel, SoftDeleteModel):
     hire_date = models.DateField()
     is_active = models.BooleanField(default=True)
 
+    live_indexes = [["-created_on"], ["first_name", "last_name"]]
+
     class Meta:
         db_table = "caretakers"
         ordering = ["first_name", "last_name"]
         verbose_name = "Caretaker"
         verbose_name_plural = "Caretakers"
+        indexes = postgres_only(
+            trigram_index("first_name", "caretakers_first_name_trgm"),
+            trigram_index("last_name", "caretakers_last_name_trgm"),
+            trigram_index("phone", "caretakers_phone_trgm"),
+            trigram_index("email", "caretakers_email_trgm"),
+        )
 
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
@@ -138,14 +164,14 @@ class Caretaker(TimeStampedModel, SoftDeleteModel):
 
 
 class House(TimeStampedModel, SoftDeleteModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     caretaker = models.ForeignKey(
         Caretaker, on_delete=models.CASCADE, related_name="house_caretaker"
     )
 
 
 class ChildCaretakerAssignment(TimeStampedModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     child = models.ForeignKey(
         Child, on_delete=models.CASCADE, related_name="caretaker_assignments"
     )
@@ -179,7 +205,7 @@ class EducationInstitution(TimeStampedModel):
         (OTHER, "Other"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     name = models.CharField(max_length=200)
     type = models.CharField(max_length=50, choices=TYPE_CHOICES)
     address = models.TextField(blank=True)
@@ -195,8 +221,8 @@ class EducationInstitution(TimeStampedModel):
         return self.name
 
 
-class EducationProgram(TimeStampedModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+class EducationProgram(TimeStampedModel, CounterCacheModel):
+    id = TimeOrderedUUIDField()
     institution = models.ForeignKey(
         EducationInstitution, on_delete=models.CASCADE, related_name="programs"
     )
@@ -207,6 +233,10 @@ class EducationProgram(TimeStampedModel):
     cost = models.DecimalField(
         max_digits=10, decimal_places=2, default=0, help_text="Free for Saint Kizito"
     )
+    enrolled_count = models.PositiveIntegerField(default=0, editable=False)
+
+    # Only the enrollments still in progress (ChildEducation.ACTIVE).
+    counter_caches = {"enrolled_count": ("enrolled_children", {"status": "ACTIVE"})}
 
     class Meta:
         db_table = "education_programs"
@@ -217,7 +247,7 @@ class EducationProgram(TimeStampedModel):
         return f"{self.program_name} - {self.institution.name}"
 
 
-class ChildEducation(TimeStampedModel):
+class ChildEducation(TimeStampedModel, CountedModel):
     ACTIVE = "ACTIVE"
     COMPLETED = "COMPLETED"
     DISCONTINUED = "DISCONTINUED"
@@ -228,7 +258,7 @@ class ChildEducation(TimeStampedModel):
         (DISCONTINUED, "Discontinued"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     child = models.ForeignKey(
         Child, on_delete=models.CASCADE, related_name="education_records"
     )
@@ -261,7 +291,7 @@ class ChildInsurance(TimeStampedModel):
         ("Overdue", "Overdue"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     child = models.ForeignKey(
         Child, on_delete=models.CASCADE, related_name="insurance_records"
     )
@@ -285,7 +315,7 @@ class ChildInsurance(TimeStampedModel):
 
 
 class FoodSupplier(TimeStampedModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     name = models.CharField(max_length=200)
     contact_person = models.CharField(max_length=100, blank=True)
     phone = models.CharField(max_length=20, blank=True)
@@ -302,7 +332,7 @@ class FoodSupplier(TimeStampedModel):
 
 
 class FoodItem(TimeStampedModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     supplier = models.ForeignKey(
         FoodSupplier, on_delete=models.CASCADE, related_name="food_items"
     )
@@ -314,21 +344,30 @@ class FoodItem(TimeStampedModel):
     unit_cost = models.DecimalField(
         max_digits=10, decimal_places=2, null=True, blank=True
     )
+    total_cost = models.GeneratedField(
+        expression=Coalesce(
+            models.F("quantity") * models.F("unit_cost"),
+            models.Value(Decimal("0.00")),
+            output_field=models.DecimalField(max_digits=20, decimal_places=2),
+        ),
+        output_field=models.DecimalField(max_digits=20, decimal_places=2),
+        db_persist=True,
+    )
 
     class Meta:
         db_table = "food_items"
         verbose_name = "Food Item"
         verbose_name_plural = "Food Items"
+        indexes = [
+            models.Index(
+                fields=["purchase_date", "-total_cost"],
+                name="food_items_date_total_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.item_description[:50]} - {self.supplier.name}"
 
-    @property
-    def total_cost(self) -> str:
-        if self.quantity and self.unit_cost:
-            return self.quantity * self.unit_cost
-        return 0
-
 
 # class HealthRecord(TimeStampedModel):
 #     MEDICAL_VISIT = "MEDICAL_VISIT"
@@ -362,7 +401,7 @@ class FoodItem(TimeStampedModel):
 
 
 class ResidentialFinancialPlan(TimeStampedModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     child = models.ForeignKey(
         Child, on_delete=models.CASCADE, related_name="financial_plans"
     )
@@ -373,26 +412,31 @@ class ResidentialFinancialPlan(TimeStampedModel):
     insurance_cost = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     other_costs = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     notes = models.TextField(blank=True)
+    total_cost = models.GeneratedField(
+        expression=models.F("education_cost")
+        + models.F("food_cost")
+        + models.F("insurance_cost")
+        + models.F("other_costs"),
+        output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        db_persist=True,
+    )
 
     class Meta:
         db_table = "residential_financial_plans"
         verbose_name = "Residential Financial Plan"
         verbose_name_plural = "Residential Financial Plans"
+        indexes = [
+            models.Index(
+                fields=["month", "-total_cost"],
+                name="financial_plan_month_total_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.child} - {self.month}/{self.year}"
 
-    @property
-    def total_cost(self) -> str:
-        return (
-            self.education_cost
-            + self.food_cost
-            + self.insurance_cost
-            + self.other_costs
-        )
-
 
-class HealthRecord(TimeStampedModel, SoftDeleteModel):
+class HealthRecord(TimeStampedModel, SoftDeleteModel, SearchVectorModel):
     MEDICAL_VISIT = "MEDICAL_VISIT"
     VACCINATION = "VACCINATION"
     ILLNESS = "ILLNESS"
@@ -403,7 +447,7 @@ class HealthRecord(TimeStampedModel, SoftDeleteModel):
         (ILLNESS, "Illness"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = TimeOrderedUUIDField()
     child = models.ForeignKey(
         Child, on_delete=models.CASCADE, related_name="health_records"
     )
@@ -421,15 +465,26 @@ class HealthRecord(TimeStampedModel, SoftDeleteModel):
         help_text="Cost in RWF (Rwandan Francs)",
     )
 
+    search_vector_fields = [
+        ("diagnosis", "A"),
+        ("treatment", "B"),
+        ("description", "C"),
+        ("hospital_name", "D"),
+    ]
+    heavy_fields = ["diagnosis", "treatment", "description", "search_vector"]
+    live_indexes = [["-visit_date", "-created_on"], ["child", "visit_date"]]
+
     class Meta:
         db_table = "health_records"
         ordering = ["-visit_date", "-created_on"]
         verbose_name = "Health Record"
         verbose_name_plural = "Health Records"
         indexes = [
-            models.Index(fields=["child", "visit_date"]),
             models.Index(fields=["record_type"]),
             models.Index(fields=["cost"]),
+            *postgres_only(
+                GinIndex(fields=["search_vector"], name="health_record_search_gin"),
+            ),
         ]
 
     def __str__(self):
@@ -0,0 +1,191 @@
+"""
+Dataset builder shared by the query-count tests and `explain_hot_queries`.
+
+`seed_dataset(size, user)` creates `size` rows of every top-level object and
+`size` related rows under each of them, so that any per-row query shows up
+as a growing query count between two sizes.
+"""
+
+import datetime
+from decimal import Decimal
+
+from accounts.models import ActivityLog, ActivityLogArchive, User
+from donations.models import Donor, Donation, SponsorEmailLog
+from programs.models import (
+    Child,
+    ChildProgress,
+    ProgressMedia,
+    Caretaker,
+    House,
+    ChildCaretakerAssignment,
+    EducationInstitution,
+    EducationProgram,
+    ChildEducation,
+    HealthRecord,
+    Family,
+    Parent,
+    SponsoredChild,
+    Sponsorship,
+    School,
+    SchoolSupport,
+    DressingDistribution,
+    ParentWorkContract,
+    ParentAttendance,
+    ParentPerformance,
+    InternshipApplication,
+)
+from programs.models.ifashe_models import SchoolPayment
+from public_modules.models.gallery_models import GalleryCategory, GalleryMedia
+
+
+TODAY = datetime.date(2025, 1, 15)
+
+
+def seed_dataset(size, user, tag="seed"):
+    for index in range(size):
+        name = f"{tag}{index}"
+        _seed_residentials(size, name, user)
+        _seed_ifashe(size, name, user)
+        _seed_public(size, name, user)
+
+        InternshipApplication.objects.create(
+            first_name=name,
+            last_name="Applicant",
+            email=f"{name}@example.com",
+            phone="0788000000",
+            date_of_birth=datetime.date(2000, 1, 1),
+            nationality="Rwandan",
+            school_university="University of Rwanda",
+            field_of_study="IT",
+            reviewed_by=user,
+        )
+        User.objects.create_user(
+            email=f"{name}.manager@example.com",
+            password="password123",
+            first_name=name,
+            last_name="Manager",
+            phone="0788000000",
+            role=User.RESIDENTIAL_MANAGER,
+        )
+        ActivityLog.objects.create(
+            user=user, action="CREATE", resource="Child", details={"name": name}
+        )
+        ActivityLogArchive.objects.create(
+            month=TODAY.replace(day=1),
+            entry_count=0,
+            first_timestamp=datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc),
+            last_timestamp=datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc),
+            data=b"",
+        )
+
+
+def _seed_residentials(size, name, user):
+    institution = EducationInstitution.objects.create(
+        name=f"{name} School", type=EducationInstitution.SCHOOL
+    )
+    caretaker = Caretaker.objects.create(
+        first_name=name, last_name="Caretaker", phone="0788000000", hire_date=TODAY
+    )
+    house = House.objects.create(caretaker=caretaker)
+    child = Child.objects.create(
+        first_name=name,
+        last_name="Child",
+        date_of_birth=datetime.date(2015, 1, 1),
+        gender=Child.FEMALE,
+        start_date=datetime.date(2023, 1, 1),
+    )
+    ChildCaretakerAssignment.objects.create(
+        child=child, house=house, assigned_date=TODAY
+    )
+    donor = Donor.objects.create(fullname=f"{name} Donor", email=f"{name}@donor.org")
+
+    for index in range(size):
+        program = EducationProgram.objects.create(
+            institution=institution, program_name=f"{name} Program {index}"
+        )
+        ChildEducation.objects.create(
+            child=child,
+            program=program,
+            start_date=TODAY,
+            status=ChildEducation.ACTIVE,
+        )
+        progress = ChildProgress.objects.create(child=child, notes=f"Notes {index}")
+        ProgressMedia.objects.create(progress=progress)
+        HealthRecord.objects.create(
+            child=child,
+            record_type=HealthRecord.ILLNESS,
+            visit_date=TODAY,
+            diagnosis="Malaria",
+            cost=Decimal("1000.00"),
+        )
+        Donation.objects.create(
+            donor=donor,
+            donation_type=Donation.RESIDENTIAL_CHILD,
+            child=child,
+            amount=Decimal("5000.00"),
+        )
+        SponsorEmailLog.objects.create(
+            donor=donor, child=child, month=index + 1, year=TODAY.year
+        )
+
+
+def _seed_ifashe(size, name, user):
+    family = Family.objects.create(
+        family_name=f"{name} Family",
+        address="Kigali",
+        province="Kigali",
+        district="Gasabo",
+        sector="Remera",
+        cell="Rukiri",
+        village="Amahoro",
+    )
+    school = School.objects.create(name=f"{name} Primary")
+
+    for index in range(size):
+        parent = Parent.objects.create(
+            family=family,
+            first_name=f"{name}{index}",
+            last_name="Parent",
+            phone="0788000000",
+        )
+        contract = ParentWorkContract.objects.create(
+            parent=parent, job_role="Cleaner", contract_start_date=TODAY
+        )
+        ParentAttendance.objects.create(
+            work_record=contract,
+            attendance_date=TODAY,
+            status=ParentAttendance.PRESENT,
+        )
+        ParentPerformance.objects.create(
+            work_record=contract, evaluation_date=TODAY, rating=7, evaluated_by=user
+        )
+
+        child = SponsoredChild.objects.create(
+            family=family,
+            first_name=f"{name}{index}",
+            last_name="Sponsored",
+            date_of_birth=datetime.date(2014, 1, 1),
+            gender=SponsoredChild.MALE,
+        )
+        Sponsorship.objects.create(child=child, start_date=TODAY)
+        DressingDistribution.objects.create(child=child, distribution_date=TODAY)
+        support = SchoolSupport.objects.create(
+            child=child,
+            school=school,
+            academic_year="2025",
+            school_fees=Decimal("30000.00"),
+        )
+        SchoolPayment.objects.create(
+            school_support=support, amount=Decimal("10000.00"), date=TODAY
+        )
+
+
+def _seed_public(size, name, user):
+    category = GalleryCategory.objects.create(name=f"{name} Category")
+    for index in range(size):
+        GalleryMedia.objects.create(
+            category=category,
+            title=f"{name} Media {index}",
+            media_url=f"media_gallery/{name}{index}.jpg",
+            uploaded_by=user,
+        )
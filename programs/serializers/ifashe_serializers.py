@@ -1,4 +1,3 @@
-from decimal import Decimal
 from django.utils import timezone
 from django.db import transaction
 
@@ -10,6 +9,7 @@ from programs.models.ifashe_models import (
     ParentAttendance,
     ParentPerformance,
     ParentWorkContract,
+    School,
     SponsoredChild,
     Sponsorship,
     SchoolSupport,
@@ -22,6 +22,7 @@ from utils.validators import (
     validate_not_future_date,
     validate_not_negative,
 )
+from utils.serializers import SparseFieldsetMixin
 
 
 class IfasheParentSerializer(serializers.ModelSerializer):
@@ -121,12 +122,17 @@ class SchoolPaymentSerializer(serializers.ModelSerializer):
         return validate_not_negative(value, "Payment amount")
 
 
-class SchoolSupportSerializer(serializers.ModelSerializer):
+class SchoolSupportSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     child_name = serializers.ReadOnlyField(source="child.full_name")
     school_name = serializers.ReadOnlyField(source="school.name")
     payments = SchoolPaymentSerializer(many=True, read_only=True)
-    total_paid = serializers.SerializerMethodField()
-    balance_due = serializers.SerializerMethodField()
+    # Stored ledger columns, rendered as numbers like the totals they replace.
+    total_paid = serializers.DecimalField(
+        max_digits=12, decimal_places=2, coerce_to_string=False, read_only=True
+    )
+    balance_due = serializers.DecimalField(
+        max_digits=12, decimal_places=2, coerce_to_string=False, read_only=True
+    )
     is_overdue = serializers.SerializerMethodField()
 
     class Meta:
@@ -148,33 +154,84 @@ class SchoolSupportSerializer(serializers.ModelSerializer):
             "balance_due",
             "is_overdue",
         ]
-
-    def get_total_paid(self, obj) -> Decimal :
-        return sum(payment.amount for payment in obj.payments.all())
-
-    def get_balance_due(self, obj) -> Decimal :
-        return obj.total_cost - self.get_total_paid(obj)
+        expandable_fields = ["payments"]
+        field_sources = {
+            "child_name": ["child.first_name", "child.last_name"],
+            "is_overdue": ["payment_status", "balance_due"],
+        }
 
     def get_is_overdue(self, obj) -> bool:
         return (
             obj.payment_status == SchoolSupport.PENDING
             or obj.payment_status == SchoolSupport.OVERDUE
-        ) and self.get_balance_due(obj) > 0
+        ) and obj.balance_due > 0
 
     def update(self, instance, validated_data):
         instance = super().update(instance, validated_data)
-        self._sync_payment_status(instance)
+        # save() derived the status; reload the generated totals it moved.
+        instance.refresh_from_db(fields=["total_cost", "balance_due"])
         return instance
 
-    def _sync_payment_status(self, obj):
-        total_paid = sum(p.amount for p in obj.payments.all())
-        if total_paid <= 0:
-            obj.payment_status = SchoolSupport.PENDING
-        elif total_paid < obj.total_cost:
-            obj.payment_status = SchoolSupport.PARTIAL
-        else:
-            obj.payment_status = SchoolSupport.PAID
-        obj.save(update_fields=["payment_status"])
+
+class SchoolPaymentBatchSerializer(serializers.Serializer):
+    payments = SchoolPaymentSerializer(many=True, allow_empty=False)
+
+    def validate_payments(self, value):
+        max_size = self.context.get("max_bulk_size")
+        if max_size and len(value) > max_size:
+            raise serializers.ValidationError(
+                f"Bulk operation limited to {max_size} items. You sent {len(value)}."
+            )
+        return value
+
+
+class SchoolFeeScheduleSerializer(serializers.Serializer):
+    school = serializers.PrimaryKeyRelatedField(
+        queryset=School.objects.all(), required=False, allow_null=True
+    )
+    level = serializers.CharField(max_length=100)
+    school_fees = serializers.DecimalField(max_digits=10, decimal_places=2)
+    materials_cost = serializers.DecimalField(
+        max_digits=10, decimal_places=2, default=0
+    )
+
+    def validate_school_fees(self, value):
+        return validate_not_negative(value, "School fees")
+
+    def validate_materials_cost(self, value):
+        return validate_not_negative(value, "Materials cost")
+
+
+class SchoolYearGenerationSerializer(serializers.Serializer):
+    academic_year = serializers.CharField(max_length=12)
+    fees = SchoolFeeScheduleSerializer(many=True, allow_empty=False)
+
+    def validate_fees(self, value):
+        keys = [
+            (entry.get("school"), entry["level"].strip().lower()) for entry in value
+        ]
+        if len(set(keys)) != len(keys):
+            raise serializers.ValidationError(
+                "Each school and level can appear only once in the fee schedule."
+            )
+        return value
+
+    def to_task_arguments(self):
+        """
+        The validated data as JSON for the generation task.
+        """
+        return (
+            self.validated_data["academic_year"],
+            [
+                {
+                    "school": str(entry["school"].pk) if entry.get("school") else None,
+                    "level": entry["level"],
+                    "school_fees": str(entry["school_fees"]),
+                    "materials_cost": str(entry["materials_cost"]),
+                }
+                for entry in self.validated_data["fees"]
+            ],
+        )
 
 
 class IfasheChildSerializer(serializers.ModelSerializer):
@@ -220,7 +277,6 @@ class IfasheChildSerializer(serializers.ModelSerializer):
 class IfasheFamilySerializer(serializers.ModelSerializer):
     parents = IfasheParentSerializer(many=True, required=False)
     children = IfasheChildSerializer(many=True, required=False)
-    children_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Family
@@ -240,6 +296,7 @@ class IfasheFamilySerializer(serializers.ModelSerializer):
             "proof_of_residence",
             "parents",
             "children",
+            "parents_count",
             "children_count",
         ]
         # family_id removed from fields
@@ -251,9 +308,6 @@ class IfasheFamilySerializer(serializers.ModelSerializer):
             )
         return value
 
-    def get_children_count(self, obj) -> int :
-        return obj.children.count()
-
     def create(self, validated_data):
         parents_data = validated_data.pop("parents", [])
         children_data = validated_data.pop("children", [])
@@ -266,6 +320,8 @@ class IfasheFamilySerializer(serializers.ModelSerializer):
             for child_data in children_data:
                 SponsoredChild.objects.create(family=family, **child_data)
 
+        # The nested creates moved the counters in the database only.
+        family.refresh_from_db(fields=["parents_count", "children_count"])
         return family
 
 
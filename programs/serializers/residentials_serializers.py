@@ -16,6 +16,7 @@ from ..models import (
     Caretaker,
     HealthRecord,
     ChildInsurance,
+    FoodItem,
     ResidentialFinancialPlan,
 )
 from django.db.models import Sum, Count, Avg, F
@@ -25,9 +26,10 @@ from utils.validators import (
     validate_not_negative,
     validate_rwanda_phone,
 )
+from utils.serializers import SparseFieldsetMixin
 
 
-class ChildReadSerializer(serializers.ModelSerializer):
+class ChildReadSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     full_name = serializers.CharField(read_only=True)
     age = serializers.IntegerField(read_only=True)
     end_date = serializers.DateField(read_only=True)
@@ -54,6 +56,11 @@ class ChildReadSerializer(serializers.ModelSerializer):
             "updated_on",
         ]
         read_only_fields = ["id", "created_on", "updated_on"]
+        field_sources = {
+            "full_name": ["first_name", "last_name"],
+            "age": ["date_of_birth"],
+            "end_date": ["start_date"],
+        }
 
 
 class ChildWriteSerializer(serializers.ModelSerializer):
@@ -189,7 +196,14 @@ class EducationProgramReadSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = EducationProgram
-        fields = ["id", "institution", "program_name", "program_level", "cost"]
+        fields = [
+            "id",
+            "institution",
+            "program_name",
+            "program_level",
+            "cost",
+            "enrolled_count",
+        ]
         read_only_fields = ["id", "created_on", "updated_on"]
 
 
@@ -347,6 +361,10 @@ class HealthRecordReadSerializer(serializers.ModelSerializer):
             "updated_on",
         ]
         read_only_fields = ("id", "created_on", "updated_on")
+        field_sources = {
+            "child_name": ["child.first_name", "child.last_name"],
+            "cost_formatted": ["cost"],
+        }
 
     def get_child_name(self, obj) -> str:
         return f"{obj.child.first_name} {obj.child.last_name}"
@@ -397,6 +415,14 @@ class HealthRecordWriteSerializer(serializers.ModelSerializer):
         return attrs
 
 
+def _full_name(first_name, last_name):
+    return f"{first_name} {last_name}"
+
+
+def _format_cost(cost):
+    return f"{cost:,.2f} RWF"
+
+
 class HealthRecordListSerializer(serializers.ModelSerializer):
     """Lighter serializer for list views"""
 
@@ -417,12 +443,21 @@ class HealthRecordListSerializer(serializers.ModelSerializer):
             "cost_formatted",
             "created_on",
         ]
+        field_sources = {
+            "child_name": ["child.first_name", "child.last_name"],
+            "cost_formatted": ["cost"],
+        }
+        # Read path of HealthRecordViewSet.list, see utils/values_reader.py.
+        values_sources = {
+            "child_name": (["child__first_name", "child__last_name"], _full_name),
+            "cost_formatted": (["cost"], _format_cost),
+        }
 
     def get_child_name(self, obj) -> str:
-        return f"{obj.child.first_name} {obj.child.last_name}"
+        return _full_name(obj.child.first_name, obj.child.last_name)
 
     def get_cost_formatted(self, obj) -> str:
-        return f"{obj.cost:,.2f} RWF"
+        return _format_cost(obj.cost)
 
 
 class SpendingReportSerializer(serializers.Serializer):
@@ -432,6 +467,8 @@ class SpendingReportSerializer(serializers.Serializer):
     special_diet_spending = serializers.SerializerMethodField()
     education_spending = serializers.SerializerMethodField()
     total_spending = serializers.SerializerMethodField()
+    planned_spending = serializers.SerializerMethodField()
+    food_purchases = serializers.SerializerMethodField()
     currency = serializers.CharField(default="RWF")
 
     def get_date_filters(self, date_field):
@@ -497,6 +534,18 @@ class SpendingReportSerializer(serializers.Serializer):
     def get_total_spending(self, obj) -> Decimal:
         return self.get_normal_spending(obj) + self.get_special_diet_spending(obj)
 
+    def get_planned_spending(self, obj) -> Decimal:
+        filters = self.get_date_filters("month")
+        return ResidentialFinancialPlan.objects.filter(**filters).aggregate(
+            total=Sum("total_cost")
+        )["total"] or Decimal("0.00")
+
+    def get_food_purchases(self, obj) -> Decimal:
+        filters = self.get_date_filters("purchase_date")
+        return FoodItem.objects.filter(**filters).aggregate(total=Sum("total_cost"))[
+            "total"
+        ] or Decimal("0.00")
+
 
 class CostReportSerializer(serializers.Serializer):
     date_range = serializers.SerializerMethodField()
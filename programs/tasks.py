@@ -9,4 +9,10 @@ def send_status_email_task(application_id):
         from utils.emails import send_internship_status_email
         send_internship_status_email(instance)
     except Exception as e:
-        print(f"Failed to send email for application {application_id}: {e}")
\ No newline at end of file
+        print(f"Failed to send email for application {application_id}: {e}")
+
+@shared_task
+def generate_school_supports_task(academic_year, fee_schedule):
+    from utils.school_year import generate_school_supports
+
+    return generate_school_supports(academic_year, fee_schedule)
@@ -0,0 +1,226 @@
+import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from programs.models import Family, Parent, SponsoredChild
+from programs.models.residentials_models import (
+    Child,
+    ChildEducation,
+    EducationInstitution,
+    EducationProgram,
+)
+from public_modules.models.gallery_models import GalleryCategory, GalleryMedia
+from utils.counter_cache import counters_for, recount, update_counted
+from utils.query_audit import QueryRecorder
+
+
+class CounterCacheTest(TestCase):
+    def setUp(self):
+        self.family = self.create_family("Mugisha")
+        self.other_family = self.create_family("Uwase")
+
+    def create_family(self, name):
+        return Family.objects.create(
+            family_name=name,
+            address="Kigali",
+            province="Kigali",
+            district="Gasabo",
+            sector="Remera",
+            cell="Rukiri",
+            village="Amahoro",
+        )
+
+    def create_child(self, family, name="Eric"):
+        return SponsoredChild.objects.create(
+            family=family,
+            first_name=name,
+            last_name="Sponsored",
+            date_of_birth=datetime.date(2014, 1, 1),
+            gender=SponsoredChild.MALE,
+        )
+
+    def counts(self, family):
+        family.refresh_from_db(fields=["parents_count", "children_count"])
+        return family.parents_count, family.children_count
+
+    def test_create_and_delete(self):
+        child = self.create_child(self.family)
+        self.create_child(self.family, "Grace")
+        Parent.objects.create(
+            family=self.family, first_name="Jean", last_name="Parent", phone="0788"
+        )
+        self.assertEqual(self.counts(self.family), (1, 2))
+
+        SponsoredChild.all_objects.filter(pk=child.pk).delete()
+        self.assertEqual(self.counts(self.family), (1, 1))
+
+    def test_soft_delete_and_restore(self):
+        child = self.create_child(self.family)
+        child.delete()
+        self.assertEqual(self.counts(self.family), (0, 0))
+
+        child.is_deleted = False
+        child.save(update_fields=["is_deleted"])
+        self.assertEqual(self.counts(self.family), (0, 1))
+
+    def test_reparent(self):
+        child = self.create_child(self.family)
+        child.family = self.other_family
+        child.save()
+        self.assertEqual(self.counts(self.family), (0, 0))
+        self.assertEqual(self.counts(self.other_family), (0, 1))
+
+    def test_unrelated_save_reads_nothing(self):
+        child = self.create_child(self.family)
+        child.school_name = "Remera Primary"
+        with QueryRecorder() as recorder:
+            child.save(update_fields=["school_name"])
+        self.assertEqual(len(recorder), 1)
+        self.assertEqual(self.counts(self.family), (0, 1))
+
+    def test_stale_parent_save_keeps_the_counts(self):
+        stale = Family.objects.get(pk=self.family.pk)
+        self.create_child(self.family)
+
+        stale.address = "Huye"
+        stale.save()
+        self.assertEqual(self.counts(self.family), (0, 1))
+        self.family.refresh_from_db(fields=["address"])
+        self.assertEqual(self.family.address, "Huye")
+
+        stale.delete()
+        self.assertEqual(self.counts(self.family), (0, 1))
+
+    def test_conditional_counter(self):
+        institution = EducationInstitution.objects.create(
+            name="Remera School", type=EducationInstitution.SCHOOL
+        )
+        program = EducationProgram.objects.create(
+            institution=institution, program_name="P6"
+        )
+        child = Child.objects.create(
+            first_name="Aline",
+            last_name="Uwase",
+            date_of_birth=datetime.date(2015, 1, 1),
+            gender=Child.FEMALE,
+            start_date=datetime.date(2023, 1, 1),
+        )
+
+        def enroll(status):
+            return ChildEducation.objects.create(
+                child=child,
+                program=program,
+                start_date=datetime.date(2024, 1, 1),
+                status=status,
+            )
+
+        def enrolled():
+            program.refresh_from_db(fields=["enrolled_count"])
+            return program.enrolled_count
+
+        education = enroll(ChildEducation.ACTIVE)
+        enroll(ChildEducation.COMPLETED)
+        self.assertEqual(enrolled(), 1)
+
+        education.status = ChildEducation.DISCONTINUED
+        education.save(update_fields=["status"])
+        self.assertEqual(enrolled(), 0)
+
+        update_counted(ChildEducation.objects.all(), status=ChildEducation.ACTIVE)
+        self.assertEqual(enrolled(), 2)
+
+        ChildEducation.objects.filter(pk=education.pk).delete()
+        self.assertEqual(enrolled(), 1)
+
+    def test_update_counted(self):
+        self.create_child(self.family)
+        self.create_child(self.family, "Grace")
+        update_counted(SponsoredChild.objects.all(), family=self.other_family)
+        self.assertEqual(self.counts(self.family), (0, 0))
+        self.assertEqual(self.counts(self.other_family), (0, 2))
+
+        update_counted(SponsoredChild.objects.all(), is_deleted=True)
+        self.assertEqual(self.counts(self.other_family), (0, 0))
+
+    def test_recount_repairs_drift(self):
+        self.create_child(self.family)
+        Family.objects.filter(pk=self.family.pk).update(children_count=7)
+
+        [counter] = [
+            counter
+            for counter in counters_for(SponsoredChild)
+            if counter.column == "children_count"
+        ]
+        self.assertEqual(recount(counter), 1)
+        self.assertEqual(self.counts(self.family), (0, 1))
+        self.assertEqual(recount(counter), 0)
+
+    def test_repair_command(self):
+        user = User.objects.create_superuser(
+            email="admin@example.com",
+            password="password123",
+            first_name="Admin",
+            last_name="User",
+        )
+        category = GalleryCategory.objects.create(name="Events")
+        GalleryMedia.objects.bulk_create(
+            [
+                GalleryMedia(
+                    category=category,
+                    title=f"Photo {index}",
+                    media_url=f"media_gallery/photo{index}.jpg",
+                    uploaded_by=user,
+                )
+                for index in range(3)
+            ]
+        )
+        category.refresh_from_db()
+        self.assertEqual(category.media_count, 0)
+
+        out = StringIO()
+        call_command(
+            "repair_counter_caches",
+            "public_modules.gallerycategory.media_count",
+            stdout=out,
+        )
+        category.refresh_from_db()
+        self.assertEqual(category.media_count, 3)
+        self.assertIn("1 rows fixed", out.getvalue())
+
+        # Deleting the category cascades to its media.
+        category.delete()
+        self.assertFalse(GalleryMedia.objects.exists())
+
+    def test_nested_create_renders_counts(self):
+        client = APIClient()
+        client.force_authenticate(
+            User.objects.create_superuser(
+                email="admin@example.com",
+                password="password123",
+                first_name="Admin",
+                last_name="User",
+            )
+        )
+        response = client.post(
+            "/api/ifashe-families/",
+            {
+                "family_name": "Habimana",
+                "address": "Kigali",
+                "province": "Kigali",
+                "district": "Gasabo",
+                "sector": "Remera",
+                "cell": "Rukiri",
+                "village": "Amahoro",
+                "parents": [
+                    {"first_name": "Jean", "last_name": "Parent", "phone": "0788123456"}
+                ],
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(response.data["parents_count"], 1)
+        self.assertEqual(response.data["children_count"], 0)
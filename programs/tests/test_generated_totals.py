@@ -0,0 +1,117 @@
+import datetime
+from decimal import Decimal
+
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from programs.models import (
+    Child,
+    FoodItem,
+    FoodSupplier,
+    ResidentialFinancialPlan,
+    SchoolSupport,
+)
+from programs.seed import seed_dataset
+from utils.reports.ifashe.supports_reports import child_support_queryset
+
+TODAY = datetime.date(2025, 3, 1)
+
+
+class GeneratedTotalsTest(APITestCase):
+    SUPPORT_URL = "/api/ifashe-school-support/"
+    SPENDING_URL = "/api/residential-finance/spending-summary/"
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com",
+            password="password123",
+            first_name="Admin",
+            last_name="User",
+        )
+        self.client.force_authenticate(user=self.admin)
+
+    def create_child(self):
+        return Child.objects.create(
+            first_name="Aline",
+            last_name="Uwase",
+            date_of_birth=datetime.date(2015, 1, 1),
+            gender=Child.FEMALE,
+            start_date=datetime.date(2023, 1, 1),
+        )
+
+    def test_totals_are_computed_by_the_database(self):
+        supplier = FoodSupplier.objects.create(name="Kimironko Market")
+        FoodItem.objects.create(
+            supplier=supplier,
+            purchase_date=TODAY,
+            quantity=Decimal("10"),
+            unit_cost=Decimal("500"),
+        )
+        FoodItem.objects.create(supplier=supplier, purchase_date=TODAY)
+        self.assertEqual(
+            list(
+                FoodItem.objects.order_by("-total_cost").values_list(
+                    "total_cost", flat=True
+                )
+            ),
+            [Decimal("5000.00"), Decimal("0.00")],
+        )
+
+        plan = ResidentialFinancialPlan.objects.create(
+            child=self.create_child(),
+            month=TODAY,
+            year=TODAY,
+            education_cost=Decimal("20000"),
+            food_cost=Decimal("15000"),
+            insurance_cost=Decimal("3000"),
+            other_costs=Decimal("2000"),
+        )
+        plan.refresh_from_db()
+        self.assertEqual(plan.total_cost, Decimal("40000.00"))
+        self.assertTrue(
+            ResidentialFinancialPlan.objects.filter(total_cost__gt=35000).exists()
+        )
+
+        response = self.client.get(self.SPENDING_URL, {"date_from": "2025-01-01"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data["data"]
+        self.assertEqual(Decimal(str(data["planned_spending"])), Decimal("40000"))
+        self.assertEqual(Decimal(str(data["food_purchases"])), Decimal("5000"))
+
+    def test_school_support_ordering_and_filters(self):
+        seed_dataset(3, self.admin)
+        supports = list(SchoolSupport.objects.order_by("pk"))
+        for index, support in enumerate(supports):
+            support.materials_cost = Decimal(1000 * index)
+            support.save()
+
+        expected = sorted(
+            (
+                support.school_fees + support.materials_cost
+                for support in supports
+                if support.school_fees + support.materials_cost >= 31000
+            ),
+            reverse=True,
+        )
+        self.assertGreater(len(supports), len(expected))
+
+        response = self.client.get(
+            self.SUPPORT_URL, {"ordering": "-total_cost", "total_cost_min": 31000}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        totals = [Decimal(row["total_cost"]) for row in response.data["results"]]
+        self.assertEqual(totals, expected)
+
+    def test_child_support_report_rows(self):
+        seed_dataset(2, self.admin)
+        support = SchoolSupport.objects.order_by("pk").first()
+        support.materials_cost = Decimal("5000")
+        support.save()
+
+        first = child_support_queryset().first()
+        self.assertEqual(first.pk, support.child_id)
+        self.assertEqual(first.support_total, Decimal("35000.00"))
+        self.assertEqual(first.clothes_count, 1)
@@ -0,0 +1,135 @@
+import datetime
+import gzip
+import io
+import uuid
+from decimal import Decimal
+from unittest import mock
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from utils import compression
+from utils.compression import CompressionMiddleware, accepts_encoding
+from utils.fast_json import ORJSONParser, ORJSONRenderer
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    def test_output_matches_drf(self):
+        data = {
+            "id": uuid.UUID("01934b4e-1c2d-7e3f-8a9b-0c1d2e3f4a5b"),
+            "amount": Decimal("12.50"),
+            "created_on": datetime.datetime(
+                2025, 3, 1, 8, 30, 15, 123456, tzinfo=datetime.timezone.utc
+            ),
+            "date": datetime.date(2025, 3, 1),
+            "duration": datetime.timedelta(minutes=2),
+            "label": gettext_lazy("Paid"),
+            "nested": [{"name": "Kigali "}, None, True, 3],
+            2025: "year",
+        }
+        self.assertEqual(
+            ORJSONRenderer().render(data), JSONRenderer().render(data)
+        )
+
+    def test_none_renders_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+    def test_indent(self):
+        rendered = ORJSONRenderer().render(
+            {"a": 1}, "application/json; indent=4"
+        )
+        self.assertEqual(rendered, b'{\n  "a": 1\n}')
+
+    def test_parser(self):
+        parsed = ORJSONParser().parse(io.BytesIO(b'{"amount": 12.5, "ids": [1]}'))
+        self.assertEqual(parsed, {"amount": 12.5, "ids": [1]})
+
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b"{broken"))
+
+
+@override_settings(RESPONSE_COMPRESSION_MIN_SIZE=100)
+class CompressionMiddlewareTest(SimpleTestCase):
+    BODY = b'{"name": "Kigali"}' * 50
+
+    def process(self, response, accept_encoding="gzip", **extra):
+        request = RequestFactory().get(
+            "/", HTTP_ACCEPT_ENCODING=accept_encoding, **extra
+        )
+        return CompressionMiddleware(lambda request: response).process_response(
+            request, response
+        )
+
+    def test_gzips_json(self):
+        response = self.process(
+            HttpResponse(self.BODY, content_type="application/json")
+        )
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), self.BODY)
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_small_responses_are_not_compressed(self):
+        response = self.process(
+            HttpResponse(b'{"ok": true}', content_type="application/json")
+        )
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_binary_responses_are_not_compressed(self):
+        response = self.process(
+            HttpResponse(self.BODY, content_type="application/pdf")
+        )
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_streaming_response(self):
+        response = self.process(
+            StreamingHttpResponse(
+                iter([self.BODY, self.BODY]), content_type="text/csv"
+            )
+        )
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        content = b"".join(response.streaming_content)
+        self.assertEqual(gzip.decompress(content), self.BODY * 2)
+
+    def test_brotli_when_accepted(self):
+        if compression.brotli is None:
+            self.skipTest("brotli is not installed")
+        response = self.process(
+            HttpResponse(self.BODY, content_type="application/json"),
+            accept_encoding="gzip, br",
+        )
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(compression.brotli.decompress(response.content), self.BODY)
+
+    def test_accepts_encoding(self):
+        self.assertTrue(accepts_encoding("gzip, br", "br"))
+        self.assertTrue(accepts_encoding("gzip;q=1.0, BR;q=0.5", "br"))
+        self.assertTrue(accepts_encoding("*", "br"))
+        self.assertFalse(accepts_encoding("gzip, br;q=0", "br"))
+        self.assertFalse(accepts_encoding("*, br;q=0.0", "br"))
+        self.assertFalse(accepts_encoding("gzip, *;q=0", "br"))
+        self.assertFalse(accepts_encoding("gzip, brotli", "br"))
+        self.assertFalse(accepts_encoding("br;q=high", "br"))
+        self.assertFalse(accepts_encoding("", "br"))
+
+    @mock.patch.object(compression, "brotli", object())
+    def test_brotli_only_without_cookies(self):
+        factory = RequestFactory()
+        request = factory.get("/", HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertTrue(compression.may_use_brotli(request, HttpResponse()))
+
+        # Session-authenticated responses get gzip, padded against BREACH.
+        request = factory.get(
+            "/", HTTP_ACCEPT_ENCODING="gzip, br", HTTP_COOKIE="sessionid=abc"
+        )
+        self.assertFalse(compression.may_use_brotli(request, HttpResponse()))
+
+        request = factory.get("/", HTTP_ACCEPT_ENCODING="gzip, br")
+        response = HttpResponse()
+        response.set_cookie("csrftoken", "abc")
+        self.assertFalse(compression.may_use_brotli(request, response))
+
+        request = factory.get("/", HTTP_ACCEPT_ENCODING="gzip, br;q=0")
+        self.assertFalse(compression.may_use_brotli(request, HttpResponse()))
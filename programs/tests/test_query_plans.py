@@ -0,0 +1,35 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from accounts.models import User
+from programs.seed import seed_dataset
+from utils.hot_queries import hot_queries
+from utils.query_audit import sequential_scans
+
+
+class HotQueryPlanTest(TestCase):
+    """
+    Every hot-path query must be served by an index.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_superuser(
+            email="admin@example.com",
+            password="password123",
+            first_name="Admin",
+            last_name="User",
+        )
+        seed_dataset(3, user)
+
+    def test_hot_queries_use_indexes(self):
+        for label, queryset in hot_queries():
+            with self.subTest(label):
+                self.assertEqual(sequential_scans(queryset), [], label)
+
+    def test_explain_command(self):
+        out = StringIO()
+        call_command("explain_hot_queries", "--strict", stdout=out)
+        self.assertIn("recurring donations due", out.getvalue())
@@ -0,0 +1,208 @@
+import datetime
+from decimal import Decimal
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from programs.models import School, SchoolSupport, SponsoredChild
+from programs.models.ifashe_models import SchoolPayment
+from programs.seed import seed_dataset
+from programs.serializers.ifashe_serializers import SchoolSupportSerializer
+from utils.school_ledger import rebuild
+
+TODAY = datetime.date(2025, 3, 1)
+
+
+class SchoolLedgerTest(APITestCase):
+    SUPPORT_URL = "/api/ifashe-school-support/"
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com",
+            password="password123",
+            first_name="Admin",
+            last_name="User",
+        )
+        self.client.force_authenticate(user=self.admin)
+        seed_dataset(2, self.admin)
+        # Each seeded support costs 30000 and has one payment of 10000.
+        self.support, self.other = SchoolSupport.objects.order_by("pk")[:2]
+
+    def ledger(self, support):
+        support.refresh_from_db(fields=["total_paid", "balance_due", "payment_status"])
+        return support.total_paid, support.balance_due, support.payment_status
+
+    def pay(self, support, amount):
+        return SchoolPayment.objects.create(
+            school_support=support, amount=Decimal(amount), date=TODAY
+        )
+
+    def test_payments_post_to_the_support(self):
+        self.assertEqual(
+            self.ledger(self.support),
+            (Decimal("10000"), Decimal("20000"), SchoolSupport.PARTIAL),
+        )
+
+        payment = self.pay(self.support, "20000")
+        self.assertEqual(
+            self.ledger(self.support), (Decimal("30000"), 0, SchoolSupport.PAID)
+        )
+
+        payment.amount = Decimal("5000")
+        payment.save()
+        self.assertEqual(
+            self.ledger(self.support),
+            (Decimal("15000"), Decimal("15000"), SchoolSupport.PARTIAL),
+        )
+
+        payment.school_support = self.other
+        payment.save()
+        self.assertEqual(self.ledger(self.support)[0], Decimal("10000"))
+        self.assertEqual(self.ledger(self.other)[0], Decimal("15000"))
+
+        payment.delete()
+        SchoolPayment.objects.filter(school_support=self.support).delete()
+        self.assertEqual(
+            self.ledger(self.support), (0, Decimal("30000"), SchoolSupport.PENDING)
+        )
+        self.assertEqual(self.ledger(self.other)[0], Decimal("10000"))
+
+    def test_overdue_stays_until_paid_off(self):
+        SchoolSupport.objects.filter(pk=self.support.pk).update(
+            payment_status=SchoolSupport.OVERDUE
+        )
+        self.pay(self.support, "5000")
+        self.assertEqual(self.ledger(self.support)[2], SchoolSupport.OVERDUE)
+        self.pay(self.support, "15000")
+        self.assertEqual(self.ledger(self.support)[2], SchoolSupport.PAID)
+
+    def test_add_payment(self):
+        response = self.client.post(
+            f"{self.SUPPORT_URL}{self.support.pk}/add_payment/",
+            {"school_support": self.support.pk, "amount": "20000", "date": TODAY},
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.ledger(self.support)[2], SchoolSupport.PAID)
+
+        response = self.client.get(f"{self.SUPPORT_URL}{self.support.pk}/")
+        self.assertEqual(response.data["total_paid"], 30000)
+        self.assertEqual(response.data["balance_due"], 0)
+        self.assertFalse(response.data["is_overdue"])
+
+    def test_add_payments_batch(self):
+        payments = [
+            {"school_support": self.support.pk, "amount": "5000", "date": TODAY},
+            {"school_support": self.support.pk, "amount": "15000", "date": TODAY},
+            {"school_support": self.other.pk, "amount": "1000", "date": TODAY},
+        ]
+        response = self.client.post(
+            f"{self.SUPPORT_URL}add_payments/", {"payments": payments}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(
+            self.ledger(self.support), (Decimal("30000"), 0, SchoolSupport.PAID)
+        )
+        self.assertEqual(self.ledger(self.other)[0], Decimal("11000"))
+
+        # An invalid entry rejects the whole batch.
+        payments[1]["amount"] = "-1"
+        response = self.client.post(
+            f"{self.SUPPORT_URL}add_payments/", {"payments": payments}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.ledger(self.other)[0], Decimal("11000"))
+
+    def test_cost_change_rederives_status(self):
+        response = self.client.patch(
+            f"{self.SUPPORT_URL}{self.support.pk}/", {"school_fees": "10000"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["payment_status"], SchoolSupport.PAID)
+        self.assertEqual(response.data["balance_due"], 0)
+
+    def test_stale_instance_keeps_the_paid_total(self):
+        stale = SchoolSupport.objects.get(pk=self.support.pk)
+        self.pay(self.support, "60")
+
+        serializer = SchoolSupportSerializer(
+            stale, data={"notes": "Paid late"}, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        self.assertEqual(stale.total_paid, Decimal("10060"))
+        self.assertEqual(
+            self.ledger(self.support),
+            (Decimal("10060"), Decimal("19940"), SchoolSupport.PARTIAL),
+        )
+
+        stale = SchoolSupport.objects.get(pk=self.support.pk)
+        self.pay(self.support, "19940")
+        stale.notes = "Paid in full"
+        stale.save()
+        self.assertEqual(
+            self.ledger(self.support), (Decimal("30000"), 0, SchoolSupport.PAID)
+        )
+
+    def test_bulk_mark_paid_records_the_balances(self):
+        SchoolSupport.objects.filter(pk=self.support.pk).update(
+            payment_status=SchoolSupport.OVERDUE
+        )
+        response = self.client.post(
+            f"{self.SUPPORT_URL}bulk_mark_paid/",
+            {"ids": [self.support.pk, self.other.pk]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        for support in (self.support, self.other):
+            self.assertEqual(
+                self.ledger(support), (Decimal("30000"), 0, SchoolSupport.PAID)
+            )
+        self.assertEqual(self.support.payments.count(), 2)
+
+    def test_bulk_update_rederives_status(self):
+        response = self.client.post(
+            f"{self.SUPPORT_URL}bulk_update/",
+            {"ids": [self.support.pk], "payload": {"school_fees": "10000"}},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.ledger(self.support), (Decimal("10000"), 0, SchoolSupport.PAID)
+        )
+
+        response = self.client.post(
+            f"{self.SUPPORT_URL}bulk_update/",
+            {"ids": [self.other.pk], "payload": {"payment_status": "PAID"}},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.ledger(self.other)[2], SchoolSupport.PARTIAL)
+
+    def test_cascade_delete(self):
+        school = School.objects.get(pk=self.support.school_id)
+        SponsoredChild.all_objects.filter(pk=self.support.child_id).delete()
+        self.assertFalse(SchoolSupport.objects.filter(pk=self.support.pk).exists())
+        self.assertTrue(school.supported_children.exists())
+
+    def test_rebuild_repairs_drift(self):
+        SchoolPayment.objects.bulk_create(
+            [SchoolPayment(school_support=self.support, amount=20000, date=TODAY)]
+        )
+        self.assertEqual(self.ledger(self.support)[0], Decimal("10000"))
+
+        self.assertEqual(rebuild(), 1)
+        self.assertEqual(
+            self.ledger(self.support), (Decimal("30000"), 0, SchoolSupport.PAID)
+        )
+        self.assertEqual(rebuild(), 0)
+
+        out = StringIO()
+        call_command("repair_school_ledger", stdout=out)
+        self.assertIn("0 rows fixed", out.getvalue())
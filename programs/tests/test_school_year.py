@@ -0,0 +1,120 @@
+import datetime
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from programs.models import Family, School, SchoolSupport, SponsoredChild
+from programs.seed import seed_dataset
+from utils.school_year import generate_school_supports
+
+
+class SchoolYearGenerationTest(APITestCase):
+    SUPPORT_URL = "/api/ifashe-school-support/"
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com",
+            password="password123",
+            first_name="Admin",
+            last_name="User",
+        )
+        self.client.force_authenticate(user=self.admin)
+        # Two schools, each with two children supported in 2025.
+        seed_dataset(2, self.admin)
+        self.school = School.objects.get(name="seed0 Primary")
+        self.family = Family.objects.first()
+
+        self.named = self.create_child("Named", school_name=" SEED1 primary")
+        self.create_child("Exited", support_status=SponsoredChild.EXITED)
+        self.create_child("Unknown", school_name="Elsewhere")
+        self.create_child(
+            "Secondary", school_name="seed0 Primary", school_level="Secondary"
+        )
+        self.schedule = [
+            {
+                "school": str(self.school.pk),
+                "level": "Primary",
+                "school_fees": "40000",
+                "materials_cost": "5000",
+            },
+            {"school": None, "level": "primary", "school_fees": "30000"},
+        ]
+
+    def create_child(self, first_name, **fields):
+        return SponsoredChild.objects.create(
+            family=self.family,
+            first_name=first_name,
+            last_name="Sponsored",
+            date_of_birth=datetime.date(2014, 1, 1),
+            gender=SponsoredChild.FEMALE,
+            **fields,
+        )
+
+    def test_generate(self):
+        summary = generate_school_supports("2026", self.schedule, chunk_size=2)
+        self.assertEqual(
+            summary,
+            {
+                "academic_year": "2026",
+                "existing": 0,
+                "eligible": 7,
+                "created": 5,
+                "skipped_no_school": 1,
+                "skipped_no_fees": 1,
+            },
+        )
+
+        supports = SchoolSupport.objects.filter(academic_year="2026")
+        self.assertEqual(
+            supports.filter(school=self.school, total_cost=45000).count(), 2
+        )
+        support = supports.get(child=self.named)
+        self.assertEqual(support.school.name, "seed1 Primary")
+        self.assertEqual(support.total_cost, Decimal("30000"))
+        self.assertEqual(support.payment_status, SchoolSupport.PENDING)
+
+        summary = generate_school_supports("2026", self.schedule)
+        self.assertEqual(summary["existing"], 5)
+        self.assertEqual(summary["eligible"], 2)
+        self.assertEqual(summary["created"], 0)
+
+    @mock.patch(
+        "programs.views.ifashe_views.school_views.generate_school_supports_task"
+    )
+    def test_generate_year_schedules_a_job(self, task):
+        task.delay.return_value.id = "job-1"
+        response = self.client.post(
+            f"{self.SUPPORT_URL}generate-year/",
+            {"academic_year": "2026", "fees": self.schedule},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["task_id"], "job-1")
+
+        academic_year, schedule = task.delay.call_args.args
+        self.assertEqual(academic_year, "2026")
+        self.assertEqual(schedule[1]["school"], None)
+        self.assertEqual(Decimal(schedule[1]["materials_cost"]), 0)
+        self.assertEqual(
+            generate_school_supports(academic_year, schedule)["created"], 5
+        )
+
+    def test_generate_year_rejects_duplicate_fees(self):
+        fees = [*self.schedule, {"level": "PRIMARY", "school_fees": "1"}]
+        response = self.client.post(
+            f"{self.SUPPORT_URL}generate-year/",
+            {"academic_year": "2026", "fees": fees},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_generate_year_status(self):
+        response = self.client.get(f"{self.SUPPORT_URL}generate-year/unknown-job/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "PENDING")
+        self.assertIsNone(response.data["summary"])
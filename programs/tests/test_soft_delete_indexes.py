@@ -0,0 +1,55 @@
+import uuid
+from io import StringIO
+
+from django.apps import apps
+from django.core.management import call_command
+from django.db.models import Q
+from django.test import TestCase
+
+from accounts.models import SoftDeleteModel
+from programs.models import Child, ChildProgress
+from utils.query_audit import sequential_scans
+
+
+class SoftDeleteIndexTest(TestCase):
+    """
+    Soft-deleted models index live rows only, with the predicate the default
+    manager filters on.
+    """
+
+    def test_live_indexes_are_partial(self):
+        for model in apps.get_models():
+            if not issubclass(model, SoftDeleteModel):
+                continue
+            live = [
+                index
+                for index in model._meta.indexes
+                if index.name.endswith("_live")
+            ]
+            with self.subTest(model.__name__):
+                self.assertEqual(len(live), len(model.live_indexes))
+                for index in live:
+                    self.assertEqual(index.condition, Q(is_deleted=False))
+                    self.assertLessEqual(len(index.name), 30)
+
+    def test_list_queries_use_live_indexes(self):
+        queries = [
+            Child.objects.order_by("-created_on")[:10],
+            Child.objects.filter(status=Child.ACTIVE).order_by("-created_on")[:10],
+            ChildProgress.objects.filter(child_id=uuid.uuid4()).order_by("created_on"),
+        ]
+        for queryset in queries:
+            with self.subTest(str(queryset.query)):
+                self.assertEqual(sequential_scans(queryset), [])
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command(
+            "benchmark_soft_delete",
+            "--live=20",
+            "--shares=0,90",
+            "--repeat=1",
+            stdout=out,
+        )
+        self.assertIn("HealthRecord", out.getvalue())
+        self.assertFalse(Child.all_objects.exists())
@@ -0,0 +1,123 @@
+import datetime
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+from rest_framework import serializers
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from accounts.models import User
+from programs.models import Child, HealthRecord
+from programs.serializers import HealthRecordListSerializer
+from public_modules.models.gallery_models import GalleryCategory, GalleryMedia
+from public_modules.serializers.gallery_serializers import GalleryMediaListSerializer
+from utils.fast_json import ORJSONRenderer
+from utils.values_reader import ValuesReader
+
+
+class ValuesReaderTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            email="admin@example.com",
+            password="password123",
+            first_name="Admin",
+            last_name="User",
+        )
+        child = Child.objects.create(
+            first_name="Aline",
+            last_name="Uwase",
+            date_of_birth=datetime.date(2015, 1, 1),
+            gender=Child.FEMALE,
+            start_date=datetime.date(2023, 1, 1),
+        )
+        for index in range(5):
+            HealthRecord.objects.create(
+                child=child,
+                record_type=HealthRecord.MEDICAL_VISIT,
+                visit_date=datetime.date(2024, 1, 1) + datetime.timedelta(days=index),
+                hospital_name="King Faisal" if index % 2 else None,
+                cost=Decimal("12345.5") * index,
+            )
+        category = GalleryCategory.objects.create(name="Events")
+        for index in range(3):
+            GalleryMedia.objects.create(
+                category=category,
+                title=f"Photo {index}",
+                media_url=f"media_gallery/photo{index}.jpg",
+                uploaded_by=cls.admin,
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def assertSameOutput(self, serializer_class, queryset):
+        request = Request(APIRequestFactory().get("/"))
+        context = {"request": request}
+        expected = serializer_class(queryset, many=True, context=context).data
+
+        reader = ValuesReader(serializer_class(context=context))
+        rows = reader.rows(reader.queryset(queryset))
+        self.assertEqual(
+            ORJSONRenderer().render(rows), ORJSONRenderer().render(expected)
+        )
+
+    def test_health_record_rows_match_serializer(self):
+        self.assertSameOutput(
+            HealthRecordListSerializer,
+            HealthRecord.objects.select_related("child").order_by("visit_date"),
+        )
+
+    def test_gallery_media_rows_match_serializer(self):
+        self.assertSameOutput(
+            GalleryMediaListSerializer,
+            GalleryMedia.objects.select_related("category").order_by("title"),
+        )
+
+    def test_undeclared_method_field_is_rejected(self):
+        class Serializer(serializers.ModelSerializer):
+            summary = serializers.SerializerMethodField()
+
+            class Meta:
+                model = HealthRecord
+                fields = ["id", "summary"]
+
+            def get_summary(self, obj):
+                return obj.diagnosis
+
+        with self.assertRaises(ImproperlyConfigured):
+            ValuesReader(Serializer())
+
+    def test_list_endpoint_reads_values(self):
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+        response = client.get("/api/health-records/?ordering=visit_date")
+        self.assertEqual(response.status_code, 200)
+        expected = HealthRecordListSerializer(
+            HealthRecord.objects.order_by("visit_date")[:10], many=True
+        ).data
+        self.assertEqual(
+            ORJSONRenderer().render(response.data["results"]),
+            ORJSONRenderer().render(expected),
+        )
+
+    def test_keyset_pages_over_values_rows(self):
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+        url = "/api/health-records/?paginate=cursor&page_size=2&ordering=cost"
+        seen = []
+        while url:
+            response = client.get(url)
+            self.assertEqual(response.status_code, 200)
+            seen += [row["id"] for row in response.data["results"]]
+            url = response.data["next"]
+
+        expected = [
+            str(pk)
+            for pk in HealthRecord.objects.order_by("cost", "id").values_list(
+                "pk", flat=True
+            )
+        ]
+        self.assertEqual(seen, expected)
@@ -0,0 +1,95 @@
+import datetime
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from programs.models import (
+    Child,
+    ChildProgress,
+    ProgressMedia,
+    ChildEducation,
+    EducationInstitution,
+    EducationProgram,
+)
+from programs.serializers import ChildEducationReadSerializer
+from utils.query_planner import plan_queryset
+
+
+class AutoPrefetchQueryCountTest(APITestCase):
+    LIST_URLS = [
+        "/api/children/",
+        "/api/children_progress/",
+        "/api/children_educational_institutions/",
+        "/api/children_educational_programs/",
+        "/api/children_programs_enrollments/",
+    ]
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com",
+            password="password123",
+            first_name="Admin",
+            last_name="User",
+        )
+        self.client.force_authenticate(user=self.admin)
+
+        for index in range(6):
+            institution = EducationInstitution.objects.create(
+                name=f"School {index}", type=EducationInstitution.SCHOOL
+            )
+            program = EducationProgram.objects.create(
+                institution=institution, program_name=f"Program {index}"
+            )
+            child = Child.objects.create(
+                first_name=f"Child{index}",
+                last_name="Test",
+                date_of_birth=datetime.date(2015, 1, 1),
+                gender=Child.FEMALE,
+                start_date=datetime.date(2023, 1, 1),
+            )
+            ChildEducation.objects.create(
+                child=child, program=program, start_date=datetime.date(2023, 1, 1)
+            )
+            for _ in range(2):
+                progress = ChildProgress.objects.create(child=child, notes="Notes")
+                ProgressMedia.objects.create(progress=progress)
+                ProgressMedia.objects.create(progress=progress)
+
+        self.child = child
+
+    def count_queries(self, url):
+        # Paginated counts are cached; measure every request cold.
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, url)
+        return len(context.captured_queries)
+
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        for url in self.LIST_URLS:
+            small = self.count_queries(f"{url}?page_size=1")
+            large = self.count_queries(f"{url}?page_size=5")
+            self.assertEqual(small, large, url)
+
+    def test_child_progress_action_prefetches_media(self):
+        url = f"/api/children/{self.child.id}/progress/"
+        small = self.count_queries(f"{url}?page_size=1")
+        large = self.count_queries(f"{url}?page_size=2")
+        self.assertEqual(small, large)
+
+    def test_plan_follows_nested_serializers(self):
+        queryset = plan_queryset(
+            ChildEducation.objects.all(), ChildEducationReadSerializer()
+        )
+        self.assertEqual(
+            queryset.query.select_related,
+            {"child": {}, "program": {"institution": {}}},
+        )
+        deferred, is_defer = queryset.query.deferred_loading
+        self.assertFalse(is_defer)
+        self.assertIn("program__institution__name", deferred)
+        self.assertNotIn("child__is_deleted", deferred)
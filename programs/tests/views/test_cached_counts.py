@@ -0,0 +1,83 @@
+import datetime
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from programs.models import Child
+
+
+class CachedCountTest(APITestCase):
+    URL = "/api/children/"
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com",
+            password="password123",
+            first_name="Admin",
+            last_name="User",
+        )
+        self.client.force_authenticate(user=self.admin)
+        for index in range(7):
+            self.create_child(index)
+
+    def create_child(self, index):
+        return Child.objects.create(
+            first_name=f"Child{index}",
+            last_name="Test",
+            date_of_birth=datetime.date(2015, 1, 1),
+            gender=Child.FEMALE,
+            start_date=datetime.date(2023, 1, 1),
+        )
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(context.captured_queries)
+
+    def test_exact_count_is_cached_until_a_save(self):
+        response, cold = self.get(self.URL)
+        self.assertEqual(response.data["count"], 7)
+        self.assertFalse(response.data["count_is_estimate"])
+
+        response, warm = self.get(self.URL)
+        self.assertEqual(response.data["count"], 7)
+        # The COUNT query, and the Last-Modified aggregate (also cached).
+        self.assertEqual(warm, cold - 2)
+
+        self.create_child(7)
+        response, _ = self.get(self.URL)
+        self.assertEqual(response.data["count"], 8)
+
+    def test_cache_is_keyed_on_filters(self):
+        self.get(self.URL)
+        response, _ = self.get(f"{self.URL}?search=Child3")
+        self.assertEqual(response.data["count"], 1)
+
+    @mock.patch("utils.paginators.count_queryset")
+    def test_keyset_pages_are_not_counted(self, count_queryset):
+        response, _ = self.get(f"{self.URL}?paginate=cursor")
+        self.assertNotIn("count", response.data)
+        self.assertEqual(len(response.data["results"]), 7)
+        count_queryset.assert_not_called()
+
+    @mock.patch("utils.counts.estimate_count", return_value=5)
+    def test_estimated_count_does_not_bound_pages(self, _):
+        response, _ = self.get(f"{self.URL}?page_size=5")
+        self.assertTrue(response.data["count_is_estimate"])
+        self.assertEqual(response.data["count"], 5)
+        self.assertIsNotNone(response.data["next"])
+
+        # Past the estimated last page, the remaining rows are still served.
+        response, _ = self.get(f"{self.URL}?page_size=5&page=2")
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNone(response.data["next"])
+
+        response = self.client.get(f"{self.URL}?page_size=5&page=3")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
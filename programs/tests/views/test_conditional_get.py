@@ -0,0 +1,145 @@
+import datetime
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework import serializers, status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from programs.models import Child
+from programs.serializers import ChildReadSerializer
+from utils.conditional_get import undeclared_method_fields
+
+
+class ConditionalGetTest(APITestCase):
+    URL = "/api/children/"
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com",
+            password="password123",
+            first_name="Admin",
+            last_name="User",
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.children = [self.create_child(index) for index in range(3)]
+
+    def create_child(self, index):
+        return Child.objects.create(
+            first_name=f"Child{index}",
+            last_name="Test",
+            date_of_birth=datetime.date(2015, 1, 1),
+            gender=Child.FEMALE,
+            start_date=datetime.date(2023, 1, 1),
+        )
+
+    def get(self, url, **headers):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, **headers)
+        return response, len(context.captured_queries)
+
+    def test_list_sends_validators(self):
+        response, _ = self.get(self.URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["ETag"].startswith('W/"'))
+        latest = max(child.updated_on for child in self.children)
+        self.assertEqual(response["Last-Modified"], http_date(latest.timestamp()))
+
+    def test_unchanged_list_is_not_modified_without_queries(self):
+        response, _ = self.get(self.URL)
+        etag = response["ETag"]
+
+        response, queries = self.get(self.URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(queries, 0)
+
+    def test_list_etag_changes_with_data_and_query(self):
+        etag = self.get(self.URL)[0]["ETag"]
+
+        response, _ = self.get(f"{self.URL}?search=Child1", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.children[0].delete()
+        response, _ = self.get(self.URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_ignores_if_modified_since_alone(self):
+        last_modified = self.get(self.URL)[0]["Last-Modified"]
+        response, _ = self.get(self.URL, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_unchanged_detail_is_not_modified_with_one_query(self):
+        url = f"{self.URL}{self.children[0].pk}/"
+        response, _ = self.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        response, queries = self.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(queries, 1)
+
+        response, _ = self.get(
+            url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_detail_etag_changes_when_the_row_changes(self):
+        child = self.children[0]
+        url = f"{self.URL}{child.pk}/"
+        etag = self.get(url)[0]["ETag"]
+
+        # Other rows of the table do not affect the detail.
+        self.children[1].save()
+        response, _ = self.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        child.first_name = "Renamed"
+        child.save()
+        response, _ = self.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["first_name"], "Renamed")
+
+    def test_missing_detail_is_not_found(self):
+        response, _ = self.get(
+            f"{self.URL}00000000-0000-0000-0000-000000000000/",
+            HTTP_IF_NONE_MATCH='W/"anything"',
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_etag_changes_with_the_date(self):
+        url = f"{self.URL}{self.children[0].pk}/"
+        etag = self.get(url)[0]["ETag"]
+
+        tomorrow = timezone.localtime() + datetime.timedelta(days=1)
+        with mock.patch("django.utils.timezone.localtime", return_value=tomorrow):
+            response, _ = self.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_undeclared_method_fields_disable_validators(self):
+        class Serializer(serializers.ModelSerializer):
+            nickname = serializers.SerializerMethodField()
+            child = ChildReadSerializer(source="*", read_only=True)
+
+            class Meta:
+                model = Child
+                fields = ["id", "nickname", "child"]
+
+        self.assertEqual(undeclared_method_fields(Serializer()), ["nickname"])
+        Serializer.Meta.field_sources = {"nickname": ["first_name"]}
+        self.assertEqual(undeclared_method_fields(Serializer()), [])
+
+        with mock.patch(
+            "utils.conditional_get.undeclared_method_fields", return_value=["x"]
+        ):
+            response, _ = self.get(self.URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("ETag", response)
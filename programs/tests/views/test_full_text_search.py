@@ -0,0 +1,87 @@
+import datetime
+from decimal import Decimal
+from unittest import skipUnless
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from programs.models import Child, ChildProgress, HealthRecord
+from utils.postgres import is_postgres
+
+
+class FullTextSearchTest(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com",
+            password="password123",
+            first_name="Admin",
+            last_name="User",
+        )
+        self.client.force_authenticate(user=self.admin)
+
+        self.child = Child.objects.create(
+            first_name="Aline",
+            last_name="Test",
+            date_of_birth=datetime.date(2015, 1, 1),
+            gender=Child.FEMALE,
+            start_date=datetime.date(2023, 1, 1),
+        )
+        self.malaria = self.record(diagnosis="Malaria", treatment="Coartem")
+        self.mention = self.record(
+            diagnosis="Fever", description="Tested negative for malaria"
+        )
+        self.flu = self.record(diagnosis="Influenza", treatment="Rest")
+
+        ChildProgress.objects.create(child=self.child, notes="Reads fluently now")
+        ChildProgress.objects.create(child=self.child, notes="Started swimming")
+
+    def record(self, **fields):
+        return HealthRecord.objects.create(
+            child=self.child,
+            record_type=HealthRecord.ILLNESS,
+            visit_date=datetime.date(2025, 1, 1),
+            cost=Decimal("1000.00"),
+            **fields,
+        )
+
+    def result_ids(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [row["id"] for row in response.data["results"]]
+
+    def test_by_condition_matches_every_text_column(self):
+        response = self.client.get("/api/health-records/by_condition/?condition=malaria")
+        self.assertCountEqual(
+            self.result_ids(response), [str(self.malaria.id), str(self.mention.id)]
+        )
+
+    def test_by_condition_skips_the_hospital_name(self):
+        self.record(diagnosis="Checkup", hospital_name="Malaria Centre")
+        response = self.client.get("/api/health-records/by_condition/?condition=malaria")
+        self.assertCountEqual(
+            self.result_ids(response), [str(self.malaria.id), str(self.mention.id)]
+        )
+
+    def test_search_filter_keeps_related_fields(self):
+        response = self.client.get("/api/health-records/?search=influenza")
+        self.assertEqual(self.result_ids(response), [str(self.flu.id)])
+
+        response = self.client.get("/api/health-records/?search=aline")
+        self.assertEqual(len(self.result_ids(response)), 3)
+
+    def test_progress_notes_are_searchable(self):
+        response = self.client.get("/api/children_progress/?search=swim")
+        self.assertEqual(len(self.result_ids(response)), 1)
+
+    @skipUnless(is_postgres(), "Search vectors are only stored on PostgreSQL")
+    def test_vector_is_maintained_and_results_ranked(self):
+        self.malaria.refresh_from_db()
+        self.assertIsNotNone(self.malaria.search_vector)
+
+        response = self.client.get("/api/health-records/by_condition/?condition=malaria")
+        self.assertEqual(self.result_ids(response)[0], str(self.malaria.id))
+
+        self.flu.diagnosis = "Malaria"
+        self.flu.save()
+        response = self.client.get("/api/health-records/by_condition/?condition=malaria")
+        self.assertEqual(len(self.result_ids(response)), 3)
@@ -0,0 +1,84 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import serializers, status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from programs.models import Child, ChildCaretakerAssignment
+from programs.seed import seed_dataset
+from programs.serializers import ChildReadSerializer
+from utils.query_audit import DeferredLoadError, forbid_deferred_loads
+from utils.query_planner import defer_heavy_fields, heavy_field_deferrals
+
+
+class HeavyFieldsTest(APITestCase):
+    ASSIGNMENTS_URL = "/api/children-caretaker/"
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com",
+            password="password123",
+            first_name="Admin",
+            last_name="User",
+        )
+        self.client.force_authenticate(user=self.admin)
+        seed_dataset(2, self.admin)
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [query["sql"] for query in context.captured_queries]
+
+    def select(self, queries):
+        # The row query joins the child; the count and validator queries do not.
+        return next(sql for sql in queries if 'JOIN "children"' in sql)
+
+    def test_list_defers_heavy_fields_of_joined_models(self):
+        with forbid_deferred_loads():
+            queries = self.get(self.ASSIGNMENTS_URL)
+        select = self.select(queries)
+        self.assertIn('"children"."first_name"', select)
+        self.assertNotIn('"children"."story"', select)
+
+    def test_retrieve_loads_heavy_fields(self):
+        assignment = ChildCaretakerAssignment.objects.first()
+        queries = self.get(f"{self.ASSIGNMENTS_URL}{assignment.pk}/")
+        self.assertIn('"children"."story"', self.select(queries))
+
+    def test_rendered_heavy_fields_are_kept(self):
+        self.assertEqual(
+            heavy_field_deferrals(ChildReadSerializer(), Child.objects.all()), []
+        )
+
+        class Serializer(serializers.ModelSerializer):
+            class Meta:
+                model = Child
+                fields = ["id", "first_name"]
+
+        self.assertEqual(
+            heavy_field_deferrals(Serializer(), Child.objects.all()), ["story"]
+        )
+
+    def test_guard_fails_on_lazy_load(self):
+        class Serializer(serializers.ModelSerializer):
+            excerpt = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Child
+                fields = ["id", "excerpt"]
+
+            def get_excerpt(self, obj):
+                return (obj.story or "")[:20]
+
+        queryset = defer_heavy_fields(Child.objects.all(), Serializer())
+        with forbid_deferred_loads(), self.assertRaises(DeferredLoadError):
+            Serializer(queryset, many=True).data
+
+        # Declaring what the method reads keeps the column loaded.
+        Serializer.Meta.field_sources = {"excerpt": ["story"]}
+        queryset = defer_heavy_fields(Child.objects.all(), Serializer())
+        with forbid_deferred_loads():
+            Serializer(queryset, many=True).data
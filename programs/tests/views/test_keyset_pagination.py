@@ -0,0 +1,100 @@
+import datetime
+from decimal import Decimal
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from programs.models import Child, HealthRecord
+
+
+class KeysetPaginationTest(APITestCase):
+    URL = "/api/health-records/"
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com",
+            password="password123",
+            first_name="Admin",
+            last_name="User",
+        )
+        self.client.force_authenticate(user=self.admin)
+
+        child = Child.objects.create(
+            first_name="Keyset",
+            last_name="Child",
+            date_of_birth=datetime.date(2015, 1, 1),
+            gender=Child.MALE,
+            start_date=datetime.date(2023, 1, 1),
+        )
+        hospitals = ["CHUK", None, "King Faisal", None, "CHUK", "Muhima", None]
+        for index in range(14):
+            HealthRecord.objects.create(
+                child=child,
+                record_type=HealthRecord.MEDICAL_VISIT,
+                visit_date=datetime.date(2024, 1, 1 + index % 4),
+                hospital_name=hospitals[index % len(hospitals)],
+                cost=Decimal(index % 3),
+            )
+
+    def walk(self, query):
+        pages = []
+        url = f"{self.URL}?paginate=cursor&page_size=4&{query}"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.data)
+            url = response.data["next"]
+        return pages
+
+    def expected_ids(self, ordering):
+        field = ordering.lstrip("-")
+
+        def key(record):
+            value = getattr(record, field)
+            # NULLs sort after every value: last ascending, first descending.
+            # Ties fall back to the id in the same direction.
+            return (value is None, "" if value is None else value, str(record.id))
+
+        records = sorted(
+            HealthRecord.objects.all(), key=key, reverse=ordering.startswith("-")
+        )
+        return [str(record.id) for record in records]
+
+    def test_pages_cover_every_row_once_in_order(self):
+        for ordering in ["-visit_date", "cost", "hospital_name", "-hospital_name"]:
+            pages = self.walk(f"ordering={ordering}")
+            ids = [row["id"] for page in pages for row in page["results"]]
+            self.assertEqual(len(ids), 14, ordering)
+            self.assertEqual(len(set(ids)), 14, ordering)
+
+            self.assertEqual(ids, self.expected_ids(ordering), ordering)
+
+    def test_previous_link_returns_the_previous_page(self):
+        pages = self.walk("ordering=hospital_name")
+        second = self.client.get(pages[1]["next"]).data
+        back = self.client.get(second["previous"]).data
+        self.assertEqual(back["results"], pages[1]["results"])
+
+    def test_envelope(self):
+        data = self.walk("")[0]
+        self.assertEqual(list(data), ["page_size", "next", "previous", "results"])
+        self.assertIsNone(data["previous"])
+
+    def test_seek_bounds_the_leading_column(self):
+        first = self.client.get(
+            f"{self.URL}?paginate=cursor&page_size=4&ordering=-visit_date"
+        ).data
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(first["next"])
+        sql = next(
+            query["sql"]
+            for query in context.captured_queries
+            if "health_records" in query["sql"] and "LIMIT" in query["sql"]
+        )
+        self.assertIn('"visit_date" <=', sql)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(f"{self.URL}?paginate=cursor&cursor=garbage")
+        self.assertEqual(response.status_code, 404)
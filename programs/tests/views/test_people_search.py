@@ -0,0 +1,100 @@
+import datetime
+from unittest import skipUnless
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from donations.models import Donor
+from programs.models import Caretaker, Child, Family, SponsoredChild
+from utils.postgres import is_postgres
+
+
+class PeopleSearchTest(APITestCase):
+    URL = "/api/search/"
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com",
+            password="password123",
+            first_name="Admin",
+            last_name="User",
+        )
+        self.client.force_authenticate(user=self.admin)
+
+        self.child = Child.objects.create(
+            first_name="Uwimana",
+            last_name="Aline",
+            date_of_birth=datetime.date(2015, 1, 1),
+            gender=Child.FEMALE,
+            start_date=datetime.date(2023, 1, 1),
+        )
+        Caretaker.objects.create(
+            first_name="Mukamana",
+            last_name="Grace",
+            phone="0788123456",
+            hire_date=datetime.date(2020, 1, 1),
+        )
+        family = Family.objects.create(
+            family_name="Uwimana",
+            address="Kigali",
+            province="Kigali",
+            district="Gasabo",
+            sector="Remera",
+            cell="Rukiri",
+            village="Amahoro",
+        )
+        SponsoredChild.objects.create(
+            family=family,
+            first_name="Uwimana",
+            last_name="Eric",
+            date_of_birth=datetime.date(2014, 1, 1),
+            gender=SponsoredChild.MALE,
+        )
+        Donor.objects.create(fullname="Aline Foundation", email="aline@donor.org")
+
+    def search(self, query, user=None, **params):
+        if user is not None:
+            self.client.force_authenticate(user=user)
+        response = self.client.get(self.URL, {"q": query, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_hits_are_typed_across_programs(self):
+        data = self.search("uwimana")
+        self.assertCountEqual(
+            [hit["type"] for hit in data["results"]], ["child", "ifashe_child"]
+        )
+        child = next(hit for hit in data["results"] if hit["type"] == "child")
+        self.assertEqual(child["id"], str(self.child.id))
+        self.assertEqual(child["title"], "Uwimana Aline")
+        self.assertEqual(child["url"], f"/api/children/{self.child.id}/")
+
+    def test_every_word_must_match(self):
+        data = self.search("aline uwimana")
+        self.assertEqual([hit["type"] for hit in data["results"]], ["child"])
+
+    def test_phone_and_type_filter(self):
+        data = self.search("0788123", types="caretaker,donor")
+        self.assertEqual([hit["type"] for hit in data["results"]], ["caretaker"])
+
+    def test_results_are_limited_to_permitted_programs(self):
+        manager = User.objects.create_user(
+            email="ifashe@example.com",
+            password="password123",
+            first_name="Ifashe",
+            last_name="Manager",
+            phone="0788000000",
+            role=User.IFASHE_MANAGER,
+        )
+        data = self.search("aline", user=manager)
+        self.assertNotIn("child", data["types"])
+        self.assertEqual([hit["type"] for hit in data["results"]], ["donor"])
+
+    def test_empty_query(self):
+        self.assertEqual(self.search("")["results"], [])
+
+    @skipUnless(is_postgres(), "Trigram similarity needs PostgreSQL")
+    def test_misspelled_names_match_by_similarity(self):
+        data = self.search("uwimanna")
+        self.assertIn("child", [hit["type"] for hit in data["results"]])
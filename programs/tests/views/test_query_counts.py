@@ -0,0 +1,127 @@
+from django.db import transaction
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from accounts.urls import router as accounts_router
+from donations.urls import router as donations_router
+from programs.models import Family
+from programs.seed import seed_dataset
+from programs.urls import router as programs_router
+from public_modules.urls import router as public_modules_router
+from utils.query_audit import (
+    QueryAuditMixin,
+    QueryRecorder,
+    forbid_deferred_loads,
+)
+
+
+ROUTERS = [
+    ("/api/", accounts_router),
+    ("/api/", programs_router),
+    ("/api/", public_modules_router),
+    ("/api/donations/", donations_router),
+]
+
+SMALL = 2
+LARGE = 4
+
+
+def iter_endpoints():
+    """
+    Yield (label, url builder) for every GET endpoint registered on the
+    routers: list, detail and extra actions.
+    """
+    for mount, router in ROUTERS:
+        for prefix, viewset, basename in router.registry:
+            base = f"{mount}{prefix}/"
+            model = viewset.queryset.model if viewset.queryset is not None else None
+            actions = [
+                action
+                for action in viewset.get_extra_actions()
+                if "get" in action.mapping
+            ]
+
+            if hasattr(viewset, "list"):
+                yield f"{basename}-list", lambda base=base: base
+
+            if model is not None and hasattr(viewset, "retrieve"):
+                yield f"{basename}-detail", (
+                    lambda base=base, model=model: f"{base}{_first_pk(model)}/"
+                )
+
+            for action in actions:
+                label = f"{basename}-{action.url_path}"
+                if action.detail:
+                    if model is None:
+                        continue
+                    yield label, (
+                        lambda base=base, model=model, path=action.url_path: (
+                            f"{base}{_first_pk(model)}/{path}/"
+                        )
+                    )
+                else:
+                    yield label, lambda base=base, path=action.url_path: (
+                        f"{base}{path}/"
+                    )
+
+
+def _first_pk(model):
+    return model._default_manager.order_by("pk").values_list("pk", flat=True)[0]
+
+
+class EndpointQueryCountTest(QueryAuditMixin, APITestCase):
+    """
+    Hits every router GET endpoint with two dataset sizes and fails if the
+    number of queries depends on the amount of data.
+    """
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com",
+            password="password123",
+            first_name="Admin",
+            last_name="User",
+        )
+        self.client.force_authenticate(user=self.admin)
+
+    def measure(self, size):
+        recorders = {}
+        with transaction.atomic():
+            seed_dataset(size, self.admin)
+            for label, build_url in iter_endpoints():
+                url = build_url()
+                # A deferred field read per row is an N+1 as well.
+                with QueryRecorder() as recorder, forbid_deferred_loads():
+                    response = self.client.get(url)
+                self.assertLess(response.status_code, 500, f"{label}: {url}")
+                recorders[label] = recorder
+            transaction.set_rollback(True)
+        return recorders
+
+    def test_query_count_does_not_grow_with_data(self):
+        small = self.measure(SMALL)
+        large = self.measure(LARGE)
+
+        failures = []
+        for label, recorder in large.items():
+            try:
+                self.assertQueryCountStable(small[label], recorder, label)
+            except AssertionError as error:
+                failures.append(str(error))
+
+        if failures:
+            self.fail("\n\n".join(failures))
+
+    def test_recorder_reports_repeated_query_shapes(self):
+        seed_dataset(SMALL, self.admin)
+
+        with QueryRecorder() as recorder:
+            for family in Family.objects.all():
+                family.parents.count()
+
+        [(shape, count)] = recorder.repeated()
+        self.assertEqual(count, SMALL)
+        self.assertIn('FROM "parents"', shape)
+        self.assertIn("likely N+1", recorder.report())
+        with self.assertRaises(AssertionError):
+            recorder.assert_no_repeats()
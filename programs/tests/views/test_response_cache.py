@@ -0,0 +1,143 @@
+from django.core.cache import cache
+from django.db import connection
+from django.db.models.deletion import Collector
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User, VerificationCode
+from programs.models import EducationInstitution, EducationProgram
+from public_modules.models.gallery_models import GalleryCategory
+from utils.model_versions import bump_version, get_versions
+
+
+class ResponseCacheTest(APITestCase):
+    URL = "/api/children_educational_institutions/"
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com",
+            password="password123",
+            first_name="Admin",
+            last_name="User",
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.institution = EducationInstitution.objects.create(
+            name="Green Hills", type=EducationInstitution.SCHOOL
+        )
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(context.captured_queries)
+
+    def names(self, response):
+        return [row["name"] for row in response.data["results"]]
+
+    def test_second_request_is_served_from_the_cache(self):
+        response, cold = self.get(self.URL)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertGreater(cold, 0)
+
+        response, warm = self.get(self.URL)
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(warm, 0)
+        self.assertEqual(self.names(response), ["Green Hills"])
+
+    def test_save_invalidates(self):
+        self.get(self.URL)
+        self.institution.name = "Blue Hills"
+        self.institution.save()
+
+        response, _ = self.get(self.URL)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(self.names(response), ["Blue Hills"])
+
+    def test_queryset_update_with_version_bump_invalidates(self):
+        self.get(self.URL)
+        EducationInstitution.objects.update(name="Renamed")
+        bump_version(EducationInstitution)
+
+        response, _ = self.get(self.URL)
+        self.assertEqual(self.names(response), ["Renamed"])
+
+    def test_dependency_change_invalidates_action(self):
+        url = f"{self.URL}{self.institution.pk}/programs/"
+        response, _ = self.get(url)
+        self.assertEqual(response.data, [])
+
+        EducationProgram.objects.create(
+            institution=self.institution,
+            program_name="Carpentry",
+            program_level="Level 1",
+            cost=100,
+        )
+        response, _ = self.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(len(response.data), 1)
+
+    def test_key_depends_on_query_params(self):
+        self.get(self.URL)
+        response, _ = self.get(f"{self.URL}?search=Nothing")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"], [])
+
+        response, _ = self.get(f"{self.URL}?search=Nothing")
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_key_depends_on_role(self):
+        self.get(self.URL)
+        manager = User.objects.create_user(
+            email="manager@example.com",
+            password="password123",
+            first_name="Residential",
+            last_name="Manager",
+            role=User.RESIDENTIAL_MANAGER,
+        )
+        self.client.force_authenticate(user=manager)
+        response, _ = self.get(self.URL)
+        self.assertEqual(response["X-Cache"], "MISS")
+
+    def test_anonymous_and_authenticated_are_cached_apart(self):
+        GalleryCategory.objects.create(name="Events")
+        url = "/api/gallery-categories/"
+        self.get(url)
+
+        self.client.force_authenticate(user=None)
+        response, _ = self.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        response, _ = self.get(url)
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_writes_are_not_cached(self):
+        response = self.client.post(
+            self.URL, {"name": "Sunrise", "type": EducationInstitution.SCHOOL}
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn("X-Cache", response)
+
+
+class ModelVersionsTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+
+    def version(self, model):
+        return get_versions([model._meta.db_table])[model._meta.db_table]
+
+    def test_only_models_read_by_views_are_tracked(self):
+        collector = Collector(using="default")
+        self.assertTrue(collector.can_fast_delete(VerificationCode.objects.all()))
+        self.assertFalse(collector.can_fast_delete(EducationProgram.objects.all()))
+        self.assertIsNone(get_versions([VerificationCode._meta.db_table]))
+        self.assertIsNotNone(get_versions(["custom-counter"]))
+
+    def test_bumped_again_on_commit(self):
+        before = self.version(EducationInstitution)
+        with self.captureOnCommitCallbacks(execute=True):
+            EducationInstitution.objects.create(
+                name="Green Hills", type=EducationInstitution.SCHOOL
+            )
+            self.assertEqual(self.version(EducationInstitution), before + 1)
+        self.assertEqual(self.version(EducationInstitution), before + 2)
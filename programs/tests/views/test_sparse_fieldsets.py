@@ -0,0 +1,96 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from programs.models import SchoolSupport
+from programs.seed import seed_dataset
+
+
+class SparseFieldsetTest(APITestCase):
+    CHILDREN_URL = "/api/children/"
+    SUPPORT_URL = "/api/ifashe-school-support/"
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com",
+            password="password123",
+            first_name="Admin",
+            last_name="User",
+        )
+        self.client.force_authenticate(user=self.admin)
+        seed_dataset(2, self.admin)
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        return response, [query["sql"] for query in context.captured_queries]
+
+    def rows(self, response):
+        return response.data["results"]
+
+    def test_fields_limits_the_payload_and_the_columns(self):
+        response, queries = self.get(f"{self.CHILDREN_URL}?fields=id,first_name")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for row in self.rows(response):
+            self.assertEqual(set(row), {"id", "first_name"})
+
+        select = next(sql for sql in queries if 'FROM "children"' in sql)
+        self.assertNotIn('"story"', select)
+        self.assertNotIn('"special_needs"', select)
+
+    def test_omit_drops_fields(self):
+        response, queries = self.get(f"{self.CHILDREN_URL}?omit=story,special_needs")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        row = self.rows(response)[0]
+        self.assertNotIn("story", row)
+        self.assertIn("first_name", row)
+
+        select = next(sql for sql in queries if 'FROM "children"' in sql)
+        self.assertNotIn('"story"', select)
+
+    def test_unknown_field_is_rejected(self):
+        response, _ = self.get(f"{self.CHILDREN_URL}?fields=id,nickname")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response, _ = self.get(f"{self.CHILDREN_URL}?expand=story")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_payments_are_expanded_on_request(self):
+        response, _ = self.get(self.SUPPORT_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        row = self.rows(response)[0]
+        self.assertNotIn("payments", row)
+        self.assertEqual(row["total_paid"], 10000)
+
+        response, _ = self.get(f"{self.SUPPORT_URL}?expand=payments")
+        self.assertEqual(len(self.rows(response)[0]["payments"]), 1)
+
+    def test_fields_expands_the_fields_it_names(self):
+        response, _ = self.get(f"{self.SUPPORT_URL}?fields=id,payments")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        row = self.rows(response)[0]
+        self.assertEqual(set(row), {"id", "payments"})
+        self.assertEqual(len(row["payments"]), 1)
+
+    def test_detail_renders_expandable_fields(self):
+        support = SchoolSupport.objects.first()
+        response, _ = self.get(f"{self.SUPPORT_URL}{support.pk}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("payments", response.data)
+
+    def test_collapsed_payments_are_not_loaded(self):
+        # total_paid and balance_due are stored on the support.
+        _, queries = self.get(self.SUPPORT_URL)
+        self.assertFalse(any('FROM "school_payments"' in sql for sql in queries))
+
+    def test_writes_ignore_fieldsets(self):
+        support = SchoolSupport.objects.first()
+        response = self.client.patch(
+            f"{self.SUPPORT_URL}{support.pk}/?fields=id", {"notes": "Paid late"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["notes"], "Paid late")
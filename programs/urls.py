@@ -31,7 +31,8 @@ from .views import (
     ResidentialFinanceExcelReportView,
     ResidentialFinancePDFReportView,
     InternshipApplicationViewSet,
-    ChildCaretakerAssignmentViewSet
+    ChildCaretakerAssignmentViewSet,
+    PeopleSearchView,
 )
 
 router = DefaultRouter()
@@ -94,6 +95,7 @@ urlpatterns = router.urls
 
 
 urlpatterns += [
+    path("search/", PeopleSearchView.as_view(), name="people-search"),
     path(
         "ifashe/reports/families/pdf/",
         FamilyOverviewPDFReportView.as_view(),
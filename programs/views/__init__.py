@@ -44,6 +44,9 @@ from programs.views.ifashe_views.all_reports_views import (
     ParentWorkExcelReportView,
 )
 
+# Search Views
+from programs.views.search_views import PeopleSearchView
+
 # Internships Views
 from programs.views.internships_views.application_views import (
     InternshipApplicationViewSet,
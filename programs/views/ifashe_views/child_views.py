@@ -13,11 +13,19 @@ from accounts.permissions import IsIfasheManager
 from utils.bulk_operations.mixins import BulkActionMixin
 from utils.bulk_operations.tasks import generic_bulk_task
 from utils.bulk_operations.serializers import BulkActionSerializer
+from utils.query_planner import AutoPrefetchMixin, DeferHeavyFieldsMixin
+from utils.conditional_get import ConditionalGetMixin
 
 
 @extend_schema(tags=["IfasheTugufashe Program"])
-class IfasheChildViewSet(BulkActionMixin, viewsets.ModelViewSet):
-    queryset = SponsoredChild.objects.all().select_related("family")
+class IfasheChildViewSet(
+    ConditionalGetMixin,
+    DeferHeavyFieldsMixin,
+    AutoPrefetchMixin,
+    BulkActionMixin,
+    viewsets.ModelViewSet,
+):
+    queryset = SponsoredChild.objects.all()
     serializer_class = IfasheChildSerializer
     permission_classes = [IsIfasheManager]
 
@@ -135,7 +143,9 @@ class IfasheChildViewSet(BulkActionMixin, viewsets.ModelViewSet):
 
 
 @extend_schema(tags=["IfasheTugufashe Program"])
-class DressingDistributionViewSet(BulkActionMixin, viewsets.ModelViewSet):
+class DressingDistributionViewSet(
+    ConditionalGetMixin, BulkActionMixin, viewsets.ModelViewSet
+):
     queryset = DressingDistribution.objects.select_related("child")
     serializer_class = DressingDistributionSerializer
     permission_classes = [IsIfasheManager]
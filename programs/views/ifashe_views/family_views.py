@@ -13,6 +13,8 @@ from drf_spectacular.utils import extend_schema, inline_serializer
 from utils.bulk_operations.mixins import BulkActionMixin
 from utils.bulk_operations.tasks import generic_bulk_task
 from utils.bulk_operations.serializers import BulkActionSerializer
+from utils.query_planner import AutoPrefetchMixin
+from utils.conditional_get import ConditionalGetMixin
 
 
 logger = logging.getLogger(__name__)
@@ -21,8 +23,10 @@ logger = logging.getLogger(__name__)
 @extend_schema(
     tags=["IfasheTugufashe Program"],
 )
-class IfasheFamilyViewSet(BulkActionMixin, viewsets.ModelViewSet):
-    queryset = Family.objects.all().prefetch_related("parents", "children")
+class IfasheFamilyViewSet(
+    ConditionalGetMixin, AutoPrefetchMixin, BulkActionMixin, viewsets.ModelViewSet
+):
+    queryset = Family.objects.all()
     serializer_class = IfasheFamilySerializer
     permission_classes = [IsIfasheManager]
     filter_backends = [
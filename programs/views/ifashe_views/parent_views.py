@@ -21,6 +21,7 @@ from programs.serializers.ifashe_serializers import (
 from accounts.permissions import IsIfasheManager
 from drf_spectacular.utils import extend_schema, inline_serializer
 from utils.bulk_operations.serializers import BulkActionSerializer
+from utils.conditional_get import ConditionalGetMixin
 
 
 logger = logging.getLogger(__name__)
@@ -29,7 +30,7 @@ logger = logging.getLogger(__name__)
 @extend_schema(
     tags=["IfasheTugufashe Program"],
 )
-class IfasheParentViewSet(BulkActionMixin, viewsets.ModelViewSet):
+class IfasheParentViewSet(ConditionalGetMixin, BulkActionMixin, viewsets.ModelViewSet):
     queryset = Parent.objects.all().select_related("family")
     serializer_class = IfasheParentSerializer
     permission_classes = [IsIfasheManager]
@@ -120,7 +121,9 @@ class IfasheParentViewSet(BulkActionMixin, viewsets.ModelViewSet):
 @extend_schema(
     tags=["IfasheTugufashe Program"],
 )
-class ParentWorkContractViewSet(BulkActionMixin, viewsets.ModelViewSet):
+class ParentWorkContractViewSet(
+    ConditionalGetMixin, BulkActionMixin, viewsets.ModelViewSet
+):
     queryset = ParentWorkContract.objects.select_related("parent")
     serializer_class = ParentWorkContractSerializer
     permission_classes = [IsIfasheManager]
@@ -135,7 +138,9 @@ class ParentWorkContractViewSet(BulkActionMixin, viewsets.ModelViewSet):
 @extend_schema(
     tags=["IfasheTugufashe Program"],
 )
-class ParentAttendanceViewSet(BulkActionMixin, viewsets.ModelViewSet):
+class ParentAttendanceViewSet(
+    ConditionalGetMixin, BulkActionMixin, viewsets.ModelViewSet
+):
     queryset = ParentAttendance.objects.select_related(
         "work_record", "work_record__parent"
     )
@@ -152,7 +157,7 @@ class ParentAttendanceViewSet(BulkActionMixin, viewsets.ModelViewSet):
 @extend_schema(
     tags=["IfasheTugufashe Program"],
 )
-class ParentPerformanceViewSet(viewsets.ModelViewSet):
+class ParentPerformanceViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = ParentPerformance.objects.select_related(
         "work_record", "work_record__parent", "evaluated_by"
     )
@@ -2,24 +2,44 @@ from rest_framework import viewsets, filters, status, serializers
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db import models
+from django.utils import timezone
 from drf_spectacular.utils import extend_schema, inline_serializer
 
-from programs.models.ifashe_models import SchoolSupport
+from programs.models.ifashe_models import (
+    School,
+    SchoolPayment,
+    SchoolSupport,
+    SponsoredChild,
+)
 from programs.serializers.ifashe_serializers import (
     SchoolSupportSerializer,
     SchoolPaymentSerializer,
+    SchoolPaymentBatchSerializer,
+    SchoolYearGenerationSerializer,
 )
+from programs.tasks import generate_school_supports_task
 from accounts.permissions import IsIfasheManager
 
 from utils.bulk_operations.mixins import BulkActionMixin
 from utils.bulk_operations.tasks import generic_bulk_task
 from utils.bulk_operations.serializers import BulkActionSerializer
+from utils.query_planner import AutoPrefetchMixin
+from utils.response_cache import CachedResponseMixin
+from utils.conditional_get import ConditionalGetMixin
+from utils.filters.school_support_filters import SchoolSupportFilter
+from utils.school_ledger import record_payments
 
 
 @extend_schema(tags=["IfasheTugufashe Program"])
-class SchoolSupportViewSet(BulkActionMixin, viewsets.ModelViewSet):
-    queryset = SchoolSupport.objects.all().prefetch_related("payments")
+class SchoolSupportViewSet(
+    ConditionalGetMixin,
+    CachedResponseMixin,
+    AutoPrefetchMixin,
+    BulkActionMixin,
+    viewsets.ModelViewSet,
+):
+    queryset = SchoolSupport.objects.all()
+    cache_dependencies = [SchoolSupport, SchoolPayment, SponsoredChild, School]
     serializer_class = SchoolSupportSerializer
     permission_classes = [IsIfasheManager]
 
@@ -28,12 +48,14 @@ class SchoolSupportViewSet(BulkActionMixin, viewsets.ModelViewSet):
         filters.SearchFilter,
         filters.OrderingFilter,
     ]
-    filterset_fields = ["payment_status", "academic_year", "school"]
+    filterset_class = SchoolSupportFilter
     search_fields = ["child__first_name", "child__last_name", "school__name"]
-    ordering_fields = ["created_on", "academic_year"]
+    ordering_fields = ["created_on", "academic_year", "total_cost", "balance_due"]
 
     bulk_max_size = 200
     bulk_async_threshold = 30
+    # Moved by payments only (see utils.school_ledger).
+    bulk_protected_fields = ("payment_status", "total_paid")
 
     @action(detail=True, methods=["post"])
     def add_payment(self, request, pk=None):
@@ -41,20 +63,102 @@ class SchoolSupportViewSet(BulkActionMixin, viewsets.ModelViewSet):
         serializer = SchoolPaymentSerializer(data=request.data)
 
         if serializer.is_valid():
+            # Posts the amount and the new status to the support.
             serializer.save(school_support=school_support)
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
 
-            total_paid = (
-                school_support.payments.aggregate(total=models.Sum("amount"))["total"]
-                or 0
-            )
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-            if school_support.total_cost - total_paid <= 0:
-                school_support.payment_status = SchoolSupport.PAID
-                school_support.save(update_fields=["payment_status"])
+    @extend_schema(
+        description="Record payments for several supports in one transaction.",
+        request=SchoolPaymentBatchSerializer,
+        responses={
+            201: inline_serializer(
+                name="SchoolPaymentBatchResponse",
+                fields={
+                    "count": serializers.IntegerField(),
+                    "payments": SchoolPaymentSerializer(many=True),
+                },
+            ),
+        },
+    )
+    @action(detail=False, methods=["post"])
+    def add_payments(self, request):
+        serializer = SchoolPaymentBatchSerializer(
+            data=request.data, context={"max_bulk_size": self.bulk_max_size}
+        )
+        serializer.is_valid(raise_exception=True)
+        payments = record_payments(serializer.validated_data["payments"])
+        return Response(
+            {
+                "count": len(payments),
+                "payments": SchoolPaymentSerializer(payments, many=True).data,
+            },
+            status=status.HTTP_201_CREATED,
+        )
 
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+    @extend_schema(
+        description=(
+            "Generate the supports of an academic year for every active "
+            "sponsored child, from a fee schedule per school and level. "
+            "Runs as a background job."
+        ),
+        request=SchoolYearGenerationSerializer,
+        responses={
+            202: inline_serializer(
+                name="SchoolYearGenerationResponse",
+                fields={
+                    "message": serializers.CharField(),
+                    "academic_year": serializers.CharField(),
+                    "task_id": serializers.CharField(),
+                    "async": serializers.BooleanField(),
+                },
+            ),
+        },
+    )
+    @action(detail=False, methods=["post"], url_path="generate-year")
+    def generate_year(self, request):
+        serializer = SchoolYearGenerationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        task = generate_school_supports_task.delay(*serializer.to_task_arguments())
+        return Response(
+            {
+                "message": "School support generation scheduled asynchronously.",
+                "academic_year": serializer.validated_data["academic_year"],
+                "task_id": task.id,
+                "async": True,
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
 
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    @extend_schema(
+        description="Status of a generation job, with its summary once done.",
+        responses={
+            200: inline_serializer(
+                name="SchoolYearGenerationStatusResponse",
+                fields={
+                    "task_id": serializers.CharField(),
+                    "status": serializers.CharField(),
+                    "summary": serializers.DictField(allow_null=True),
+                },
+            ),
+        },
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"generate-year/(?P<task_id>[^/.]+)",
+        url_name="generate-year-status",
+    )
+    def generate_year_status(self, request, task_id=None):
+        result = generate_school_supports_task.AsyncResult(task_id)
+        return Response(
+            {
+                "task_id": task_id,
+                "status": result.status,
+                "summary": result.result if result.successful() else None,
+            }
+        )
 
     @extend_schema(
         description="Bulk delete supports. by providing a list of IDs.",
@@ -112,14 +216,31 @@ class SchoolSupportViewSet(BulkActionMixin, viewsets.ModelViewSet):
     )
     @action(detail=False, methods=["post"])
     def bulk_update(self, request):
+
+        def update_costs(queryset, payload):
+            if not payload:
+                raise ValueError("Payload is required for update.")
+            count = queryset.update(**payload)
+            # The costs may have changed: derive the statuses from the totals.
+            queryset.post_payment()
+            return {
+                "message": f"{count} objects updated successfully.",
+                "action": "update",
+                "count": count,
+                "updated_fields": list(payload.keys()),
+            }
+
         return self.perform_bulk_action(
             request,
-            action_type="update",
-            async_task=generic_bulk_task,
+            action_type="custom",
+            custom_handler=update_costs,
         )
 
     @extend_schema(
-        description="Bulk mark selected supports as paid.",
+        description=(
+            "Bulk mark selected supports as paid, recording a payment of "
+            "the remaining balance of each."
+        ),
         request=BulkActionSerializer,
         responses={
             200: inline_serializer(
@@ -144,10 +265,26 @@ class SchoolSupportViewSet(BulkActionMixin, viewsets.ModelViewSet):
     def bulk_mark_paid(self, request):
 
         def mark_paid(queryset, payload):
-            count = queryset.update(payment_status=SchoolSupport.PAID)
+            # Locked so that no payment lands between reading the balances
+            # and posting them.
+            supports = list(
+                SchoolSupport.objects.select_for_update()
+                .filter(pk__in=queryset.values("pk"), balance_due__gt=0)
+                .only("pk", "balance_due")
+            )
+            payments = record_payments(
+                [
+                    {
+                        "school_support": support,
+                        "amount": support.balance_due,
+                        "date": timezone.localdate(),
+                    }
+                    for support in supports
+                ]
+            )
             return {
                 "message": "Selected supports marked as PAID.",
-                "count": count,
+                "count": len(payments),
             }
 
         return self.perform_bulk_action(
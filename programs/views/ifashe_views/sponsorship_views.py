@@ -8,6 +8,8 @@ from django.db.models import Count
 from programs.models.ifashe_models import Sponsorship
 from programs.serializers.ifashe_serializers import SponsorshipSerializer
 from accounts.permissions import IsIfasheManager
+from utils.query_planner import AutoPrefetchMixin
+from utils.conditional_get import ConditionalGetMixin
 from drf_spectacular.utils import extend_schema
 
 logger = logging.getLogger(__name__)
@@ -16,7 +18,7 @@ logger = logging.getLogger(__name__)
 @extend_schema(
     tags=["IfasheTugufashe Program"],
 )
-class SponsorshipViewSet(viewsets.ModelViewSet):
+class SponsorshipViewSet(ConditionalGetMixin, AutoPrefetchMixin, viewsets.ModelViewSet):
     queryset = Sponsorship.objects.all()
     serializer_class = SponsorshipSerializer
     permission_classes = [IsIfasheManager]
@@ -10,16 +10,20 @@ from rest_framework import serializers
 from ...models.internships_models import InternshipApplication
 from ...serializers.internships_serializers import InternshipApplicationSerializer
 from utils.paginators import StandardResultsSetPagination
+from utils.throttling import ScopedIPThrottle
 
 from utils.bulk_operations.mixins import BulkActionMixin
 from utils.bulk_operations.tasks import generic_bulk_task
 from utils.bulk_operations.serializers import BulkActionSerializer
+from utils.conditional_get import ConditionalGetMixin
 
 
 @extend_schema(
     tags=["Internship - Applications"],
 )
-class InternshipApplicationViewSet(BulkActionMixin, viewsets.ModelViewSet):
+class InternshipApplicationViewSet(
+    ConditionalGetMixin, BulkActionMixin, viewsets.ModelViewSet
+):
     queryset = InternshipApplication.objects.all().order_by("-applied_on")
     serializer_class = InternshipApplicationSerializer
     pagination_class = StandardResultsSetPagination
@@ -32,11 +36,19 @@ class InternshipApplicationViewSet(BulkActionMixin, viewsets.ModelViewSet):
     search_fields = ["first_name", "last_name", "email", "phone", "school_university"]
     ordering_fields = ["applied_on", "status"]
 
+    throttle_scope = "internship_application"
+
     def get_permissions(self):
         if self.action == "create":
             return [AllowAny()]
         return [IsAuthenticated(), IsInternshipManager()]
 
+    def get_throttles(self):
+        # Anonymous submissions upload files: throttled before the body is parsed.
+        if self.action == "create":
+            return [ScopedIPThrottle()]
+        return super().get_throttles()
+
     @extend_schema(
         description="Bulk delete internship applications by providing a list of IDs.",
         request=BulkActionSerializer,
@@ -8,11 +8,12 @@ from accounts.permissions import IsInternshipManager
 from ...models.internships_models import InternshipProgram
 from ...serializers.internships_serializers import InternshipProgramSerializer
 from utils.paginators import StandardResultsSetPagination
+from utils.conditional_get import ConditionalGetMixin
 
 @extend_schema(
     tags=["Internship - Programs"],
 )
-class InternshipProgramViewSet(viewsets.ModelViewSet):
+class InternshipProgramViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = InternshipProgram.objects.all().select_related("application", "department", "supervisor").order_by("-start_date")
     serializer_class = InternshipProgramSerializer
     pagination_class = StandardResultsSetPagination
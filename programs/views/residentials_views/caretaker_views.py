@@ -25,6 +25,7 @@ from accounts.permissions import IsResidentialManager
 from utils.bulk_operations.mixins import BulkActionMixin
 from utils.bulk_operations.tasks import generic_bulk_task
 from utils.bulk_operations.serializers import BulkActionSerializer
+from utils.conditional_get import ConditionalGetMixin
 
 
 logger = logging.getLogger(__name__)
@@ -127,13 +128,13 @@ logger = logging.getLogger(__name__)
         },
     ),
 )
-class CaretakerViewSet(BulkActionMixin, viewsets.ModelViewSet):
+class CaretakerViewSet(ConditionalGetMixin, BulkActionMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing caretakers.
     Provides CRUD operations, activation, deactivation, and statistics.
     """
 
-    queryset = Caretaker.objects.filter(deleted_on__isnull=True)
+    queryset = Caretaker.objects.all()
     permission_classes = [IsAuthenticated, IsResidentialManager]
     filter_backends = [
         DjangoFilterBackend,
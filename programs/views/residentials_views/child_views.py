@@ -5,6 +5,8 @@ from rest_framework import viewsets, status, filters, serializers
 from utils.bulk_operations.mixins import BulkActionMixin
 from utils.bulk_operations.serializers import BulkActionSerializer
 from utils.bulk_operations.tasks import generic_bulk_task
+from utils.query_planner import AutoPrefetchMixin, DeferHeavyFieldsMixin
+from utils.response_cache import CachedResponseMixin, cache_response
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
@@ -53,6 +55,8 @@ from utils.reports.general_reports import generate_child_progress_pdf
 from utils.reports.ifashe.helpers import safe_filename
 
 from utils.activity_log import record_activity
+from utils.search import FullTextSearchFilter
+from utils.conditional_get import ConditionalGetMixin
 from accounts.permissions import (
     IsResidentialManager,
 )
@@ -138,12 +142,10 @@ logger = logging.getLogger(__name__)
         },
     ),
 )
-class ChildViewSet(BulkActionMixin, viewsets.ModelViewSet):
-    queryset = (
-        Child.objects.all()
-        .select_related()
-        .prefetch_related("child_progress", "education_records")
-    )
+class ChildViewSet(
+    ConditionalGetMixin, AutoPrefetchMixin, BulkActionMixin, viewsets.ModelViewSet
+):
+    queryset = Child.objects.all()
     permission_classes = [IsAuthenticated, IsResidentialManager]
     filter_backends = [
         DjangoFilterBackend,
@@ -222,7 +224,10 @@ class ChildViewSet(BulkActionMixin, viewsets.ModelViewSet):
     @action(detail=True, methods=["get"])
     def progress(self, request, pk=None):
         child = self.get_object()
-        progress_entries = child.child_progress.all().order_by("-created_on")
+        progress_entries = self.plan_queryset(
+            child.child_progress.all().order_by("-created_on"),
+            ChildProgressReadSerializer,
+        )
 
         page = self.paginate_queryset(progress_entries)
         if page is not None:
@@ -266,7 +271,10 @@ class ChildViewSet(BulkActionMixin, viewsets.ModelViewSet):
     @action(detail=True, methods=["get"])
     def education(self, request, pk=None):
         child = self.get_object()
-        education_records = child.education_records.all().order_by("-start_date")
+        education_records = self.plan_queryset(
+            child.education_records.all().order_by("-start_date"),
+            ChildEducationReadSerializer,
+        )
         serializer = ChildEducationReadSerializer(education_records, many=True)
         return Response(serializer.data)
 
@@ -416,18 +424,25 @@ class ChildViewSet(BulkActionMixin, viewsets.ModelViewSet):
         responses={204: OpenApiResponse(description="Deleted successfully")},
     ),
 )
-class ChildProgressViewSet(viewsets.ModelViewSet):
+class ChildProgressViewSet(
+    ConditionalGetMixin,
+    DeferHeavyFieldsMixin,
+    AutoPrefetchMixin,
+    viewsets.ModelViewSet,
+):
     """
     Manage child progress CRUD
     """
 
-    queryset = ChildProgress.objects.select_related("child").prefetch_related(
-        "progress_media",
-        "child__education_records",
-    )
+    queryset = ChildProgress.objects.all()
     permission_classes = [IsAuthenticated, IsResidentialManager]
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filter_backends = [
+        DjangoFilterBackend,
+        filters.OrderingFilter,
+        FullTextSearchFilter,
+    ]
     filterset_class = ChildProgressFilter
+    search_fields = ["notes"]
     ordering_fields = ["created_on"]
     ordering = ["-created_on"]
     pagination_class = ProgressCursorPagination
@@ -564,8 +579,11 @@ class ChildProgressViewSet(viewsets.ModelViewSet):
         responses={200: EducationProgramReadSerializer(many=True)},
     ),
 )
-class EducationInstitutionViewSet(viewsets.ModelViewSet):
-    queryset = EducationInstitution.objects.all().prefetch_related("programs")
+class EducationInstitutionViewSet(
+    ConditionalGetMixin, CachedResponseMixin, AutoPrefetchMixin, viewsets.ModelViewSet
+):
+    queryset = EducationInstitution.objects.all()
+    cache_dependencies = [EducationInstitution, EducationProgram]
     serializer_class = EducationInstitutionSerializer
     permission_classes = [IsAuthenticated, IsResidentialManager]
     filter_backends = [
@@ -579,9 +597,12 @@ class EducationInstitutionViewSet(viewsets.ModelViewSet):
     pagination_class = SmallResultsSetPagination
 
     @action(detail=True, methods=["get"])
+    @cache_response
     def programs(self, request, pk=None):
         institution = self.get_object()
-        programs = institution.programs.all()
+        programs = self.plan_queryset(
+            institution.programs.all(), EducationProgramReadSerializer
+        )
 
         serializer = EducationProgramReadSerializer(programs, many=True)
         return Response(serializer.data)
@@ -590,8 +611,11 @@ class EducationInstitutionViewSet(viewsets.ModelViewSet):
 @extend_schema(
     tags=["Residential Care Program"],
 )
-class EducationProgramViewSet(viewsets.ModelViewSet):
-    queryset = EducationProgram.objects.all().select_related("institution")
+class EducationProgramViewSet(
+    ConditionalGetMixin, CachedResponseMixin, AutoPrefetchMixin, viewsets.ModelViewSet
+):
+    queryset = EducationProgram.objects.all()
+    cache_dependencies = [EducationProgram, EducationInstitution, ChildEducation, Child]
     permission_classes = [IsAuthenticated, IsResidentialManager]
     filter_backends = [
         DjangoFilterBackend,
@@ -610,10 +634,12 @@ class EducationProgramViewSet(viewsets.ModelViewSet):
         return EducationProgramReadSerializer
 
     @action(detail=True, methods=["get"])
+    @cache_response
     def program_enrollments(self, request, pk=None):
         program = self.get_object()
-        enrollments = ChildEducation.objects.filter(program=program).select_related(
-            "child"
+        enrollments = self.plan_queryset(
+            ChildEducation.objects.filter(program=program),
+            ChildEducationReadSerializer,
         )
 
         serializer = ChildEducationReadSerializer(enrollments, many=True)
@@ -623,10 +649,10 @@ class EducationProgramViewSet(viewsets.ModelViewSet):
 @extend_schema(
     tags=["Residential Care Program"],
 )
-class ChildEducationViewSet(viewsets.ModelViewSet):
-    queryset = ChildEducation.objects.all().select_related(
-        "child", "program", "program__institution"
-    )
+class ChildEducationViewSet(
+    ConditionalGetMixin, AutoPrefetchMixin, viewsets.ModelViewSet
+):
+    queryset = ChildEducation.objects.all()
     permission_classes = [IsAuthenticated, IsResidentialManager]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_class = ChildEducationFilter
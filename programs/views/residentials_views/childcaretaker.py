@@ -9,6 +9,8 @@ from programs.serializers import (
 from django.db import transaction
 from accounts.permissions import IsResidentialManager
 from rest_framework.permissions import IsAuthenticated
+from utils.conditional_get import ConditionalGetMixin
+from utils.query_planner import DeferHeavyFieldsMixin
 from django.utils import timezone
 from drf_spectacular.utils import (
     extend_schema,
@@ -31,7 +33,9 @@ from drf_spectacular.utils import (
         responses={201: ChildCaretakerAssignmentReadSerializer},
     ),
 )
-class ChildCaretakerAssignmentViewSet(viewsets.ModelViewSet):
+class ChildCaretakerAssignmentViewSet(
+    ConditionalGetMixin, DeferHeavyFieldsMixin, viewsets.ModelViewSet
+):
     queryset = ChildCaretakerAssignment.objects.select_related(
         "child", "house__caretaker"
     ).all()
@@ -6,7 +6,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import get_object_or_404
-from django.db.models import Count, Q, Sum, Avg, Max, Min
+from django.db.models import Count, Sum, Avg, Max, Min
 from decimal import Decimal
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 
@@ -18,7 +18,10 @@ from programs.serializers import (
 )
 from utils.filters.health_records_filters import HealthRecordFilter
 from utils.paginators import StandardResultsSetPagination
-from utils.search import CustomSearchFilter
+from utils.full_text import full_text_search
+from utils.search import FullTextSearchFilter
+from utils.conditional_get import ConditionalGetMixin
+from utils.values_reader import ValuesListMixin
 from accounts.permissions import IsResidentialManager
 
 logger = logging.getLogger(__name__)
@@ -32,13 +35,13 @@ logger = logging.getLogger(__name__)
     partial_update=extend_schema(tags=["Residential Care Program"]),
     destroy=extend_schema(tags=["Residential Care Program"]),
 )
-class HealthRecordViewSet(viewsets.ModelViewSet):
+class HealthRecordViewSet(ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet):
     queryset = HealthRecord.objects.select_related("child")
     permission_classes = [IsAuthenticated, IsResidentialManager]
     filter_backends = [
         DjangoFilterBackend,
-        CustomSearchFilter,
         filters.OrderingFilter,
+        FullTextSearchFilter,
     ]
     filterset_class = HealthRecordFilter
     search_fields = [
@@ -270,11 +273,9 @@ class HealthRecordViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        records = self.get_queryset().filter(
-            Q(diagnosis__icontains=condition)
-            | Q(treatment__icontains=condition)
-            | Q(description__icontains=condition)
-        )
+        # Diagnosis, treatment and description (weights A-C), not the
+        # hospital name.
+        records = full_text_search(self.get_queryset(), condition, weights="ABC")
 
         total_cost = records.aggregate(total=Sum("cost"))["total"] or Decimal("0.00")
 
@@ -8,6 +8,14 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
+from programs.models import (
+    Child,
+    ChildEducation,
+    ChildInsurance,
+    FoodItem,
+    HealthRecord,
+    ResidentialFinancialPlan,
+)
 from programs.serializers import (
     SpendingReportSerializer,
     CostReportSerializer,
@@ -18,6 +26,7 @@ from utils.reports.residentials.spending_summary import (
     SpendingSummaryPDFReport,
 )
 from utils.reports.ifashe.helpers import safe_filename
+from utils.response_cache import ResponseCacheMixin, cache_response
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from drf_spectacular.types import OpenApiTypes
 
@@ -29,9 +38,17 @@ logger = logging.getLogger(__name__)
     spending_summary=extend_schema(tags=["Residential Care Program"]),
     cost_report=extend_schema(tags=["Residential Care Program"]),
 )
-class ResidentialFinanceViewSet(viewsets.GenericViewSet):
+class ResidentialFinanceViewSet(ResponseCacheMixin, viewsets.GenericViewSet):
     permission_classes = [IsAuthenticated, IsResidentialManager]
     serializer_class = SpendingReportSerializer
+    cache_dependencies = [
+        Child,
+        HealthRecord,
+        ChildEducation,
+        ChildInsurance,
+        FoodItem,
+        ResidentialFinancialPlan,
+    ]
 
     @extend_schema(
         responses=SpendingReportSerializer,
@@ -40,9 +57,11 @@ class ResidentialFinanceViewSet(viewsets.GenericViewSet):
         - Normal spending
         - Special diet spending
         - Education spending
+        - Planned spending (financial plans) and food purchases
         """,
     )
     @action(detail=False, methods=["get"], url_path="spending-summary")
+    @cache_response
     def spending_summary(self, request):
         logger.info(
             f"Financial report accessed by user {request.user.id} ({request.user.email})"
@@ -63,6 +82,7 @@ class ResidentialFinanceViewSet(viewsets.GenericViewSet):
         description="Returns detailed residential cost report",
     )
     @action(detail=False, methods=["get"], url_path="cost-report")
+    @cache_response
     def cost_report(self, request):
         serializer = CostReportSerializer({}, context={"request": request})
 
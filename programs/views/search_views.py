@@ -0,0 +1,148 @@
+from django.urls import NoReverseMatch, reverse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from accounts.permissions import (
+    IsIfasheManager,
+    IsInternshipManager,
+    IsResidentialManager,
+)
+from donations.models import Donor
+from programs.models import (
+    Caretaker,
+    Child,
+    InternshipApplication,
+    Parent,
+    SponsoredChild,
+)
+from utils.people_search import SearchSource, search_people
+
+
+SEARCH_SOURCES = [
+    SearchSource(
+        "child",
+        Child,
+        title=["first_name", "last_name"],
+        fields=["first_name", "last_name"],
+        fuzzy_fields=["first_name", "last_name"],
+        permission_classes=[IsResidentialManager],
+        basename="child",
+    ),
+    SearchSource(
+        "caretaker",
+        Caretaker,
+        title=["first_name", "last_name"],
+        subtitle=["phone"],
+        fields=["first_name", "last_name", "phone", "email"],
+        fuzzy_fields=["first_name", "last_name"],
+        permission_classes=[IsResidentialManager],
+        basename="caretaker",
+    ),
+    SearchSource(
+        "ifashe_child",
+        SponsoredChild,
+        title=["first_name", "last_name"],
+        subtitle=["family__family_name"],
+        fields=["first_name", "last_name"],
+        fuzzy_fields=["first_name", "last_name"],
+        permission_classes=[IsIfasheManager],
+        basename="ifashe-child",
+    ),
+    SearchSource(
+        "ifashe_parent",
+        Parent,
+        title=["first_name", "last_name"],
+        subtitle=["phone"],
+        fields=["first_name", "last_name", "phone", "national_id"],
+        fuzzy_fields=["first_name", "last_name"],
+        permission_classes=[IsIfasheManager],
+        basename="ifashe-parent",
+    ),
+    SearchSource(
+        "donor",
+        Donor,
+        title=["fullname"],
+        subtitle=["email"],
+        fields=["fullname", "email", "phone"],
+        fuzzy_fields=["fullname"],
+        basename="donor",
+    ),
+    SearchSource(
+        "internship_application",
+        InternshipApplication,
+        title=["first_name", "last_name"],
+        subtitle=["email"],
+        fields=["first_name", "last_name", "email", "phone"],
+        fuzzy_fields=["first_name", "last_name"],
+        permission_classes=[IsInternshipManager],
+        basename="internship-application",
+    ),
+]
+
+
+class PeopleSearchView(APIView):
+    """
+    Search children, caretakers, Ifashe children and parents, donors and
+    internship applicants at once. Only the types the user may list are
+    searched.
+    """
+
+    permission_classes = [IsAuthenticated]
+    default_limit = 20
+    max_limit = 100
+
+    @extend_schema(
+        tags=["Search"],
+        parameters=[
+            OpenApiParameter("q", OpenApiTypes.STR, required=True),
+            OpenApiParameter(
+                "types",
+                OpenApiTypes.STR,
+                description="Comma separated types to search, e.g. child,donor",
+            ),
+            OpenApiParameter("limit", OpenApiTypes.INT),
+        ],
+    )
+    def get(self, request):
+        query = request.query_params.get("q", "").strip()
+        sources = self.get_sources(request)
+        results = search_people(sources, query, self.get_limit(request))
+
+        for hit in results:
+            hit["url"] = self.get_url(request, hit)
+
+        return Response(
+            {
+                "query": query,
+                "types": [source.type for source in sources],
+                "count": len(results),
+                "results": results,
+            }
+        )
+
+    def get_sources(self, request):
+        requested = request.query_params.get("types")
+        types = set(requested.split(",")) if requested else None
+        return [
+            source
+            for source in SEARCH_SOURCES
+            if (types is None or source.type in types)
+            and source.has_permission(request, self)
+        ]
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params.get("limit", self.default_limit))
+        except ValueError:
+            return self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    def get_url(self, request, hit):
+        basenames = {source.type: source.basename for source in SEARCH_SOURCES}
+        try:
+            return reverse(f"{basenames[hit['type']]}-detail", args=[hit["id"]])
+        except NoReverseMatch:
+            return None
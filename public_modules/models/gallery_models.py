@@ -1,13 +1,16 @@
 from django.db import models
 from accounts.models import User
-import uuid
-from accounts.models import TimeStampedModel, SoftDeleteModel
+from accounts.models import TimeStampedModel, SoftDeleteModel, TimeOrderedUUIDField
+from utils.counter_cache import CountedModel, CounterCacheModel
 
 
-class GalleryCategory(TimeStampedModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+class GalleryCategory(TimeStampedModel, CounterCacheModel):
+    id = TimeOrderedUUIDField()
     name = models.CharField(max_length=70)
     description = models.TextField(blank=True)
+    media_count = models.PositiveIntegerField(default=0, editable=False)
+
+    counter_caches = {"media_count": "media_items"}
 
     class Meta:
         db_table = "gallery_categories"
@@ -19,8 +22,8 @@ class GalleryCategory(TimeStampedModel):
         return self.name
 
 
-class GalleryMedia(TimeStampedModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+class GalleryMedia(TimeStampedModel, CountedModel):
+    id = TimeOrderedUUIDField()
     category = models.ForeignKey(
         GalleryCategory, on_delete=models.CASCADE, related_name="media_items"
     )
@@ -1,12 +1,8 @@
 from rest_framework import serializers
-from drf_spectacular.utils import extend_schema_field
-from drf_spectacular.types import OpenApiTypes
 from public_modules.models.gallery_models import GalleryCategory, GalleryMedia
 
 
 class GalleryCategorySerializer(serializers.ModelSerializer):  
-    media_count = serializers.SerializerMethodField()
-    
     class Meta:
         model = GalleryCategory
         fields = [
@@ -18,10 +14,6 @@ class GalleryCategorySerializer(serializers.ModelSerializer):
             'media_count'
         ]
         read_only_fields = ['id', 'created_on', 'updated_on']
-    
-    @extend_schema_field(OpenApiTypes.INT)
-    def get_media_count(self, obj):
-        return obj.media_items.count()
 
 
 class GalleryMediaSerializer(serializers.ModelSerializer):    
@@ -164,7 +156,6 @@ class BulkUploadResponseSerializer(serializers.Serializer):
 
 class GalleryCategoryDetailSerializer(serializers.ModelSerializer):
     media_items = GalleryMediaListSerializer(many=True, read_only=True)
-    media_count = serializers.SerializerMethodField()
     
     class Meta:
         model = GalleryCategory
@@ -178,10 +169,6 @@ class GalleryCategoryDetailSerializer(serializers.ModelSerializer):
             'media_items'
         ]
         read_only_fields = ['id', 'created_on', 'updated_on']
-    
-    @extend_schema_field(OpenApiTypes.INT)
-    def get_media_count(self, obj):
-        return obj.media_items.count()
 
 
 class CategoryStatsSerializer(serializers.Serializer):
@@ -2,7 +2,8 @@ from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
-from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from rest_framework.parsers import MultiPartParser, FormParser
+from django.db.models import Count, Q
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import (
     extend_schema,
@@ -14,6 +15,12 @@ from drf_spectacular.utils import (
 from drf_spectacular.types import OpenApiTypes
 
 from public_modules.models.gallery_models import GalleryCategory, GalleryMedia
+from utils.query_planner import AutoPrefetchMixin
+from utils.response_cache import CachedResponseMixin, cache_response
+from utils.throttling import PublicIPThrottle
+from utils.conditional_get import ConditionalGetMixin
+from utils.fast_json import ORJSONParser
+from utils.values_reader import ValuesListMixin
 from ..serializers.gallery_serializers import (
     GalleryCategorySerializer,
     GalleryCategoryDetailSerializer,
@@ -89,9 +96,14 @@ from ..serializers.gallery_serializers import (
         },
     ),
 )
-class GalleryCategoryViewSet(viewsets.ModelViewSet):
+class GalleryCategoryViewSet(
+    ConditionalGetMixin, CachedResponseMixin, AutoPrefetchMixin, viewsets.ModelViewSet
+):
     queryset = GalleryCategory.objects.all()
+    cache_dependencies = [GalleryCategory, GalleryMedia]
     permission_classes = [IsAuthenticatedOrReadOnly]
+    throttle_classes = [PublicIPThrottle]
+    throttle_scope = "public"
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["name", "description"]
     ordering_fields = ["name", "created_on", "updated_on"]
@@ -119,10 +131,13 @@ class GalleryCategoryViewSet(viewsets.ModelViewSet):
         responses={200: GalleryMediaListSerializer(many=True)},
     )
     @action(detail=True, methods=["get"])
+    @cache_response
     def media(self, request, pk=None):
         """Get all media items for a specific category"""
         category = self.get_object()
-        media_items = category.media_items.all()
+        media_items = self.plan_queryset(
+            category.media_items.all(), GalleryMediaListSerializer
+        )
 
         # Apply filters
         is_public = request.query_params.get("is_public")
@@ -157,20 +172,23 @@ class GalleryCategoryViewSet(viewsets.ModelViewSet):
         ],
     )
     @action(detail=False, methods=["get"])
+    @cache_response
     def stats(self, request):
         """Get statistics about gallery categories"""
-        categories = self.get_queryset()
-        stats = {"total_categories": categories.count(), "categories": []}
+        categories = self.get_queryset().annotate(
+            public_media_count=Count(
+                "media_items", filter=Q(media_items__is_public=True)
+            ),
+        )
+        stats = {"total_categories": len(categories), "categories": []}
 
         for category in categories:
             stats["categories"].append(
                 {
                     "id": str(category.id),
                     "name": category.name,
-                    "media_count": category.media_items.count(),
-                    "public_media_count": category.media_items.filter(
-                        is_public=True
-                    ).count(),
+                    "media_count": category.media_count,
+                    "public_media_count": category.public_media_count,
                 }
             )
 
@@ -259,10 +277,14 @@ class GalleryCategoryViewSet(viewsets.ModelViewSet):
         },
     ),
 )
-class GalleryMediaViewSet(viewsets.ModelViewSet):
-    queryset = GalleryMedia.objects.select_related("category", "uploaded_by").all()
+class GalleryMediaViewSet(
+    ConditionalGetMixin, ValuesListMixin, AutoPrefetchMixin, viewsets.ModelViewSet
+):
+    queryset = GalleryMedia.objects.all()
     permission_classes = [IsAuthenticatedOrReadOnly]
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    throttle_classes = [PublicIPThrottle]
+    throttle_scope = "public"
+    parser_classes = [MultiPartParser, FormParser, ORJSONParser]
     filter_backends = [
         DjangoFilterBackend,
         filters.SearchFilter,
@@ -399,10 +421,12 @@ class GalleryMediaViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_401_UNAUTHORIZED,
             )
 
-        media_items = self.get_queryset().filter(uploaded_by=request.user)
+        media_items = self.plan_queryset(
+            self.get_queryset().filter(uploaded_by=request.user), GalleryMediaListSerializer
+        )
         serializer = GalleryMediaListSerializer(media_items, many=True)
 
-        return Response({"count": media_items.count(), "results": serializer.data})
+        return Response({"count": len(serializer.data), "results": serializer.data})
 
     @extend_schema(
         summary="Get public media",
@@ -413,10 +437,12 @@ class GalleryMediaViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def public(self, request):
 
-        media_items = self.get_queryset().filter(is_public=True)
+        media_items = self.plan_queryset(
+            self.get_queryset().filter(is_public=True), GalleryMediaListSerializer
+        )
         serializer = GalleryMediaListSerializer(media_items, many=True)
 
-        return Response({"count": media_items.count(), "results": serializer.data})
+        return Response({"count": len(serializer.data), "results": serializer.data})
 
     @extend_schema(
         summary="Toggle media visibility",
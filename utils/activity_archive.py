@@ -0,0 +1,122 @@
+"""
+Retention for the activity log.
+
+`activity_logs` only keeps the last `ACTIVITY_LOG_RETENTION_DAYS` days, the
+window the audit screens search. Older entries are moved out one calendar
+month at a time into `ActivityLogArchive` rows holding the month as
+gzip-compressed NDJSON, so the live table and its indexes stop growing.
+Archives can be downloaded from the API or written to files with
+`manage.py archive_activity_logs --export-dir`.
+"""
+
+import datetime
+import gzip
+import io
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from accounts.models import ActivityLog, ActivityLogArchive
+from utils.model_versions import bump_version
+
+CHUNK_SIZE = 5000
+
+ARCHIVED_FIELDS = [
+    "id",
+    "user",
+    "user__email",
+    "action",
+    "resource",
+    "resource_id",
+    "timestamp",
+    "details",
+    "ip_address",
+]
+
+
+def month_start(value):
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_month(value):
+    return month_start(month_start(value) + datetime.timedelta(days=32))
+
+
+def retention_cutoff(now=None):
+    """
+    Start of the oldest month kept in `activity_logs`.
+    """
+    now = now or timezone.now()
+    return month_start(now - datetime.timedelta(days=settings.ACTIVITY_LOG_RETENTION_DAYS))
+
+
+def archive_month(start):
+    """
+    Move the entries of the month starting at `start` into an archive.
+    Returns the archive, or None when the month had no entries.
+    """
+    end = next_month(start)
+    entries = ActivityLog.objects.filter(timestamp__gte=start, timestamp__lt=end)
+
+    with transaction.atomic():
+        last_id = entries.aggregate(last_id=Max("id"))["last_id"]
+        if last_id is None:
+            return None
+        entries = entries.filter(id__lte=last_id)
+        span = entries.aggregate(first=Min("timestamp"), last=Max("timestamp"))
+
+        data = io.BytesIO()
+        count = 0
+        with gzip.GzipFile(fileobj=data, mode="wb") as stream:
+            rows = entries.order_by("id").values(*ARCHIVED_FIELDS)
+            for row in rows.iterator(chunk_size=CHUNK_SIZE):
+                stream.write(json.dumps(row, cls=DjangoJSONEncoder).encode() + b"\n")
+                count += 1
+
+        archive = ActivityLogArchive.objects.create(
+            month=start.date(),
+            entry_count=count,
+            first_timestamp=span["first"],
+            last_timestamp=span["last"],
+            data=data.getvalue(),
+        )
+        # A single DELETE: going through the collector would load every
+        # row to send post_delete for each of them.
+        entries.order_by()._raw_delete(entries.db)
+
+    bump_version(ActivityLog)
+    return archive
+
+
+def archive_activity_logs(now=None):
+    """
+    Archive every month older than the retention window.
+    """
+    cutoff = retention_cutoff(now)
+    oldest = ActivityLog.objects.filter(timestamp__lt=cutoff).aggregate(
+        oldest=Min("timestamp")
+    )["oldest"]
+    if oldest is None:
+        return []
+
+    archives = []
+    start = month_start(oldest)
+    while start < cutoff:
+        archive = archive_month(start)
+        if archive is not None:
+            archives.append(archive)
+        start = next_month(start)
+    return archives
+
+
+def read_archive(archive):
+    """
+    The entries of an archive, as dicts.
+    """
+    with gzip.GzipFile(fileobj=io.BytesIO(bytes(archive.data))) as stream:
+        for line in stream:
+            yield json.loads(line)
@@ -1,5 +1,176 @@
+"""
+Activity recording.
+
+Inside a request (see `ActivityLogMiddleware`) or a Celery task,
+`record_activity` only appends an unsaved `ActivityLog` to an in-process
+buffer. The buffer is written with one `bulk_create` once it holds
+`ACTIVITY_LOG_BUFFER_SIZE` entries, when a request finishes or a task
+returns with entries older than `ACTIVITY_LOG_FLUSH_INTERVAL` seconds, by a
+timer when traffic stops, and when the process exits. Anywhere else the
+entry is written immediately.
+"""
+
+import atexit
+import contextvars
 import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.signals import request_finished
+from django.db import connections, transaction
+from django.utils import timezone
+
 from accounts.models import ActivityLog
+from utils.model_versions import bump_version
+
+logger = logging.getLogger(__name__)
+
+_buffering = contextvars.ContextVar("activity_log_buffering", default=False)
+
+
+class ActivityLogBuffer:
+    def __init__(self):
+        self.entries = []
+        self.oldest = None
+        self.lock = threading.Lock()
+        self.timer = None
+
+    @property
+    def size(self):
+        return getattr(settings, "ACTIVITY_LOG_BUFFER_SIZE", 100)
+
+    @property
+    def interval(self):
+        return getattr(settings, "ACTIVITY_LOG_FLUSH_INTERVAL", 5)
+
+    def add(self, entry):
+        with self.lock:
+            if not self.entries:
+                self.oldest = time.monotonic()
+                self.schedule()
+            self.entries.append(entry)
+            full = len(self.entries) >= self.size
+        if full:
+            self.flush()
+
+    def due(self):
+        with self.lock:
+            if not self.entries:
+                return False
+            return (
+                len(self.entries) >= self.size
+                or time.monotonic() - self.oldest >= self.interval
+            )
+
+    def flush(self):
+        with self.lock:
+            entries, self.entries, self.oldest = self.entries, [], None
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+        if not entries:
+            return 0
+        try:
+            # A savepoint of its own: a failed insert must not abort the
+            # caller's transaction, which the fallback below writes in.
+            with transaction.atomic():
+                ActivityLog.objects.bulk_create(entries)
+            written = len(entries)
+        except Exception as e:
+            logger.warning(
+                f"Failed to record {len(entries)} activities at once, "
+                f"retrying one by one: {str(e)}"
+            )
+            written = self.write_one_by_one(entries)
+        if written:
+            bump_version(ActivityLog)
+        return written
+
+    def write_one_by_one(self, entries):
+        # One bad entry, e.g. for a user deleted since it was recorded, must
+        # not take the rest of the batch with it: only the failing ones are
+        # dropped.
+        written = 0
+        for entry in entries:
+            try:
+                with transaction.atomic():
+                    entry.save(force_insert=True)
+            except Exception as e:
+                logger.error(f"Failed to record activity {entry.action}: {str(e)}")
+            else:
+                written += 1
+        return written
+
+    def schedule(self):
+        if self.interval <= 0 or self.timer is not None:
+            return
+        self.timer = threading.Timer(self.interval, self.flush_from_timer)
+        self.timer.daemon = True
+        self.timer.start()
+
+    def flush_from_timer(self):
+        with self.lock:
+            self.timer = None
+        try:
+            self.flush()
+        finally:
+            # The timer thread has its own connections.
+            connections.close_all()
+
+
+buffer = ActivityLogBuffer()
+
+
+def flush_activity_log(**kwargs):
+    return buffer.flush()
+
+
+def flush_activity_log_if_due(**kwargs):
+    if buffer.due():
+        buffer.flush()
+
+
+class ActivityLogMiddleware:
+    """
+    Buffers the activities recorded while handling a request. They are
+    written after the response is sent (`request_finished`).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = _buffering.set(True)
+        try:
+            return self.get_response(request)
+        finally:
+            _buffering.reset(token)
+
+
+_task_tokens = {}
+
+
+def _start_task_buffering(task_id=None, **kwargs):
+    _task_tokens[task_id] = _buffering.set(True)
+
+
+def _end_task_buffering(task_id=None, **kwargs):
+    token = _task_tokens.pop(task_id, None)
+    if token is not None:
+        _buffering.reset(token)
+    flush_activity_log_if_due()
+
+
+def connect_signals():
+    from celery.signals import task_postrun, task_prerun, worker_process_shutdown
+
+    request_finished.connect(flush_activity_log_if_due)
+    task_prerun.connect(_start_task_buffering)
+    task_postrun.connect(_end_task_buffering)
+    worker_process_shutdown.connect(flush_activity_log)
+    atexit.register(flush_activity_log)
+
 
 def record_activity(request, action, user=None, resource=None, resource_id=None, details=None):
     """
@@ -12,7 +183,6 @@ def record_activity(request, action, user=None, resource=None, resource_id=None,
     :param resource_id: The ID of the resource (optional)
     :param details: A dictionary containing additional information (optional)
     """
-    logger = logging.getLogger(__name__)
     ip_address = None
 
     if request:
@@ -26,14 +196,21 @@ def record_activity(request, action, user=None, resource=None, resource_id=None,
         else:
             ip_address = request.META.get("REMOTE_ADDR")
 
+    entry = ActivityLog(
+        user=user,
+        action=action,
+        resource=resource,
+        resource_id=resource_id,
+        details=details,
+        ip_address=ip_address,
+        timestamp=timezone.now(),
+    )
+
+    if _buffering.get():
+        buffer.add(entry)
+        return
+
     try:
-        ActivityLog.objects.create(
-            user=user,
-            action=action,
-            resource=resource,
-            resource_id=resource_id,
-            details=details,
-            ip_address=ip_address,
-        )
+        entry.save()
     except Exception as e:
         logger.error(f"Failed to record activity: {str(e)}")
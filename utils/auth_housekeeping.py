@@ -0,0 +1,111 @@
+"""
+Purging of the authentication tables that only ever grow: the refresh
+tokens tracked by simplejwt's token_blacklist app (one outstanding row per
+issued refresh token, plus a blacklisted row per rotation or logout) and
+the verification codes.
+
+Rows are deleted in batches of `batch_size` primary keys so that each
+DELETE, and the locks it holds, stays small however far behind the job
+is. Each batch is a plain DELETE per table, without loading the rows or
+sending signals. The expiry predicates are indexed: `VerificationCode.created_on` in
+the model, `OutstandingToken.expires_at` by `create_auth_indexes()` since
+that model belongs to a third-party app.
+"""
+
+import logging
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from accounts.models import VerificationCode
+from utils.model_versions import bump_version
+from utils.postgres import is_postgres
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+OUTSTANDING_TOKEN_EXPIRY_INDEX = "outstanding_token_expires_idx"
+
+
+def delete_in_batches(queryset, batch_size=BATCH_SIZE, dependents=()):
+    """
+    Delete the rows of `queryset` `batch_size` at a time. `dependents` are
+    the `(model, foreign key name)` pairs of the rows referencing them,
+    deleted first in the same transaction. Returns how many rows of the
+    queryset's model were deleted.
+    """
+    model = queryset.model
+    using = queryset.db
+    deleted = 0
+    while True:
+        ids = list(queryset.order_by().values_list("pk", flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        # One transaction per batch; within a caller's transaction an error
+        # propagates anyway, so no savepoint is needed.
+        with transaction.atomic(using=using, savepoint=False):
+            for dependent, field in dependents:
+                dependent._base_manager.using(using).filter(
+                    **{f"{field}__in": ids}
+                )._raw_delete(using)
+                bump_version(dependent, using)
+            deleted += model._base_manager.using(using).filter(
+                pk__in=ids
+            )._raw_delete(using)
+            bump_version(model, using)
+
+
+def purge_expired_tokens(batch_size=BATCH_SIZE, now=None):
+    """
+    Outstanding refresh tokens past their expiry, with their blacklist rows
+    (an expired token is rejected without looking at the blacklist).
+    """
+    expired = OutstandingToken.objects.filter(expires_at__lte=now or timezone.now())
+    return delete_in_batches(
+        expired, batch_size, dependents=[(BlacklistedToken, "token")]
+    )
+
+
+def purge_expired_verification_codes(batch_size=BATCH_SIZE, now=None):
+    """
+    Verification codes older than VERIFICATION_CODE_LIFETIME, used or not.
+    """
+    cutoff = (now or timezone.now()) - settings.VERIFICATION_CODE_LIFETIME
+    expired = VerificationCode.objects.filter(created_on__lt=cutoff)
+    return delete_in_batches(expired, batch_size)
+
+
+def auth_table_metrics(using=DEFAULT_DB_ALIAS):
+    """
+    Row count of each table, and its size in bytes on Postgres.
+    """
+    metrics = {}
+    for model in (OutstandingToken, BlacklistedToken, VerificationCode):
+        table = model._meta.db_table
+        metrics[table] = {"rows": model._default_manager.using(using).count()}
+        if is_postgres(using):
+            with connections[using].cursor() as cursor:
+                cursor.execute("SELECT pg_total_relation_size(%s::regclass)", [table])
+                metrics[table]["bytes"] = cursor.fetchone()[0]
+    return metrics
+
+
+def create_auth_indexes(using=DEFAULT_DB_ALIAS, **kwargs):
+    """
+    post_migrate receiver indexing OutstandingToken.expires_at, which the
+    token_blacklist app leaves unindexed.
+    """
+    table = OutstandingToken._meta.db_table
+    if table not in connections[using].introspection.table_names():
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {OUTSTANDING_TOKEN_EXPIRY_INDEX} "
+            f"ON {table} (expires_at)"
+        )
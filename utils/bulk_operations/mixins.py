@@ -1,6 +1,8 @@
 from django.db import transaction
 from rest_framework.response import Response
 from rest_framework import status
+from utils.counter_cache import update_counted
+from utils.model_versions import bump_version
 from .serializers import BulkActionSerializer
 
 
@@ -9,11 +11,14 @@ class BulkActionMixin:
     bulk_atomic = True
     bulk_max_size = 100
     bulk_async_threshold = 50
+    # Fields a bulk update payload may not set.
+    bulk_protected_fields = ()
 
     def get_bulk_serializer(self, *args, **kwargs):
         kwargs.setdefault("context", {})
         kwargs["context"]["model"] = self.get_queryset().model
         kwargs["context"]["max_bulk_size"] = self.bulk_max_size
+        kwargs["context"]["protected_fields"] = self.bulk_protected_fields
         return self.bulk_serializer_class(*args, **kwargs)
 
     def perform_bulk_action(
@@ -83,7 +88,8 @@ class BulkActionMixin:
                             status=status.HTTP_400_BAD_REQUEST,
                         )
 
-                    count = queryset.update(**payload)
+                    count = update_counted(queryset, **payload)
+                    bump_version(queryset.model)
 
                     result = {
                         "message": f"{count} objects updated successfully.",
@@ -98,6 +104,7 @@ class BulkActionMixin:
                         raise ValueError("Custom handler must be provided.")
 
                     result = custom_handler(queryset, payload)
+                    bump_version(queryset.model)
                     result.setdefault("async", False)
 
                 else:
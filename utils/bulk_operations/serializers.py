@@ -31,3 +31,11 @@ class BulkActionSerializer(serializers.Serializer):
             )
 
         return value
+
+    def validate_payload(self, value):
+        protected = sorted(set(value) & set(self.context.get("protected_fields", ())))
+        if protected:
+            raise serializers.ValidationError(
+                f"These fields cannot be bulk updated: {protected}"
+            )
+        return value
@@ -3,6 +3,9 @@ from django.apps import apps
 from django.db import transaction
 import logging
 
+from utils.counter_cache import update_counted
+from utils.model_versions import bump_version
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,7 +40,8 @@ def generic_bulk_task(self, ids, payload, action_type, model_label):
                 if not payload:
                     raise ValueError("Payload is required for update.")
 
-                count = queryset.update(**payload)
+                count = update_counted(queryset, **payload)
+                bump_version(model)
                 result["affected_count"] = count
                 result["updated_fields"] = list(payload.keys())
 
@@ -0,0 +1,129 @@
+"""
+Response compression.
+
+`CompressionMiddleware` compresses text responses (JSON, HTML, CSV...) of
+at least `RESPONSE_COMPRESSION_MIN_SIZE` bytes, with brotli when the client
+accepts it and the `brotli` package is installed, with gzip otherwise.
+Streaming responses are compressed chunk by chunk. PDFs, spreadsheets,
+images and archives are already compressed and are left alone.
+
+Django pads gzip responses with random bytes against BREACH; brotli has no
+such padding, so it is only used when the request carries no cookies and
+the response sets none. The API authenticates with a bearer token that a
+cross-site page cannot make the browser send, so such responses hold no
+secret an attacker could probe for; session-authenticated pages (the
+admin) get padded gzip. Accept-Encoding q-values are honoured, so
+`br;q=0` refuses brotli.
+"""
+
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+BROTLI_QUALITY = 5
+
+
+COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/vnd.oai.openapi",
+    "image/svg+xml",
+}
+
+
+def is_compressible(response):
+    content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+    return (
+        content_type.startswith("text/")
+        or content_type.endswith(("+json", "+xml"))
+        or content_type in COMPRESSIBLE_TYPES
+    )
+
+
+def accepts_encoding(accept_encoding, coding):
+    """
+    Whether an Accept-Encoding header accepts `coding`, i.e. lists it, or
+    `*` if it is not listed, with a non-zero q-value.
+    """
+    qvalues = {}
+    for item in accept_encoding.split(","):
+        name, *params = item.split(";")
+        qvalue = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    qvalue = float(value)
+                except ValueError:
+                    qvalue = 0.0
+        qvalues[name.strip().lower()] = qvalue
+    return qvalues.get(coding, qvalues.get("*", 0.0)) > 0
+
+
+def may_use_brotli(request, response):
+    return (
+        brotli is not None
+        and not request.COOKIES
+        and not response.cookies
+        and accepts_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""), "br")
+    )
+
+
+def brotli_sequence(sequence):
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    for chunk in sequence:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def brotli_async_sequence(sequence):
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    async for chunk in sequence:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+class CompressionMiddleware(GZipMiddleware):
+    def process_response(self, request, response):
+        min_size = getattr(settings, "RESPONSE_COMPRESSION_MIN_SIZE", 1024)
+        if not response.streaming and len(response.content) < min_size:
+            return response
+        if response.has_header("Content-Encoding") or not is_compressible(response):
+            return response
+
+        if not may_use_brotli(request, response):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = brotli_async_sequence(
+                    response.streaming_content
+                )
+            else:
+                response.streaming_content = brotli_sequence(
+                    response.streaming_content
+                )
+            del response.headers["Content-Length"]
+        else:
+            compressed = brotli.compress(response.content, quality=BROTLI_QUALITY)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = "br"
+        return response
@@ -0,0 +1,196 @@
+"""
+Conditional GET for list and detail endpoints.
+
+`ConditionalGetMixin` adds weak `ETag` and `Last-Modified` headers to
+`list` and `retrieve` responses and answers `If-None-Match` and
+`If-Modified-Since` with 304 Not Modified before anything is serialized.
+
+A list's ETag hashes the request (path, query parameters, audience,
+format) with the versions of the tables the response renders, the same
+inputs as the response cache key (see utils/response_cache.py), so a
+matching poll costs a cache read and no query. Its Last-Modified is the
+latest `updated_on` of the filtered rows, kept in the cache under the same
+hash. A deleted row does not move that date, so lists only answer 304 on
+a matching ETag.
+
+A detail's ETag hashes the row's `updated_on`, read with one query of the
+primary key and that column, with the versions of the other tables the
+response renders; its Last-Modified is that `updated_on`.
+
+Values computed from the date (ages, overdue flags) change at midnight
+without any row changing: both ETags also hash the date, and a
+Last-Modified is never earlier than the start of the day.
+
+A `SerializerMethodField` may read tables the response does not render.
+Validators are only sent when every method field of the serializer (and
+its nested serializers) is declared in `Meta.field_sources`, or when the
+view lists its `cache_dependencies` explicitly, and only when every one of
+those tables is versioned (see utils/model_versions.py).
+"""
+
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Max
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import serializers
+
+from utils.model_versions import tracked_tables
+from utils.response_cache import ResponseCacheMixin
+
+KEY_PREFIX = "last-modified"
+
+
+def undeclared_method_fields(serializer, prefix=""):
+    """
+    Paths of the method fields of `serializer` (an instance) and of its
+    nested serializers that `Meta.field_sources` does not declare.
+    """
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    declared = getattr(getattr(serializer, "Meta", None), "field_sources", {})
+    undeclared = []
+    for name, field in serializer.fields.items():
+        if isinstance(field, serializers.SerializerMethodField):
+            if name not in declared:
+                undeclared.append(f"{prefix}{name}")
+        elif isinstance(field, serializers.BaseSerializer):
+            undeclared.extend(undeclared_method_fields(field, f"{prefix}{name}."))
+    return undeclared
+
+
+def start_of_day():
+    return timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class ConditionalGetMixin(ResponseCacheMixin):
+    last_modified_field = "updated_on"
+
+    def get_last_modified_field(self):
+        """
+        Name of the model's modification date column, or None.
+        """
+        try:
+            self.queryset.model._meta.get_field(self.last_modified_field)
+        except FieldDoesNotExist:
+            return None
+        return self.last_modified_field
+
+    def has_known_dependencies(self):
+        """
+        Whether the tables the response reads are known (see the module
+        docstring); validators are only sent when they are.
+        """
+        if self.cache_dependencies is None and undeclared_method_fields(
+            self.get_serializer()
+        ):
+            return False
+        tables = {model._meta.db_table for model in self.get_cache_dependencies()}
+        return tables <= tracked_tables()
+
+    def list(self, request, *args, **kwargs):
+        if not self.has_known_dependencies():
+            return super().list(request, *args, **kwargs)
+
+        day = start_of_day()
+        digest = self.get_request_digest(request, day=day.date())
+        etag = f"W/{quote_etag(digest)}"
+        not_modified = self.get_not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        response = super().list(request, *args, **kwargs)
+        last_modified = cache.get_or_set(
+            f"{KEY_PREFIX}:{digest}", self.get_list_last_modified
+        )
+        if last_modified is not None:
+            last_modified = max(last_modified, day)
+        return self.set_validators(response, etag, last_modified)
+
+    def retrieve(self, request, *args, **kwargs):
+        if not self.has_known_dependencies():
+            return super().retrieve(request, *args, **kwargs)
+
+        field = self.get_last_modified_field()
+        model = self.queryset.model
+        day = start_of_day()
+        if field is None:
+            digest = self.get_request_digest(request, day=day.date())
+            last_modified = None
+        else:
+            obj = self.get_validator_object(field)
+            last_modified = max(getattr(obj, field), day)
+            dependencies = [
+                dependency
+                for dependency in self.get_cache_dependencies()
+                if dependency is not model
+            ]
+            digest = self.get_request_digest(
+                request,
+                dependencies,
+                row=[str(obj.pk), getattr(obj, field)],
+                day=day.date(),
+            )
+
+        etag = f"W/{quote_etag(digest)}"
+        not_modified = self.get_not_modified(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = super().retrieve(request, *args, **kwargs)
+        return self.set_validators(response, etag, last_modified)
+
+    def get_list_last_modified(self):
+        field = self.get_last_modified_field()
+        if field is None:
+            return None
+        queryset = self.filter_queryset(self.get_queryset())
+        return (
+            queryset.select_related(None)
+            .prefetch_related(None)
+            .order_by()
+            .aggregate(last_modified=Max(field))["last_modified"]
+        )
+
+    def get_validator_object(self, field):
+        """
+        The requested object with only its primary key and `field` loaded.
+        Raises 404 and checks object permissions like `get_object()`.
+        """
+        queryset = (
+            self.filter_queryset(self.get_queryset())
+            .select_related(None)
+            .prefetch_related(None)
+            .only(self.queryset.model._meta.pk.name, field)
+        )
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        obj = get_object_or_404(
+            queryset, **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    def get_not_modified(self, request, etag, last_modified=None):
+        """
+        The 304 (or 412) response the request's preconditions call for, or
+        None when the full response should be sent.
+        """
+        if request.method not in ("GET", "HEAD"):
+            return None
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=last_modified and int(last_modified.timestamp()),
+        )
+        if response is None:
+            return None
+        return self.set_validators(response, etag, last_modified)
+
+    def set_validators(self, response, etag, last_modified):
+        if 200 <= response.status_code < 400:
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified.timestamp())
+        return response
@@ -0,0 +1,294 @@
+"""
+Denormalized row counts kept on the parent model.
+
+A parent inherits `CounterCacheModel` and declares its counters as
+`{column: related_name}`, the column being an integer field of its own and
+`related_name` a reverse foreign key:
+
+    class Family(TimeStampedModel, SoftDeleteModel, CounterCacheModel):
+        children_count = models.PositiveIntegerField(default=0, editable=False)
+        counter_caches = {"children_count": "children"}
+
+Saves of an existing parent leave the counter columns out, so an instance
+loaded before a child was added does not write its stale count back.
+
+The child model inherits `CountedModel`. Its `save()` and deletes adjust the
+counter with an `F()` increment in the same transaction as the row: creates,
+hard deletes (instance, queryset or cascade), soft deletes and restores, and
+moves to another parent. Rows of soft-deletable children count while
+`is_deleted` is false, matching what their default manager returns.
+
+A counter can also count only the rows with given field values, declared
+as `{column: (related_name, {field: value})}`:
+
+    counter_caches = {"enrolled_count": ("enrolled_children", {"status": "ACTIVE"})}
+
+`bulk_create()` and `QuerySet.update()` bypass this; `update_counted()`
+wraps the latter, and the `repair_counter_caches` command recounts
+everything from the child tables.
+"""
+
+from collections import namedtuple
+
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models, router, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete
+
+from utils.model_versions import bump_version
+
+
+Counter = namedtuple("Counter", ["parent", "column", "field", "condition"])
+
+_counters = {}
+
+
+def counters_for(model):
+    """
+    Counters fed by rows of `model`, as a tuple of `Counter`.
+    """
+    return _counters.get(model, ())
+
+
+def all_counters():
+    return [counter for counters in _counters.values() for counter in counters]
+
+
+def _counted_parent(counter, values):
+    # The parent a row with these column values is counted on, if any.
+    if values.get("is_deleted"):
+        return None
+    if any(values.get(name) != value for name, value in counter.condition.items()):
+        return None
+    return values.get(counter.field.attname)
+
+
+def _adjust(counter, pk, delta, using):
+    queryset = counter.parent._base_manager.using(using).filter(pk=pk)
+    if delta < 0:
+        # A counter that drifted to zero stays there until repaired.
+        queryset = queryset.filter(**{f"{counter.column}__gte": -delta})
+    queryset.update(**{counter.column: F(counter.column) + delta})
+
+
+def _apply(changes, using):
+    changed = set()
+    for counter, before, after in changes:
+        if before == after:
+            continue
+        if before is not None:
+            _adjust(counter, before, -1, using)
+        if after is not None:
+            _adjust(counter, after, 1, using)
+        changed.add(counter.parent)
+    for parent in changed:
+        bump_version(parent)
+
+
+class CounterCacheModel(models.Model):
+    """
+    Parent side of a counter cache: the counters only move through `F()`
+    increments, never through a save of the parent.
+    """
+
+    counter_caches = {}
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            update_fields = kwargs.get("update_fields")
+            if update_fields is None:
+                update_fields = [
+                    field.name
+                    for field in self._meta.concrete_fields
+                    if not field.primary_key and not field.generated
+                ]
+            kwargs["update_fields"] = [
+                name for name in update_fields if name not in self.counter_caches
+            ]
+        return super().save(*args, **kwargs)
+
+
+class CountedModel(models.Model):
+    """
+    Child side of a counter cache: saves run in a transaction that also
+    moves the counters of the parents the row leaves and joins.
+    """
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        counters = counters_for(type(self))
+        columns = _counted_columns(type(self), counters)
+        update_fields = kwargs.get("update_fields")
+        if not counters or (
+            update_fields is not None
+            and not set(update_fields)
+            & {*columns, *(counter.field.name for counter in counters)}
+        ):
+            return super().save(*args, **kwargs)
+
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            before = self._counted_values_before(columns, using)
+            super().save(*args, **kwargs)
+            after = {**before}
+            after.update(
+                (name, self.__dict__[name]) for name in columns if name in self.__dict__
+            )
+            _apply(
+                [
+                    (
+                        counter,
+                        _counted_parent(counter, before),
+                        _counted_parent(counter, after),
+                    )
+                    for counter in counters
+                ],
+                using,
+            )
+
+    def _counted_values_before(self, columns, using):
+        """
+        The counted columns of the row before the save, empty for a new row.
+        """
+        if self._state.adding:
+            return {}
+
+        # Locked so that concurrent saves of the row see each other's moves.
+        row = (
+            type(self)
+            ._base_manager.using(using)
+            .select_for_update()
+            .filter(pk=self.pk)
+            .values(*columns)
+            .first()
+        )
+        return row or {}
+
+
+def _counted_columns(model, counters):
+    columns = [counter.field.attname for counter in counters]
+    for counter in counters:
+        columns.extend(name for name in counter.condition if name not in columns)
+    if any(field.attname == "is_deleted" for field in model._meta.concrete_fields):
+        columns.append("is_deleted")
+    return columns
+
+
+def _on_delete(sender, instance, using, **kwargs):
+    # Sent inside the deletion's transaction, for instance, queryset and
+    # cascade deletes alike.
+    _apply(
+        [
+            (counter, _counted_parent(counter, instance.__dict__), None)
+            for counter in counters_for(sender)
+        ],
+        using,
+    )
+
+
+def update_counted(queryset, **values):
+    """
+    `queryset.update(**values)`, recounting the parents of the updated rows
+    when the update can move a counter (a new parent, a soft delete).
+    """
+    model = queryset.model
+    counters = [
+        counter
+        for counter in counters_for(model)
+        if {"is_deleted", counter.field.name, counter.field.attname, *counter.condition}
+        & set(values)
+    ]
+    if not counters:
+        return queryset.update(**values)
+
+    with transaction.atomic(using=queryset.db):
+        pks = list(queryset.values_list("pk", flat=True))
+        attnames = [counter.field.attname for counter in counters]
+        rows = model._base_manager.using(queryset.db).filter(pk__in=pks)
+        before = list(rows.values_list(*attnames))
+        count = model._base_manager.using(queryset.db).filter(pk__in=pks).update(
+            **values
+        )
+        after = list(rows.values_list(*attnames))
+        for index, counter in enumerate(counters):
+            parents = {row[index] for row in before + after} - {None}
+            recount(counter, parents, using=queryset.db)
+    return count
+
+
+def count_expression(counter):
+    """
+    The live count of `counter`, as an expression on the parent queryset.
+    """
+    children = (
+        counter.field.model._default_manager.filter(
+            **{counter.field.name: OuterRef("pk")}, **counter.condition
+        )
+        .order_by()
+        .values(counter.field.name)
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(children), 0)
+
+
+def recount(counter, pks=None, using=None):
+    """
+    Recompute `counter` on the parents in `pks` (all parents by default).
+    Returns the number of parents whose stored count was wrong.
+    """
+    queryset = counter.parent._base_manager.db_manager(using).all()
+    if pks is not None:
+        queryset = queryset.filter(pk__in=pks)
+    expression = count_expression(counter)
+    fixed = queryset.exclude(**{counter.column: expression}).update(
+        **{counter.column: expression}
+    )
+    if fixed:
+        bump_version(counter.parent)
+    return fixed
+
+
+def connect_signals():
+    """
+    Resolve the `counter_caches` declarations of every model.
+    """
+    _counters.clear()
+    for parent in apps.get_models():
+        for column, declaration in getattr(parent, "counter_caches", {}).items():
+            related_name, condition = (
+                declaration if isinstance(declaration, tuple) else (declaration, {})
+            )
+            if not issubclass(parent, CounterCacheModel):
+                raise ImproperlyConfigured(
+                    f"{parent.__name__} declares counter_caches and must inherit "
+                    "CounterCacheModel."
+                )
+            relation = parent._meta.get_field(related_name)
+            if not relation.one_to_many:
+                raise ImproperlyConfigured(
+                    f"{parent.__name__}.counter_caches: {related_name} is not "
+                    "a reverse foreign key."
+                )
+            child = relation.related_model
+            if not issubclass(child, CountedModel):
+                raise ImproperlyConfigured(
+                    f"{child.__name__} feeds {parent.__name__}.{column} and "
+                    "must inherit CountedModel."
+                )
+            _counters.setdefault(child, ())
+            _counters[child] += (Counter(parent, column, relation.field, condition),)
+
+    for child in _counters:
+        post_delete.connect(
+            _on_delete,
+            sender=child,
+            dispatch_uid=f"counter_cache_{child._meta.label_lower}",
+        )
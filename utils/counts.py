@@ -0,0 +1,121 @@
+"""
+Row counts for paginated responses.
+
+An exact `COUNT(*)` over a large filtered queryset can cost more than the
+page itself. `count_queryset()` asks the Postgres planner first and returns
+its estimate when it is above `PAGINATION_COUNT_ESTIMATE_THRESHOLD`; below
+that, the exact count is cached per (SQL, params) for
+`PAGINATION_COUNT_CACHE_TIMEOUT` seconds, keyed on the versions of the
+tables the query reads so that any save or delete invalidates it.
+"""
+
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import DatabaseError, connections
+from django.db.models import QuerySet
+
+from utils.model_versions import get_versions, queryset_tables
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ESTIMATE_THRESHOLD = 100_000
+DEFAULT_CACHE_TIMEOUT = 60
+
+
+def count_queryset(queryset):
+    """
+    Return `(count, is_estimate)` for `queryset`.
+    """
+    if not isinstance(queryset, QuerySet):
+        return len(queryset), False
+
+    queryset = queryset.order_by()
+    try:
+        sql, params = queryset.query.get_compiler(queryset.db).as_sql()
+    except EmptyResultSet:
+        return 0, False
+
+    estimate = estimate_count(queryset)
+    if estimate is not None:
+        return estimate, True
+    return cached_count(queryset, sql, params), False
+
+
+def estimate_count(queryset):
+    """
+    The planner's row estimate when it reaches the configured threshold,
+    None otherwise (other backends, small tables, unanalyzed tables).
+    """
+    threshold = getattr(
+        settings, "PAGINATION_COUNT_ESTIMATE_THRESHOLD", DEFAULT_ESTIMATE_THRESHOLD
+    )
+    connection = connections[queryset.db]
+    if threshold is None or connection.vendor != "postgresql":
+        return None
+
+    try:
+        if _is_unfiltered(queryset):
+            rows = _table_estimate(connection, queryset.model._meta.db_table)
+        else:
+            rows = _plan_estimate(queryset)
+    except DatabaseError:
+        logger.exception(f"Could not estimate count for {queryset.model.__name__}")
+        return None
+
+    if rows is None or rows < threshold:
+        return None
+    return rows
+
+
+def cached_count(queryset, sql, params):
+    timeout = getattr(settings, "PAGINATION_COUNT_CACHE_TIMEOUT", DEFAULT_CACHE_TIMEOUT)
+    if not timeout:
+        return queryset.count()
+
+    versions = get_versions(queryset_tables(queryset))
+    if versions is None:
+        return queryset.count()
+    fingerprint = f"{queryset.db}|{sql}|{params!r}|{sorted(versions.items())!r}"
+    key = f"count:{hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()}"
+
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, timeout)
+    return count
+
+
+def _is_unfiltered(queryset):
+    query = queryset.query
+    return (
+        not query.where
+        and not query.distinct
+        and not query.combinator
+        and query.group_by is None
+        and query.low_mark == 0
+        and query.high_mark is None
+        and len(query.alias_map) <= 1
+    )
+
+
+def _table_estimate(connection, table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+            [table],
+        )
+        row = cursor.fetchone()
+    # reltuples is -1 (0 before Postgres 14) until the table is analyzed.
+    if row is None or row[0] <= 0:
+        return None
+    return row[0]
+
+
+def _plan_estimate(queryset):
+    plan = json.loads(queryset.explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,56 @@
+"""
+orjson-based JSON renderer and parser for DRF.
+
+The output matches `rest_framework.renderers.JSONRenderer`: datetimes and
+every type orjson does not handle natively (Decimal, lazy strings,
+timedelta, querysets...) go through DRF's own `JSONEncoder.default`, so
+dates keep DRF's millisecond ISO format and decimals render as numbers.
+UUIDs, dicts, lists and plain scalars are encoded by orjson directly.
+"""
+
+import orjson
+from django.conf import settings
+from rest_framework import renderers
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.utils.encoders import JSONEncoder
+
+_encoder = JSONEncoder()
+
+OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def dumps(data, indent=False):
+    options = OPTIONS | orjson.OPT_INDENT_2 if indent else OPTIONS
+    return orjson.dumps(data, default=_encoder.default, option=options)
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        renderer_context = renderer_context or {}
+        # orjson only indents by two spaces; any requested indent gets that.
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        ret = dumps(data, indent=bool(indent))
+        # Like DRF, escape the two characters JSON allows but JavaScript
+        # string literals do not.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028")
+            ret = ret.replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+
+class ORJSONParser(JSONParser):
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        try:
+            data = stream.read()
+            if encoding.lower().replace("-", "") != "utf8":
+                data = data.decode(encoding)
+            return orjson.loads(data)
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise ParseError(f"JSON parse error - {exc}")
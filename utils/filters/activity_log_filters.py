@@ -0,0 +1,60 @@
+import json
+
+import django_filters
+from django.db.models.fields.json import KT
+from rest_framework.exceptions import ValidationError
+
+from accounts.models import ActivityLog
+from utils.postgres import is_postgres
+
+
+class ActivityLogFilter(django_filters.FilterSet):
+    """
+    Filters for activity logs. The `details` filters are served by the
+    expression indexes on details->>'name' / details->>'email' and by the
+    GIN index on `details` (see ActivityLog.Meta.indexes).
+    """
+
+    user = django_filters.UUIDFilter(field_name="user")
+    action = django_filters.CharFilter(field_name="action")
+    resource = django_filters.CharFilter(field_name="resource")
+    timestamp__gte = django_filters.IsoDateTimeFilter(
+        field_name="timestamp", lookup_expr="gte"
+    )
+    timestamp__lt = django_filters.IsoDateTimeFilter(
+        field_name="timestamp", lookup_expr="lt"
+    )
+
+    details__name = django_filters.CharFilter(method="filter_details_key")
+    details__email = django_filters.CharFilter(method="filter_details_key")
+    details__contains = django_filters.CharFilter(
+        method="filter_details_contains",
+        label='JSON object the details must contain, e.g. {"name": "Jane Doe"}',
+    )
+
+    class Meta:
+        model = ActivityLog
+        fields = ["user", "action", "resource"]
+
+    def filter_details_key(self, queryset, name, value):
+        if not is_postgres(queryset.db):
+            return queryset.filter(**{name: value})
+        # Compare the text of the key (->>), the expression that is indexed,
+        # rather than the JSON value details__name compiles to.
+        alias = name.replace("__", "_")
+        return queryset.alias(**{alias: KT(name)}).filter(**{alias: value})
+
+    def filter_details_contains(self, queryset, name, value):
+        try:
+            document = json.loads(value)
+        except ValueError:
+            raise ValidationError({name: "Must be a JSON object."})
+        if not isinstance(document, dict):
+            raise ValidationError({name: "Must be a JSON object."})
+
+        if is_postgres(queryset.db):
+            return queryset.filter(details__contains=document)
+        # Other backends have no containment operator: compare key by key.
+        return queryset.filter(
+            **{f"details__{key}": item for key, item in document.items()}
+        )
@@ -0,0 +1,32 @@
+from django_filters import rest_framework as filters
+
+from programs.models import SchoolSupport
+
+
+class SchoolSupportFilter(filters.FilterSet):
+    # total_cost and balance_due are generated columns: filtered in the
+    # database.
+    total_cost_min = filters.NumberFilter(
+        field_name="total_cost", lookup_expr="gte", label="Total cost minimum"
+    )
+    total_cost_max = filters.NumberFilter(
+        field_name="total_cost", lookup_expr="lte", label="Total cost maximum"
+    )
+    balance_due_min = filters.NumberFilter(
+        field_name="balance_due", lookup_expr="gte", label="Balance due minimum"
+    )
+    balance_due_max = filters.NumberFilter(
+        field_name="balance_due", lookup_expr="lte", label="Balance due maximum"
+    )
+
+    class Meta:
+        model = SchoolSupport
+        fields = [
+            "payment_status",
+            "academic_year",
+            "school",
+            "total_cost_min",
+            "total_cost_max",
+            "balance_due_min",
+            "balance_due_max",
+        ]
@@ -0,0 +1,132 @@
+"""
+Stored full-text search vectors.
+
+Models inheriting `SearchVectorModel` list their searchable text columns
+with a weight in `search_vector_fields`; the weighted tsvector is written to
+`search_vector` after each save (Postgres only) and indexed with GIN:
+
+    class HealthRecord(SearchVectorModel):
+        search_vector_fields = [("diagnosis", "A"), ("treatment", "B")]
+
+        class Meta:
+            indexes = postgres_only(
+                GinIndex(fields=["search_vector"], name="health_record_search_gin"),
+            )
+
+Rows changed with `QuerySet.update()` are not re-indexed; run
+`manage.py rebuild_search_vectors` after such bulk changes.
+"""
+
+import operator
+import re
+from functools import reduce
+
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+)
+from django.db import models
+from django.db.models import F, Q
+
+from utils.postgres import is_postgres
+
+_WORD = re.compile(r"\w+")
+
+RANK_ANNOTATION = "search_rank"
+
+
+def search_config():
+    return getattr(settings, "FULL_TEXT_SEARCH_CONFIG", "simple")
+
+
+class SearchVectorModel(models.Model):
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    search_vector_fields = ()
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and not set(update_fields) & set(
+            self.search_vector_field_names()
+        ):
+            return
+        if is_postgres(self._state.db):
+            self.update_search_vector()
+
+    @classmethod
+    def search_vector_field_names(cls):
+        return [field for field, _ in cls.search_vector_fields]
+
+    @classmethod
+    def search_vector_expression(cls):
+        config = search_config()
+        return reduce(
+            operator.add,
+            (
+                SearchVector(field, weight=weight, config=config)
+                for field, weight in cls.search_vector_fields
+            ),
+        )
+
+    def update_search_vector(self):
+        type(self)._base_manager.using(self._state.db).filter(pk=self.pk).update(
+            search_vector=self.search_vector_expression()
+        )
+
+    @classmethod
+    def rebuild_search_vectors(cls, queryset=None):
+        if queryset is None:
+            queryset = cls._base_manager.all()
+        return queryset.update(search_vector=cls.search_vector_expression())
+
+
+def prefix_query(text, weights=""):
+    """
+    A tsquery matching every word of `text` as a prefix, so that partial
+    words keep matching like `icontains` did, in the columns of the given
+    `weights` ("ABC") or in all of them. None if `text` has no words.
+    """
+    words = _WORD.findall(text)
+    if not words:
+        return None
+    return SearchQuery(
+        " & ".join(f"{word}:*{weights}" for word in words),
+        search_type="raw",
+        config=search_config(),
+    )
+
+
+def rank_by(queryset, query):
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    return queryset.annotate(
+        **{RANK_ANNOTATION: SearchRank(F("search_vector"), query)}
+    ).order_by(f"-{RANK_ANNOTATION}", *ordering)
+
+
+def full_text_search(queryset, text, weights=""):
+    """
+    Rows whose search vector matches `text`, best matches first. With
+    `weights`, only the columns of those weights are searched.
+
+    Falls back to `icontains` on the vector's columns when the database is
+    not Postgres.
+    """
+    model = queryset.model
+    query = prefix_query(text, weights) if is_postgres(queryset.db) else None
+
+    if query is None:
+        condition = Q()
+        for field, weight in model.search_vector_fields:
+            if not weights or weight in weights:
+                condition |= Q(**{f"{field}__icontains": text})
+        return queryset.filter(condition)
+
+    return rank_by(queryset.filter(search_vector=query), query)
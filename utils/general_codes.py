@@ -1,6 +1,10 @@
+import os
 import string
 import random
 import secrets
+import threading
+import time
+import uuid
 
 
 def generate_manager_password(length=8):
@@ -8,5 +12,38 @@ def generate_manager_password(length=8):
     return "".join(random.choice(chars) for _ in range(length))
 def generate_verification_code(length=6):
     return ''.join(str(secrets.randbelow(10)) for _ in range(length))
-    
 
+
+_uuid7_lock = threading.Lock()
+_uuid7_last = [0, 0]  # milliseconds, counter
+
+
+def uuid7():
+    """
+    A time-ordered UUID (RFC 9562 version 7): 48 bits of Unix milliseconds,
+    a 12 bit counter keeping ids from the same process increasing within a
+    millisecond, then 62 random bits.
+    """
+    with _uuid7_lock:
+        millis = time.time_ns() // 1_000_000
+        last_millis, counter = _uuid7_last
+        if millis > last_millis:
+            # Start low enough in the counter space to leave room to count.
+            counter = secrets.randbits(11)
+        else:
+            millis = last_millis
+            counter += 1
+            if counter > 0xFFF:
+                millis += 1
+                counter = secrets.randbits(11)
+        _uuid7_last[:] = [millis, counter]
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (
+        (millis & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
@@ -0,0 +1,65 @@
+"""
+The queries on the hot paths of the API and the scheduled jobs, each of
+which must be served by an index. Used by `manage.py explain_hot_queries`
+and by the plan regression test. The jobs' queries come from the task
+modules themselves, so that the plans checked are the ones they run.
+"""
+
+import datetime
+import uuid
+
+from django.db.models import Sum
+
+from accounts.models import ActivityLog
+from donations.tasks import (
+    due_recurring_donations,
+    sponsor_email_logs,
+    sponsor_pairs,
+)
+from programs.models import ChildProgress, ParentAttendance
+from programs.models.ifashe_models import SchoolPayment
+
+
+def hot_queries():
+    """
+    (label, queryset) pairs. Lookups use placeholder ids: only the plan
+    matters, not the rows.
+    """
+    some_id = uuid.uuid4()
+    today = datetime.date(2025, 1, 15)
+
+    return [
+        ("monthly sponsor emails: donor/child pairs", sponsor_pairs()),
+        ("recurring donations due", due_recurring_donations(today)),
+        (
+            "sponsor email already sent",
+            sponsor_email_logs(some_id, some_id, today.month, today.year),
+        ),
+        (
+            "child progress timeline",
+            ChildProgress.objects.filter(child_id=some_id).order_by("created_on"),
+        ),
+        (
+            "recent activity",
+            ActivityLog.objects.order_by("-timestamp")[:20],
+        ),
+        (
+            "activity of a resource",
+            ActivityLog.objects.filter(
+                resource="Child", resource_id=str(some_id)
+            ).order_by(),
+        ),
+        (
+            "parent attendance by status",
+            ParentAttendance.objects.filter(
+                work_record_id=some_id, status=ParentAttendance.PRESENT
+            ).order_by(),
+        ),
+        (
+            "school payments total",
+            SchoolPayment.objects.filter(school_support_id=some_id)
+            .values("school_support")
+            .annotate(total=Sum("amount"))
+            .order_by(),
+        ),
+    ]
@@ -0,0 +1,150 @@
+"""
+Per-table version counters kept in the cache.
+
+Every save or delete of a tracked model bumps the version of its table, so
+cache entries whose key embeds the versions of the tables they were
+computed from stop being read as soon as one of those tables changes.
+`QuerySet.update()` and `bulk_create()` do not send signals: code using
+them calls `bump_version(model)` itself.
+
+Only the models passed to `track()` get receivers: a post_delete receiver
+turns off Django's fast delete for its sender, so listening to every model
+would make each `queryset.delete()` and cascade load its rows. `track()` is
+called at startup with the models the cached views read (see
+`utils.response_cache.view_models`), in every process, web or worker.
+`get_versions()` returns None for tables of untracked models, and callers
+then skip their cache.
+
+A bump is made at once and again when the transaction commits: a reader
+that cached the old committed rows under the first bump, before the
+commit, is not read after the second one.
+"""
+
+import functools
+import time
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connections, router, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+KEY_PREFIX = "model-version"
+
+
+def _key(table):
+    return f"{KEY_PREFIX}:{table}"
+
+
+def _seed():
+    # A fresh value for a counter that was never set or has been evicted, so
+    # that it cannot fall back onto a version that was already used.
+    return time.time_ns()
+
+
+_tracked_tables = set()
+
+
+def _incr(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, _seed(), timeout=None)
+
+
+def bump_version(model_or_table, using=None):
+    meta = getattr(model_or_table, "_meta", None)
+    table = getattr(meta, "db_table", model_or_table)
+    key = _key(table)
+    _incr(key)
+
+    if using is None:
+        using = router.db_for_write(meta.model) if meta else "default"
+    if connections[using].in_atomic_block:
+        transaction.on_commit(functools.partial(_incr, key), using=using)
+
+
+@functools.lru_cache(maxsize=None)
+def _model_tables():
+    return {
+        model._meta.db_table for model in apps.get_models(include_auto_created=True)
+    }
+
+
+def get_versions(tables):
+    """
+    Current version of each table, as a dict ordered like `tables`, or None
+    when one of them belongs to a model that is not tracked. Tables that
+    are no model's (custom counters) are always versioned.
+    """
+    tables = sorted(set(tables))
+    if (set(tables) & _model_tables()) - _tracked_tables:
+        return None
+    keys = {_key(table): table for table in tables}
+    found = cache.get_many(list(keys))
+
+    for key in keys:
+        if key not in found:
+            cache.add(key, _seed(), timeout=None)
+            found[key] = cache.get(key)
+
+    return {keys[key]: found[key] for key in keys}
+
+
+def queryset_tables(queryset):
+    """
+    Tables a queryset reads from: its own table and every joined one.
+    """
+    tables = {queryset.model._meta.db_table}
+    for join in queryset.query.alias_map.values():
+        tables.add(join.table_name)
+    return tables
+
+
+def _on_change(sender, using, **kwargs):
+    bump_version(sender, using)
+
+
+def _on_m2m_change(sender, action, instance, model, using, **kwargs):
+    if action.startswith("post_"):
+        bump_version(sender, using)
+        bump_version(type(instance), using)
+        bump_version(model, using)
+
+
+def _connect(model):
+    uid = f"model_versions:{model._meta.label}"
+    post_save.connect(_on_change, sender=model, dispatch_uid=f"{uid}:post_save")
+    post_delete.connect(_on_change, sender=model, dispatch_uid=f"{uid}:post_delete")
+    _tracked_tables.add(model._meta.db_table)
+
+
+def track(*models):
+    """
+    Bump the versions of `models` (and of models sharing their tables) on
+    every save, delete and many-to-many change.
+    """
+    tables = {model._meta.db_table for model in models}
+    for model in apps.get_models(include_auto_created=True):
+        if model._meta.db_table in tables:
+            _connect(model)
+
+    for model in apps.get_models():
+        if model._meta.db_table not in tables:
+            continue
+        for field in model._meta.get_fields(include_hidden=True):
+            if not field.many_to_many:
+                continue
+            # The forward field keeps its through model on the rel, the
+            # reverse rel on itself.
+            through = getattr(field, "through", None) or field.remote_field.through
+            _connect(through)
+            m2m_changed.connect(
+                _on_m2m_change,
+                sender=through,
+                dispatch_uid=f"model_versions:{through._meta.label}:m2m_changed",
+            )
+
+
+def tracked_tables():
+    return frozenset(_tracked_tables)
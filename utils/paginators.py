@@ -1,67 +1,348 @@
+import base64
+import datetime
+import json
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import (
+    BasePagination,
     PageNumberPagination,
     LimitOffsetPagination,
-    CursorPagination,
+    _positive_int,
 )
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from collections import OrderedDict
 
+from utils.counts import count_queryset
+
+
+class _CursorEncoder(DjangoJSONEncoder):
+    # DjangoJSONEncoder truncates datetimes to milliseconds, which would make
+    # the seek condition skip or repeat rows.
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Seek-method pagination: each page is fetched with a WHERE condition on
+    the ordering values of the previous page's edge row instead of an
+    OFFSET, so deep pages cost the same as the first one.
+
+    The ordering is whatever the queryset is ordered by (OrderingFilter has
+    already validated `?ordering=` against the view's `ordering_fields`),
+    plus the primary key as a unique tiebreaker. NULLs sort last in
+    ascending order and first in descending order, on every backend.
+
+    Pages carry no count unless `include_count` is set: counting every
+    page would cost what the seek saves.
+    """
 
-class StandardResultsSetPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
-    max_page_size = 50
-    page_query_param = "page"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    include_count = False
+    invalid_cursor_message = "Invalid cursor"
 
-    def get_paginated_response(self, data):
-        return Response(
-            OrderedDict(
-                [
-                    ("count", self.page.paginator.count),
-                    ("total_pages", self.page.paginator.num_pages),
-                    ("current_page", self.page.number),
-                    ("page_size", self.get_page_size(self.request)),
-                    ("next", self.get_next_link()),
-                    ("previous", self.get_previous_link()),
-                    ("results", data),
-                ]
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.ordering = self.get_ordering(queryset)
+        self.count, self.count_is_estimate = (
+            count_queryset(queryset) if self.include_count else (None, False)
+        )
+        cursor = self.decode_cursor(request)
+        reverse = cursor is not None and cursor["direction"] == "previous"
+
+        queryset = queryset.order_by(*self._order_by(reverse))
+        if cursor is not None:
+            queryset = queryset.filter(
+                self._bound(queryset.model, cursor["values"][0], reverse),
+                self._seek(cursor["values"], reverse),
             )
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.page = rows
+        self.has_next = has_more if not reverse else True
+        self.has_previous = (
+            cursor is not None if not reverse else has_more
         )
+        return rows
 
+    def get_page_size(self, request):
+        if self.page_size_query_param:
+            try:
+                return _positive_int(
+                    request.query_params[self.page_size_query_param],
+                    strict=True,
+                    cutoff=self.max_page_size,
+                )
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
 
-class LargeResultsSetPagination(PageNumberPagination):
-    page_size = 50
-    page_size_query_param = "page_size"
-    max_page_size = 500
-    page_query_param = "page"
+    def get_ordering(self, queryset):
+        ordering = [
+            field
+            for field in (queryset.query.order_by or queryset.model._meta.ordering)
+            if isinstance(field, str) and field != "?"
+        ]
+        pk_name = queryset.model._meta.pk.name
+        if not any(field.lstrip("-") in (pk_name, "pk") for field in ordering):
+            descending = bool(ordering) and ordering[0].startswith("-")
+            ordering.append(f"-{pk_name}" if descending else pk_name)
+        return ordering
+
+    def _order_by(self, reverse):
+        order_by = []
+        for field in self.ordering:
+            descending = field.startswith("-") != reverse
+            expression = F(field.lstrip("-"))
+            if descending:
+                order_by.append(expression.desc(nulls_first=True))
+            else:
+                order_by.append(expression.asc(nulls_last=True))
+        return order_by
+
+    def _seek(self, values, reverse):
+        """
+        Rows strictly after the cursor row:
+        (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...
+        """
+        condition = Q(pk__in=[])
+        equal = Q()
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip("-")
+            descending = field.startswith("-") != reverse
+            condition |= equal & self._after(name, value, descending)
+            if value is None:
+                equal &= Q(**{f"{name}__isnull": True})
+            else:
+                equal &= Q(**{name: value})
+        return condition
+
+    def _bound(self, model, value, reverse):
+        """
+        A redundant range on the leading column alone, implied by the seek
+        condition, that lets the database start an index scan at the
+        cursor: k1 >= v1 (k1 <= v1 descending).
+        """
+        field = self.ordering[0]
+        name = field.lstrip("-")
+        if field.startswith("-") != reverse:
+            if value is None:
+                return Q()
+            return Q(**{f"{name}__lte": value})
+        if value is None:
+            return Q(**{f"{name}__isnull": True})
+        bound = Q(**{f"{name}__gte": value})
+        if self._is_nullable(model, name):
+            bound |= Q(**{f"{name}__isnull": True})
+        return bound
+
+    @staticmethod
+    def _is_nullable(model, name):
+        # Annotations and aliases such as "pk" are taken as nullable.
+        *relations, column = name.split("__")
+        try:
+            for relation in relations:
+                field = model._meta.get_field(relation)
+                if field.null or not field.many_to_one:
+                    return True
+                model = field.related_model
+            return model._meta.get_field(column).null
+        except FieldDoesNotExist:
+            return True
+
+    @staticmethod
+    def _after(name, value, descending):
+        if descending:
+            # NULLs come first, so nothing but smaller values follows.
+            if value is None:
+                return Q(**{f"{name}__isnull": False})
+            return Q(**{f"{name}__lt": value})
+        # NULLs come last and follow every value.
+        if value is None:
+            return Q(pk__in=[])
+        return Q(**{f"{name}__gt": value}) | Q(**{f"{name}__isnull": True})
+
+    def _row_values(self, row):
+        values = []
+        for field in self.ordering:
+            name = field.lstrip("-")
+            if isinstance(row, tuple):
+                # A named values_list() row holding the ordering columns.
+                values.append(getattr(row, name))
+                continue
+            value = row
+            for attr in name.split("__"):
+                value = getattr(value, attr, None)
+                if value is None:
+                    break
+            if hasattr(value, "pk"):
+                value = value.pk
+            values.append(value)
+        return values
+
+    def encode_cursor(self, row, direction):
+        payload = {
+            "o": self.ordering,
+            "v": self._row_values(row),
+            "d": direction,
+        }
+        data = json.dumps(payload, cls=_CursorEncoder, separators=(",", ":"))
+        encoded = base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            values = payload["v"]
+            direction = payload["d"]
+            ordering = payload["o"]
+        except (TypeError, ValueError, KeyError, UnicodeEncodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if (
+            ordering != self.ordering
+            or len(values) != len(self.ordering)
+            or direction not in ("next", "previous")
+        ):
+            raise NotFound(self.invalid_cursor_message)
+        return {"values": values, "direction": direction}
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], "next")
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], "previous")
 
     def get_paginated_response(self, data):
-        return Response(
-            OrderedDict(
-                [
-                    ("count", self.page.paginator.count),
-                    ("total_pages", self.page.paginator.num_pages),
-                    ("current_page", self.page.number),
-                    ("page_size", self.get_page_size(self.request)),
-                    ("next", self.get_next_link()),
-                    ("previous", self.get_previous_link()),
-                    ("results", data),
-                ]
-            )
-        )
+        envelope = []
+        if self.include_count:
+            envelope.append(("count", self.count))
+            envelope.append(("count_is_estimate", self.count_is_estimate))
+        envelope += [
+            ("page_size", self.page_size),
+            ("next", self.get_next_link()),
+            ("previous", self.get_previous_link()),
+            ("results", data),
+        ]
+        return Response(OrderedDict(envelope))
 
 
-class SmallResultsSetPagination(PageNumberPagination):
-    page_size = 5
+class _EstimatedPage(Page):
+    def __init__(self, object_list, number, paginator, has_more):
+        super().__init__(object_list, number, paginator)
+        self._has_more = has_more
+
+    def has_next(self):
+        return self._has_more
+
+    def end_index(self):
+        return self.start_index() + len(self.object_list) - 1
+
+
+class CountingPaginator(Paginator):
+    """
+    Paginator whose count comes from `count_queryset()`.
+
+    When the count is a planner estimate, the page number is not checked
+    against `num_pages` and the page is sliced without clamping to the
+    count, since the real number of rows may be on either side of it.
+    """
+
+    @cached_property
+    def _count(self):
+        return count_queryset(self.object_list)
+
+    @property
+    def count(self):
+        return self._count[0]
+
+    @property
+    def count_is_estimate(self):
+        return self._count[1]
+
+    def validate_number(self, number):
+        if not self.count_is_estimate:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.count_is_estimate:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        has_more = len(rows) > self.per_page
+        return _EstimatedPage(rows[: self.per_page], number, self, has_more)
+
+
+class KeysetSelectablePagination(PageNumberPagination):
+    """
+    Page-number pagination that a client can switch to keyset pagination
+    with `?paginate=cursor`.
+    """
+
     page_size_query_param = "page_size"
-    max_page_size = 20
     page_query_param = "page"
+    paginate_query_param = "paginate"
+    keyset_class = KeysetPagination
+    django_paginator_class = CountingPaginator
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if request.query_params.get(self.paginate_query_param) == "cursor":
+            self.keyset = self.keyset_class()
+            self.keyset.page_size = self.page_size
+            self.keyset.max_page_size = self.max_page_size
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
 
     def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
         return Response(
             OrderedDict(
                 [
                     ("count", self.page.paginator.count),
+                    ("count_is_estimate", self.page.paginator.count_is_estimate),
                     ("total_pages", self.page.paginator.num_pages),
                     ("current_page", self.page.number),
                     ("page_size", self.get_page_size(self.request)),
@@ -73,17 +354,37 @@ class SmallResultsSetPagination(PageNumberPagination):
         )
 
 
+class StandardResultsSetPagination(KeysetSelectablePagination):
+    page_size = 10
+    max_page_size = 50
+
+
+class LargeResultsSetPagination(KeysetSelectablePagination):
+    page_size = 50
+    max_page_size = 500
+
+
+class SmallResultsSetPagination(KeysetSelectablePagination):
+    page_size = 5
+    max_page_size = 20
+
+
 class CustomLimitOffsetPagination(LimitOffsetPagination):
     default_limit = 10
     max_limit = 100
     limit_query_param = "limit"
     offset_query_param = "offset"
 
+    def get_count(self, queryset):
+        count, self.count_is_estimate = count_queryset(queryset)
+        return count
+
     def get_paginated_response(self, data):
         return Response(
             OrderedDict(
                 [
                     ("count", self.count),
+                    ("count_is_estimate", self.count_is_estimate),
                     ("limit", self.limit),
                     ("offset", self.offset),
                     ("next", self.get_next_link()),
@@ -94,12 +395,8 @@ class CustomLimitOffsetPagination(LimitOffsetPagination):
         )
 
 
-class CustomCursorPagination(CursorPagination):
+class CustomCursorPagination(KeysetPagination):
     page_size = 10
-    page_size_query_param = "page_size"
-    max_page_size = 100
-    ordering = "-created_on"
-    cursor_query_param = "cursor"
 
     def get_paginated_response(self, data):
         return Response(
@@ -113,12 +410,8 @@ class CustomCursorPagination(CursorPagination):
         )
 
 
-class ProgressCursorPagination(CursorPagination):
+class ProgressCursorPagination(CustomCursorPagination):
     page_size = 20
-    page_size_query_param = "page_size"
-    max_page_size = 100
-    ordering = "-created_on"
-    cursor_query_param = "cursor"
 
 
 class NoPagination(PageNumberPagination):
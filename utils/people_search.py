@@ -0,0 +1,149 @@
+"""
+One query searching people across the programs.
+
+Each `SearchSource` turns a model into rows of the same shape
+(type, id, title, subtitle, score); the sources allowed for the request are
+combined with UNION ALL and ordered by score.
+
+On Postgres a word matches a column either as a substring (`icontains`) or
+by trigram similarity (`%`), which tolerates misspelled names; both are
+served by the trigram indexes declared with `trigram_index()`. Elsewhere the
+search is a plain `icontains`, like the per-program search filters.
+"""
+
+import re
+
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import (
+    CharField,
+    F,
+    FloatField,
+    Q,
+    Value,
+)
+from django.db.models.functions import Cast, Coalesce, Concat, Greatest, Upper
+
+from utils.postgres import is_postgres
+
+MAX_WORDS = 5
+_WORD = re.compile(r"[\w@.+-]+")
+
+
+class SearchSource:
+    """
+    `title` and `subtitle` are field paths rendered in the hit, `fields` are
+    matched as substrings and `fuzzy_fields` (names) also by similarity.
+    """
+
+    def __init__(
+        self,
+        type,
+        model,
+        title,
+        fields,
+        fuzzy_fields=(),
+        subtitle=(),
+        permission_classes=(),
+        basename=None,
+    ):
+        self.type = type
+        self.model = model
+        self.title = title
+        self.fields = fields
+        self.fuzzy_fields = fuzzy_fields
+        self.subtitle = subtitle
+        self.permission_classes = permission_classes
+        self.basename = basename
+
+    def has_permission(self, request, view):
+        return all(
+            permission().has_permission(request, view)
+            for permission in self.permission_classes
+        )
+
+    def queryset(self, words, fuzzy):
+        queryset = self.model._default_manager.order_by()
+        upper_words = [word.upper() for word in words]
+        if fuzzy:
+            queryset = queryset.alias(
+                **{f"upper_{field}": Upper(field) for field in self.fuzzy_fields}
+            )
+
+        for word, upper in zip(words, upper_words):
+            condition = Q()
+            for field in self.fields:
+                condition |= Q(**{f"{field}__icontains": word})
+            if fuzzy:
+                for field in self.fuzzy_fields:
+                    condition |= Q(**{f"upper_{field}__trigram_similar": upper})
+            queryset = queryset.filter(condition)
+
+        return queryset.annotate(
+            hit_type=Value(self.type, output_field=CharField()),
+            hit_id=F("pk"),
+            hit_title=_join(self.title),
+            hit_subtitle=_join(self.subtitle),
+            hit_score=(
+                self.score(upper_words)
+                if fuzzy
+                else Value(0.0, output_field=FloatField())
+            ),
+        ).values("hit_type", "hit_id", "hit_title", "hit_subtitle", "hit_score")
+
+    def score(self, upper_words):
+        scores = []
+        for upper in upper_words:
+            similarities = [
+                TrigramSimilarity(Upper(field), upper)
+                for field in self.fuzzy_fields or self.fields
+            ]
+            scores.append(
+                similarities[0] if len(similarities) == 1 else Greatest(*similarities)
+            )
+        total = scores[0]
+        for score in scores[1:]:
+            total = total + score
+        return Cast(total / len(scores), FloatField())
+
+
+def _join(paths):
+    if not paths:
+        return Value("", output_field=CharField())
+    if len(paths) == 1:
+        return Coalesce(F(paths[0]), Value(""), output_field=CharField())
+    parts = [F(paths[0])]
+    for path in paths[1:]:
+        parts += [Value(" "), F(path)]
+    return Concat(*parts, output_field=CharField())
+
+
+def search_words(text):
+    return _WORD.findall(text or "")[:MAX_WORDS]
+
+
+def search_people(sources, text, limit=20):
+    """
+    Ranked hits for `text` across `sources`, as dicts with type, id, title,
+    subtitle and score.
+    """
+    words = search_words(text)
+    if not words or not sources:
+        return []
+
+    fuzzy = is_postgres()
+    querysets = [source.queryset(words, fuzzy) for source in sources]
+    combined = querysets[0]
+    if len(querysets) > 1:
+        combined = combined.union(*querysets[1:], all=True)
+    combined = combined.order_by("-hit_score", "hit_title")[:limit]
+
+    return [
+        {
+            "type": row["hit_type"],
+            "id": str(row["hit_id"]),
+            "title": row["hit_title"].strip(),
+            "subtitle": row["hit_subtitle"].strip(),
+            "score": round(row["hit_score"], 4),
+        }
+        for row in combined
+    ]
@@ -0,0 +1,51 @@
+"""
+Helpers for features that only exist on PostgreSQL.
+
+Production runs on Postgres; the test suite runs on SQLite. Indexes that
+SQLite cannot create (GIN, trigram, expression indexes with operator
+classes...) are wrapped in `postgres_only()` in the model Meta, and code
+using Postgres-only SQL checks `is_postgres()` and falls back to a portable
+query.
+"""
+
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models.functions import Upper
+
+# Extensions created before migrations run (see create_extensions).
+EXTENSIONS = ["pg_trgm"]
+
+
+def is_postgres(using=DEFAULT_DB_ALIAS):
+    return connections[using].vendor == "postgresql"
+
+
+def postgres_only(*items, using=DEFAULT_DB_ALIAS):
+    """
+    `items` when the database is configured for Postgres, an empty list
+    otherwise. Evaluated when the models module is imported.
+    """
+    engine = settings.DATABASES.get(using, {}).get("ENGINE", "")
+    if "postgresql" in engine or "postgis" in engine:
+        return list(items)
+    return []
+
+
+def trigram_index(field, name):
+    """
+    GIN trigram index on UPPER(field): the expression `icontains` compiles to
+    on Postgres, so it serves both substring and similarity (`%`) matches.
+    """
+    return GinIndex(OpClass(Upper(field), name="gin_trgm_ops"), name=name)
+
+
+def create_extensions(using=DEFAULT_DB_ALIAS, **kwargs):
+    """
+    pre_migrate receiver creating the extensions the models' indexes need.
+    """
+    if not is_postgres(using):
+        return
+    with connections[using].cursor() as cursor:
+        for extension in EXTENSIONS:
+            cursor.execute(f"CREATE EXTENSION IF NOT EXISTS {extension}")
@@ -0,0 +1,187 @@
+import json
+import re
+from collections import Counter
+from contextlib import contextmanager
+
+from django.db import connections, transaction, DEFAULT_DB_ALIAS
+from django.db.models import Model
+
+
+_IN_LIST = re.compile(r"\bIN \((?:%s|\?)(?:, ?(?:%s|\?))*\)", re.IGNORECASE)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_SQLITE_SCAN = re.compile(r"\bSCAN (?:TABLE )?(\w+)(.*)$")
+
+
+def normalize_sql(sql):
+    """
+    Reduce a SQL statement to its shape, so that two queries differing only
+    by their parameters compare equal.
+    """
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = sql.replace("%s", "?")
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class QueryRecorder:
+    """
+    Records every SQL statement executed on a connection while active.
+
+        with QueryRecorder() as recorder:
+            client.get("/api/children/")
+        recorder.assert_no_repeats()
+    """
+
+    def __init__(self, using=DEFAULT_DB_ALIAS):
+        self.connection = connections[using]
+        self.queries = []
+        self._wrapper = None
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append(sql)
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+        self.queries = []
+        self._wrapper = self.connection.execute_wrapper(self)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._wrapper.__exit__(exc_type, exc_value, traceback)
+
+    def __len__(self):
+        return len(self.queries)
+
+    @property
+    def shapes(self):
+        return Counter(normalize_sql(sql) for sql in self.queries)
+
+    def repeated(self, threshold=2):
+        """
+        Query shapes executed at least `threshold` times.
+        """
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+    def report(self, threshold=2, label=None):
+        lines = [f"{label or 'Request'} ran {len(self.queries)} queries."]
+        repeated = self.repeated(threshold)
+        if repeated:
+            lines.append("Repeated query shapes (likely N+1):")
+            for shape, count in repeated:
+                lines.append(f"  {count}x  {shape[:300]}")
+        return "\n".join(lines)
+
+    def assert_no_repeats(self, threshold=2, label=None):
+        if self.repeated(threshold):
+            raise AssertionError(self.report(threshold, label))
+
+
+@contextmanager
+def record_queries(using=DEFAULT_DB_ALIAS):
+    with QueryRecorder(using) as recorder:
+        yield recorder
+
+
+class DeferredLoadError(AssertionError):
+    pass
+
+
+@contextmanager
+def forbid_deferred_loads():
+    """
+    Fail when a deferred field is loaded lazily from an instance while
+    active. Reading a deferred attribute runs one query per row, so a list
+    view doing it is an N+1.
+
+        with forbid_deferred_loads():
+            client.get("/api/children/")
+    """
+    refresh_from_db = Model.refresh_from_db
+
+    def guarded_refresh_from_db(self, using=None, fields=None, **kwargs):
+        if fields is not None:
+            deferred = set(fields) & self.get_deferred_fields()
+            if deferred:
+                raise DeferredLoadError(
+                    f"{type(self).__name__}.{', '.join(sorted(deferred))} was "
+                    "deferred and loaded lazily. Render it from the serializer "
+                    "or declare it in Meta.field_sources."
+                )
+        return refresh_from_db(self, using=using, fields=fields, **kwargs)
+
+    Model.refresh_from_db = guarded_refresh_from_db
+    try:
+        yield
+    finally:
+        Model.refresh_from_db = refresh_from_db
+
+
+class QueryAuditMixin:
+    """
+    TestCase helpers built on QueryRecorder.
+    """
+
+    def assertNoNPlusOne(self, func, threshold=3, label=None):
+        with QueryRecorder() as recorder:
+            result = func()
+        recorder.assert_no_repeats(threshold, label)
+        return result
+
+    def assertQueryCountStable(self, small, large, label=None):
+        """
+        Compare two QueryRecorders taken at different data sizes.
+        """
+        if len(small) != len(large):
+            raise AssertionError(
+                f"{label or 'Request'}: query count grew from {len(small)} "
+                f"to {len(large)} with more data.\n{large.report(label=label)}"
+            )
+
+
+def explain(queryset):
+    """
+    The plan of `queryset`: parsed JSON on Postgres, text elsewhere.
+
+    On Postgres sequential scans are disabled while planning, so a Seq Scan
+    in the plan means no index can serve the query, not that the table is
+    small enough for a scan to be cheaper.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.explain()
+
+    with transaction.atomic(using=queryset.db):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        return json.loads(queryset.explain(format="json"))
+
+
+def sequential_scans(queryset):
+    """
+    Tables read in full by the plan of `queryset`.
+    """
+    plan = explain(queryset)
+    if isinstance(plan, str):
+        tables = set()
+        for line in plan.splitlines():
+            match = _SQLITE_SCAN.search(line)
+            if match and "INDEX" not in match.group(2) and match.group(1) != "CONSTANT":
+                tables.add(match.group(1))
+        return sorted(tables)
+
+    tables = set()
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if node["Node Type"] == "Seq Scan":
+            tables.add(node["Relation Name"])
+        nodes.extend(node.get("Plans", []))
+    return sorted(tables)
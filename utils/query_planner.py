@@ -0,0 +1,324 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, RelatedField
+
+
+class _Node:
+    """
+    Columns and relations a serializer needs from one model.
+
+    Forward foreign keys and one-to-one relations become `joins`
+    (select_related), reverse foreign keys and many-to-many relations
+    become `prefetches`. `load_all` is set when a rendered attribute is not
+    a concrete column (a property, a method...), in which case every column
+    of the model is loaded.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.columns = set()
+        self.load_all = False
+        self.joins = {}
+        self.prefetches = {}
+
+    def join(self, name, model):
+        if name not in self.joins:
+            self.joins[name] = _Node(model)
+        return self.joins[name]
+
+    def prefetch(self, name, model):
+        if name not in self.prefetches:
+            self.prefetches[name] = _Node(model)
+        return self.prefetches[name]
+
+
+class QueryPlanner:
+    """
+    Builds the minimal select_related / prefetch_related / only() for a
+    serializer by walking its fields and their `source` paths.
+
+    Attributes that are not model columns (properties, SerializerMethodField)
+    cannot be introspected. Their dependencies can be declared on the
+    serializer Meta as dotted sources, otherwise the planner falls back to
+    loading every column:
+
+        class Meta:
+            field_sources = {"child_name": ["child.first_name", "child.last_name"]}
+    """
+
+    def __init__(self, serializer, model=None):
+        self.serializer = serializer
+        self.model = model or serializer.Meta.model
+        self.opaque = False
+
+    def build(self):
+        root = _Node(self.model)
+        self._walk_serializer(root, self.serializer)
+        return root
+
+    def apply(self, queryset):
+        root = self.build()
+        return self._compile(root, queryset)
+
+    # Walking the serializer
+
+    def _walk_serializer(self, node, serializer):
+        if isinstance(serializer, serializers.ListSerializer):
+            serializer = serializer.child
+
+        meta = getattr(serializer, "Meta", None)
+        declared_sources = getattr(meta, "field_sources", {})
+
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+
+            if name in declared_sources:
+                for dotted in declared_sources[name]:
+                    self._walk_path(node, dotted.split("."), None)
+                continue
+
+            if isinstance(field, serializers.SerializerMethodField):
+                node.load_all = True
+                self.opaque = True
+                continue
+
+            if field.source == "*":
+                if isinstance(field, serializers.BaseSerializer):
+                    self._walk_serializer(node, field)
+                else:
+                    node.load_all = True
+                continue
+
+            self._walk_path(node, field.source_attrs, field)
+
+    def _walk_path(self, node, attrs, field):
+        model = node.model
+        for index, attr in enumerate(attrs):
+            is_last = index == len(attrs) - 1
+
+            if attr.startswith("get_") and attr.endswith("_display"):
+                attr = attr[len("get_") : -len("_display")]
+
+            try:
+                model_field = model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                node.load_all = True
+                return
+
+            if not model_field.is_relation:
+                node.columns.add(model_field.name)
+                return
+
+            related_model = model_field.related_model
+            single_valued = model_field.many_to_one or model_field.one_to_one
+
+            if single_valued:
+                if is_last and self._pk_only(field):
+                    node.columns.add(model_field.name)
+                    return
+                if model_field.concrete:
+                    node.columns.add(model_field.name)
+                child = node.join(model_field.name, related_model)
+            else:
+                child = node.prefetch(model_field.name, related_model)
+
+            if is_last:
+                self._walk_terminal(child, field)
+                return
+
+            node, model = child, related_model
+
+    def _walk_terminal(self, node, field):
+        if isinstance(field, serializers.BaseSerializer):
+            self._walk_serializer(node, field)
+        elif isinstance(field, ManyRelatedField) and self._pk_only(
+            field.child_relation
+        ):
+            node.columns.add(node.model._meta.pk.name)
+        else:
+            node.load_all = True
+
+    @staticmethod
+    def _pk_only(field):
+        return isinstance(field, RelatedField) and field.use_pk_only_optimization()
+
+    # Compiling the plan
+
+    def _compile(self, node, queryset):
+        existing_prefetches = {
+            getattr(lookup, "prefetch_to", lookup)
+            for lookup in queryset._prefetch_related_lookups
+        }
+
+        restrict = self._can_restrict(node, queryset)
+        join_paths = []
+        only_fields = []
+        prefetches = []
+        self._collect(node, "", join_paths, only_fields, prefetches)
+        # Querysets from related managers assign the parent instance to each
+        # row, which reads the foreign key column.
+        only_fields.extend(field.name for field in queryset._known_related_objects)
+
+        if join_paths:
+            queryset = queryset.select_related(*join_paths)
+
+        for path, prefetch_node, reverse_name in prefetches:
+            if path in existing_prefetches:
+                continue
+            prefetch_queryset = prefetch_node.model._default_manager.all()
+            if reverse_name and not prefetch_node.load_all:
+                prefetch_node.columns.add(reverse_name)
+            prefetch_queryset = self._compile(prefetch_node, prefetch_queryset)
+            queryset = queryset.prefetch_related(
+                Prefetch(path, queryset=prefetch_queryset)
+            )
+
+        if restrict:
+            queryset = queryset.only(*only_fields)
+
+        return queryset
+
+    def _collect(self, node, prefix, join_paths, only_fields, prefetches):
+        if node.load_all:
+            columns = [field.name for field in node.model._meta.concrete_fields]
+        else:
+            columns = {node.model._meta.pk.name} | node.columns
+        only_fields.extend(f"{prefix}{column}" for column in sorted(columns))
+
+        for name, child in node.joins.items():
+            path = f"{prefix}{name}"
+            join_paths.append(path)
+            only_fields.append(path)
+            self._collect(child, f"{path}__", join_paths, only_fields, prefetches)
+
+        for name, child in node.prefetches.items():
+            model_field = node.model._meta.get_field(name)
+            reverse_name = (
+                model_field.field.name if model_field.one_to_many else None
+            )
+            prefetches.append((f"{prefix}{name}", child, reverse_name))
+
+    def _can_restrict(self, node, queryset):
+        if self.opaque or queryset.query.deferred_loading[0]:
+            return False
+        if queryset.query.select_related is True:
+            return False
+        if queryset.query.select_related:
+            return self._joins_planned(queryset.query.select_related, node)
+        return True
+
+    def _joins_planned(self, select_related, node):
+        # A join declared on the view but absent from the plan would be
+        # deferred by only(), which Django refuses.
+        for name, nested in select_related.items():
+            if name not in node.joins:
+                return False
+            if nested and not self._joins_planned(nested, node.joins[name]):
+                return False
+        return True
+
+
+def plan_queryset(queryset, serializer):
+    """
+    Apply the query plan of `serializer` (an instance) to `queryset`.
+    """
+    return QueryPlanner(serializer, queryset.model).apply(queryset)
+
+
+def serializer_models(serializer, model=None):
+    """
+    Models whose rows `serializer` (an instance) renders: its own model and
+    every joined or prefetched one.
+    """
+    models = []
+    nodes = [QueryPlanner(serializer, model).build()]
+    while nodes:
+        node = nodes.pop()
+        if node.model not in models:
+            models.append(node.model)
+        nodes.extend(node.joins.values())
+        nodes.extend(node.prefetches.values())
+    return models
+
+
+def heavy_field_deferrals(serializer, queryset):
+    """
+    Lookups of the `heavy_fields` of `queryset`'s model, and of the models it
+    selects related, that `serializer` (an instance) does not render.
+
+    A field counts as rendered when the serializer reads the column itself or
+    declares it in `Meta.field_sources`. Properties and method fields that
+    read a heavy field without declaring it are not seen here;
+    `utils.query_audit.forbid_deferred_loads` catches them in tests.
+    """
+    root = QueryPlanner(serializer, queryset.model).build()
+    select_related = queryset.query.select_related
+    deferrals = []
+    nodes = [(root, "", select_related)]
+    while nodes:
+        node, prefix, joined = nodes.pop()
+        deferrals.extend(
+            f"{prefix}{name}"
+            for name in getattr(node.model, "heavy_fields", ())
+            if name not in node.columns
+        )
+        # select_related() without arguments has no per-relation map to
+        # follow; only the root is deferred then.
+        if not isinstance(joined, dict):
+            continue
+        for name, child in node.joins.items():
+            if name in joined:
+                nodes.append((child, f"{prefix}{name}__", joined[name]))
+    return deferrals
+
+
+def defer_heavy_fields(queryset, serializer):
+    """
+    Defer the heavy fields `serializer` (an instance) does not render.
+    """
+    deferrals = heavy_field_deferrals(serializer, queryset)
+    return queryset.defer(*deferrals) if deferrals else queryset
+
+
+class DeferHeavyFieldsMixin:
+    """
+    Defers the model's `heavy_fields` (large text columns) on list actions
+    unless the serializer renders them. Goes before `AutoPrefetchMixin` in
+    the bases, so the plan is built first: the planner leaves querysets that
+    already defer fields untouched.
+    """
+
+    defer_heavy_actions = ("list",)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if getattr(self, "action", None) in self.defer_heavy_actions:
+            serializer = self.get_serializer_class()(
+                context=self.get_serializer_context()
+            )
+            queryset = defer_heavy_fields(queryset, serializer)
+        return queryset
+
+
+class AutoPrefetchMixin:
+    """
+    Derives select_related / prefetch_related / only() for list and retrieve
+    from the serializer used by the action.
+
+    Custom read actions that serialize another queryset can use
+    `self.plan_queryset(queryset, SerializerClass)`.
+    """
+
+    auto_prefetch_actions = ("list", "retrieve")
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if getattr(self, "action", None) in self.auto_prefetch_actions:
+            queryset = self.plan_queryset(queryset, self.get_serializer_class())
+        return queryset
+
+    def plan_queryset(self, queryset, serializer_class):
+        serializer = serializer_class(context=self.get_serializer_context())
+        return plan_queryset(queryset, serializer)
@@ -10,8 +10,12 @@ class FamilyOverviewPDFReport(BasePDFReport):
         self.add_title()
 
         rows = []
-        qs = Family.objects.prefetch_related("parents", "children").order_by(
-            "family_name"
+        qs = Family.objects.order_by("family_name").only(
+            "family_name",
+            "province",
+            "vulnerability_level",
+            "parents_count",
+            "children_count",
         )
 
         for family in qs.iterator(200):
@@ -20,8 +24,8 @@ class FamilyOverviewPDFReport(BasePDFReport):
                     family.family_name,
                     family.province,
                     family.vulnerability_level,
-                    family.parents.count(),
-                    family.children.count(),
+                    family.parents_count,
+                    family.children_count,
                 ]
             )
 
@@ -53,8 +57,12 @@ class FamilyOverviewExcelReport:
             ]
         )
 
-        qs = Family.objects.prefetch_related("parents", "children").order_by(
-            "family_name"
+        qs = Family.objects.order_by("family_name").only(
+            "family_name",
+            "province",
+            "vulnerability_level",
+            "parents_count",
+            "children_count",
         )
 
         for family in qs.iterator(200):
@@ -63,8 +71,8 @@ class FamilyOverviewExcelReport:
                     family.family_name,
                     family.province,
                     family.vulnerability_level,
-                    family.parents.count(),
-                    family.children.count(),
+                    family.parents_count,
+                    family.children_count,
                 ]
             )
 
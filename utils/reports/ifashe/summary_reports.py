@@ -1,3 +1,6 @@
+from decimal import Decimal
+
+from django.db.models import Sum
 from openpyxl import Workbook
 from programs.models.ifashe_models import (
     Family,
@@ -10,6 +13,12 @@ from programs.models.ifashe_models import (
 from utils.reports.ifashe.base import BasePDFReport
 
 
+def school_support_cost():
+    return SchoolSupport.objects.aggregate(total=Sum("total_cost"))["total"] or Decimal(
+        "0.00"
+    )
+
+
 class IFASHESummaryPDFReport(BasePDFReport):
     title = "IFASHE – Program Summary"
 
@@ -22,6 +31,7 @@ class IFASHESummaryPDFReport(BasePDFReport):
                 Parent.objects.count(),
                 SponsoredChild.objects.count(),
                 DressingDistribution.objects.count(),
+                school_support_cost(),
             ]
         ]
 
@@ -31,6 +41,7 @@ class IFASHESummaryPDFReport(BasePDFReport):
                 "Parents",
                 "Children",
                 "Clothes Distributed",
+                "School Support Cost",
             ],
             rows=rows,
         )
@@ -54,5 +65,6 @@ class IfasheSummaryExcelReport:
                 SchoolSupport.objects.filter(payment_status="pending").count(),
             ]
         )
+        ws.append(["School Support Cost", school_support_cost()])
 
         wb.save(file_path)
@@ -1,12 +1,39 @@
+from decimal import Decimal
+
+from django.db.models import Count, DecimalField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from openpyxl import Workbook
 from utils.reports.ifashe.base import BaseExcelReport, BasePDFReport
 from programs.models.ifashe_models import (
     SponsoredChild,
     SchoolSupport,
-    DressingDistribution,
 )
 
 
+def child_support_queryset():
+    """
+    Sponsored children with the costs of their first school support and the
+    number of clothes distributions, computed in one query.
+    """
+    support = SchoolSupport.objects.filter(child=OuterRef("pk")).order_by("pk")
+    zero = Value(Decimal("0.00"))
+    money = DecimalField(max_digits=12, decimal_places=2)
+    return (
+        SponsoredChild.objects.select_related("family")
+        .annotate(
+            support_fees=Coalesce(Subquery(support.values("school_fees")[:1]), zero),
+            support_materials=Coalesce(
+                Subquery(support.values("materials_cost")[:1]), zero
+            ),
+            support_total=Coalesce(
+                Subquery(support.values("total_cost")[:1]), zero, output_field=money
+            ),
+            clothes_count=Count("dressing_distributions"),
+        )
+        .order_by("-support_total", "pk")
+    )
+
+
 class ChildSupportPDFReport(BasePDFReport):
     def generate(self):
         # self.file_path = file_path
@@ -24,19 +51,15 @@ class ChildSupportPDFReport(BasePDFReport):
 
         rows = []
 
-        for child in SponsoredChild.objects.select_related("family").iterator(200):
-            school_support = SchoolSupport.objects.filter(child=child).first()
-
-            clothes_count = DressingDistribution.objects.filter(child=child).count()
-
+        for child in child_support_queryset().iterator(200):
             rows.append(
                 [
                     child.full_name,
                     child.family.family_name,
-                    school_support.school_fees if school_support else 0,
-                    school_support.materials_cost if school_support else 0,
-                    school_support.total_cost if school_support else 0,
-                    clothes_count,
+                    child.support_fees,
+                    child.support_materials,
+                    child.support_total,
+                    child.clothes_count,
                 ]
             )
 
@@ -60,19 +83,15 @@ class ChildSupportExcelReport(BaseExcelReport):
             ]
         )
 
-        for child in SponsoredChild.objects.select_related("family").iterator(200):
-            school_support = SchoolSupport.objects.filter(child=child).first()
-
-            clothes_count = DressingDistribution.objects.filter(child=child).count()
-
+        for child in child_support_queryset().iterator(200):
             ws.append(
                 [
                     child.full_name,
                     child.family.family_name,
-                    school_support.school_fees if school_support else 0,
-                    school_support.materials_cost if school_support else 0,
-                    school_support.total_cost if school_support else 0,
-                    clothes_count,
+                    child.support_fees,
+                    child.support_materials,
+                    child.support_total,
+                    child.clothes_count,
                 ]
             )
 
@@ -96,21 +115,20 @@ class SupportExcelReport:
             ]
         )
 
-        qs = SchoolSupport.objects.select_related("child", "school").prefetch_related(
-            "payments"
+        # Largest balances first, from the stored ledger columns.
+        qs = SchoolSupport.objects.select_related("child", "school").order_by(
+            "-balance_due", "-total_cost"
         )
 
         for support in qs.iterator(200):
-            total_paid = sum(p.amount for p in support.payments.all())
-
             ws.append(
                 [
                     support.child.full_name,
                     support.school.name if support.school else "",
                     support.academic_year,
                     support.total_cost,
-                    total_paid,
-                    support.total_cost - total_paid,
+                    support.total_paid,
+                    support.balance_due,
                     support.payment_status,
                 ]
             )
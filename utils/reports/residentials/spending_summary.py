@@ -2,6 +2,7 @@ from programs.models.residentials_models import (
     HealthRecord,
     ChildEducation,
     ChildInsurance,
+    FoodItem,
     ResidentialFinancialPlan,
     Child,
 )
@@ -98,6 +99,16 @@ class SpendingSummaryMixin:
     def get_total_spending(self):
         return self.get_normal_spending() + self.get_special_diet_spending()
 
+    def get_planned_spending(self):
+        return ResidentialFinancialPlan.objects.filter(
+            **self.get_date_filters("month")
+        ).aggregate(total=Sum("total_cost"))["total"] or Decimal("0.00")
+
+    def get_food_purchases(self):
+        return FoodItem.objects.filter(
+            **self.get_date_filters("purchase_date")
+        ).aggregate(total=Sum("total_cost"))["total"] or Decimal("0.00")
+
 
 class SpendingSummaryPDFReport(SpendingSummaryMixin, BasePDFReport):
     title = "Residential Spending Summary"
@@ -122,6 +133,10 @@ class SpendingSummaryPDFReport(SpendingSummaryMixin, BasePDFReport):
                 ("Education Spending", self.get_education_spending()),
                 ("", ""),
                 ("Total Spending", self.get_total_spending()),
+                ("", ""),
+                ("Planned Spending", self.get_planned_spending()),
+                ("", ""),
+                ("Food Purchases", self.get_food_purchases()),
             ]
 
             self.add_table(headers=["Category", "Amount"], rows=rows)
@@ -147,5 +162,7 @@ class SpendingSummaryExcelReport(SpendingSummaryMixin):
         ws.append(["Special Diet Spending", f"{self.get_special_diet_spending():.2f}"])
         ws.append(["Education Spending", f"{self.get_education_spending():.2f}"])
         ws.append(["Total Spending", f"{self.get_total_spending():.2f}"])
+        ws.append(["Planned Spending", f"{self.get_planned_spending():.2f}"])
+        ws.append(["Food Purchases", f"{self.get_food_purchases():.2f}"])
 
         wb.save(file_path)
@@ -0,0 +1,188 @@
+"""
+Response cache for read-heavy viewsets.
+
+`CachedResponseMixin` serves `list` and `retrieve` from the cache; on any
+view using `ResponseCacheMixin`, extra actions opt in with the
+`cache_response` decorator. The key is made of the request path, the
+sorted query parameters, what the user is allowed to see (anonymous, role,
+staff and superuser flags) and the versions of the tables the response is
+computed from (see utils/model_versions.py). Any save or delete on one of
+those tables, or a bulk update that bumps its version, changes the key, so
+entries never need to be invalidated by hand.
+
+The tables are the ones `cache_dependencies` lists, defaulting to the
+models the action's serializer renders (see utils/query_planner.py). A
+response read from other tables than these, for instance through a
+`SerializerMethodField`, would go stale: list every model it reads.
+
+Only successful GET responses are cached; permission checks and
+throttles run before the cache is read.
+
+`view_models()` lists, for `model_versions.track()`, the models whose
+versions the views of the URLconf read: the dependencies of the cached
+actions and the tables of every view's queryset, whose counts are cached
+by the paginators (see utils/counts.py).
+"""
+
+import functools
+import hashlib
+import json
+import logging
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import QuerySet
+from django.urls import URLResolver, get_resolver
+from rest_framework import status
+from rest_framework.response import Response
+
+from utils.model_versions import get_versions, queryset_tables
+from utils.query_planner import serializer_models
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "response"
+DEFAULT_TIMEOUT = 300
+
+
+def cache_response(method):
+    """
+    Serve a viewset action from the response cache.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, request, *args, **kwargs):
+        return self.cached_response(method, request, *args, **kwargs)
+
+    return wrapper
+
+
+class ResponseCacheMixin:
+    cache_dependencies = None
+    cache_timeout = None
+
+    def get_cache_dependencies(self):
+        if self.cache_dependencies is not None:
+            return self.cache_dependencies
+        model = self.queryset.model
+        return serializer_models(self.get_serializer(), model)
+
+    def get_cache_audience(self, request):
+        user = request.user
+        if not user or not user.is_authenticated:
+            return "anonymous"
+        role = getattr(user, "role", "")
+        return f"{role}:{int(user.is_staff)}:{int(user.is_superuser)}"
+
+    def get_request_digest(self, request, dependencies=None, **extra):
+        """
+        Hash of everything a GET response depends on: the request and the
+        versions of the `dependencies` tables (by default all of them).
+        """
+        if dependencies is None:
+            dependencies = self.get_cache_dependencies()
+        tables = [model._meta.db_table for model in dependencies]
+        versions = get_versions(tables)
+        if versions is None:
+            return None
+        parts = {
+            "path": request.path,
+            "query": sorted(
+                (key, value)
+                for key, values in request.query_params.lists()
+                for value in values
+            ),
+            "audience": self.get_cache_audience(request),
+            "format": getattr(request, "accepted_media_type", None),
+            "versions": versions,
+            **extra,
+        }
+        return hashlib.sha256(
+            json.dumps(parts, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def get_response_cache_key(self, request):
+        digest = self.get_request_digest(request)
+        return digest and f"{KEY_PREFIX}:{digest}"
+
+    def cached_response(self, method, request, *args, **kwargs):
+        timeout = self.cache_timeout
+        if timeout is None:
+            timeout = getattr(settings, "RESPONSE_CACHE_TIMEOUT", DEFAULT_TIMEOUT)
+        if request.method != "GET" or not timeout:
+            return method(self, request, *args, **kwargs)
+
+        key = self.get_response_cache_key(request)
+        if key is None:
+            return method(self, request, *args, **kwargs)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data, headers={"X-Cache": "HIT"})
+
+        response = method(self, request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK and response.data is not None:
+            cache.set(key, response.data, timeout)
+            response["X-Cache"] = "MISS"
+        return response
+
+
+class CachedResponseMixin(ResponseCacheMixin):
+    @cache_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+
+def _view_classes(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _view_classes(pattern.url_patterns)
+        else:
+            cls = getattr(pattern.callback, "cls", None)
+            if cls is not None:
+                yield cls
+
+
+def _cached_dependencies(cls):
+    view = cls()
+    view.request = None
+    view.format_kwarg = None
+    view.kwargs = {}
+    actions = ["list", "retrieve"]
+    actions += [extra.__name__ for extra in getattr(cls, "get_extra_actions", list)()]
+    for action in actions:
+        view.action = action
+        try:
+            yield from view.get_cache_dependencies()
+        except Exception:
+            # Serializer choices that need a request: that action's tables
+            # stay untracked and its responses uncached.
+            logger.warning(
+                f"Could not list the dependencies of {cls.__name__}.{action}"
+            )
+
+
+def view_models(urlconf=None):
+    """
+    Models whose versions the views of `urlconf` read.
+    """
+    by_table = {
+        model._meta.db_table: model
+        for model in apps.get_models(include_auto_created=True)
+    }
+    models = set()
+    for cls in set(_view_classes(get_resolver(urlconf).url_patterns)):
+        queryset = getattr(cls, "queryset", None)
+        if isinstance(queryset, QuerySet):
+            models.update(
+                by_table[table]
+                for table in queryset_tables(queryset)
+                if table in by_table
+            )
+        if issubclass(cls, ResponseCacheMixin):
+            models.update(_cached_dependencies(cls))
+    return models
@@ -0,0 +1,107 @@
+"""
+Paid totals of school supports.
+
+`SchoolSupport.total_paid` is the sum of the support's payments and
+`balance_due` a generated column over it, so listing supports never reads
+the payments. Every change goes through `SchoolSupport.objects.post_payment()`,
+a single `UPDATE ... SET total_paid = total_paid + amount` that also derives
+the payment status, in the same transaction as the payment row:
+
+- `SchoolPayment.save()` posts a new payment, or moves an edited one;
+- deletes (instance, queryset or cascade) take the amount back through
+  the post_delete handler below;
+- `record_payments()` posts a batch of payments.
+
+`bulk_create()` and `update()` on payments bypass this; `rebuild()` and the
+`repair_school_ledger` command recompute the totals from the payments.
+"""
+
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import DecimalField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete
+
+from programs.models.ifashe_models import SchoolPayment, SchoolSupport
+from utils.model_versions import bump_version
+
+
+def record_payments(payments, using=None):
+    """
+    Create `payments`, a list of dicts with `school_support`, `amount` and
+    `date`, and post them to their supports in one transaction. The
+    supports are locked in a fixed order first, so that two batches paying
+    the same supports cannot deadlock. Returns the created payments.
+    """
+    totals = defaultdict(Decimal)
+    for payment in payments:
+        totals[payment["school_support"].pk] += payment["amount"]
+
+    with transaction.atomic(using=using):
+        list(
+            SchoolSupport.objects.db_manager(using)
+            .select_for_update()
+            .filter(pk__in=totals)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        created = SchoolPayment.objects.db_manager(using).bulk_create(
+            [SchoolPayment(**payment) for payment in payments]
+        )
+        bump_version(SchoolPayment)
+        supports = SchoolSupport.objects.db_manager(using)
+        for pk, amount in totals.items():
+            supports.filter(pk=pk).post_payment(amount)
+    return created
+
+
+def paid_expression():
+    """
+    The sum of the payments of a support, as an expression on supports.
+    """
+    payments = (
+        SchoolPayment.objects.filter(school_support=OuterRef("pk"))
+        .order_by()
+        .values("school_support")
+        .annotate(total=Sum("amount"))
+        .values("total")
+    )
+    return Coalesce(
+        Subquery(payments),
+        Value(Decimal("0.00")),
+        output_field=DecimalField(max_digits=12, decimal_places=2),
+    )
+
+
+def rebuild(pks=None, using=None):
+    """
+    Recompute the paid total and payment status of the supports in `pks`
+    (all supports by default). Returns the number of supports whose stored
+    total was wrong.
+    """
+    queryset = SchoolSupport.objects.db_manager(using).all()
+    if pks is not None:
+        queryset = queryset.filter(pk__in=pks)
+    paid = paid_expression()
+    fixed = queryset.exclude(total_paid=paid).update(
+        total_paid=paid, payment_status=SchoolSupport.payment_status_for(paid)
+    )
+    if fixed:
+        bump_version(SchoolSupport)
+    return fixed
+
+
+def _on_delete(sender, instance, using, **kwargs):
+    # Sent inside the deletion's transaction. When the support itself is
+    # being deleted, the update matches no row or one about to go.
+    SchoolSupport.objects.using(using).filter(
+        pk=instance.school_support_id
+    ).post_payment(-instance.amount)
+
+
+def connect_signals():
+    post_delete.connect(
+        _on_delete, sender=SchoolPayment, dispatch_uid="school_ledger_post_delete"
+    )
@@ -0,0 +1,130 @@
+"""
+Start-of-year generation of school supports.
+
+`generate_school_supports()` creates the `SchoolSupport` of an academic year
+for every active sponsored child in chunked `bulk_create` calls. The school
+of a child is the one of their latest support, or the school named in
+`SponsoredChild.school_name`; its fees come from a fee schedule of entries
+
+    {"school": <School pk or None>, "level": "Primary",
+     "school_fees": Decimal, "materials_cost": Decimal}
+
+an entry without a school applying to every school of that level. Children
+who already have a support for the year are left alone: they are excluded
+up front, and the (child, academic_year) unique constraint with
+`ignore_conflicts` covers rows created concurrently.
+"""
+
+from decimal import Decimal
+
+from django.db import router, transaction
+from django.db.models import OuterRef, Subquery, UUIDField
+
+from programs.models.ifashe_models import School, SchoolSupport, SponsoredChild
+from utils.model_versions import bump_version
+
+CHUNK_SIZE = 500
+
+
+def _fee_key(school, level):
+    return (str(school) if school else None, level.strip().lower())
+
+
+def fee_lookup(fee_schedule):
+    """
+    `fee_schedule` as `{(school pk or None, level): (fees, materials)}`.
+    """
+    return {
+        _fee_key(entry.get("school"), entry["level"]): (
+            Decimal(entry["school_fees"]),
+            Decimal(entry.get("materials_cost") or 0),
+        )
+        for entry in fee_schedule
+    }
+
+
+def eligible_children(academic_year):
+    """
+    Active children without a support for `academic_year`, with the school
+    of their latest support as `last_school`.
+    """
+    latest = SchoolSupport.objects.filter(child=OuterRef("pk")).order_by(
+        "-academic_year", "-created_on"
+    )
+    return (
+        SponsoredChild.objects.filter(support_status=SponsoredChild.ACTIVE)
+        .exclude(school_support__academic_year=academic_year)
+        .annotate(
+            last_school=Subquery(latest.values("school")[:1], output_field=UUIDField())
+        )
+        .order_by("pk")
+        .values("pk", "school_name", "school_level", "last_school")
+    )
+
+
+def generate_school_supports(
+    academic_year, fee_schedule, chunk_size=CHUNK_SIZE, using=None
+):
+    """
+    Create the supports of `academic_year` and return a summary of what was
+    created and which children were skipped.
+    """
+    using = using or router.db_for_write(SchoolSupport)
+    fees = fee_lookup(fee_schedule)
+    schools_by_name = {
+        name.strip().lower(): str(pk)
+        for pk, name in School.objects.using(using).values_list("pk", "name")
+    }
+    supports = SchoolSupport.objects.db_manager(using)
+    existing = supports.filter(academic_year=academic_year).count()
+
+    summary = {
+        "academic_year": academic_year,
+        "existing": existing,
+        "eligible": 0,
+        "created": 0,
+        "skipped_no_school": 0,
+        "skipped_no_fees": 0,
+    }
+    chunk = []
+
+    def flush():
+        with transaction.atomic(using=using):
+            supports.bulk_create(chunk, batch_size=chunk_size, ignore_conflicts=True)
+        chunk.clear()
+
+    children = eligible_children(academic_year).using(using)
+    for child in children.iterator(chunk_size=chunk_size):
+        summary["eligible"] += 1
+        school = child["last_school"] or schools_by_name.get(
+            (child["school_name"] or "").strip().lower()
+        )
+        if not school:
+            summary["skipped_no_school"] += 1
+            continue
+        cost = fees.get(_fee_key(school, child["school_level"])) or fees.get(
+            _fee_key(None, child["school_level"])
+        )
+        if not cost:
+            summary["skipped_no_fees"] += 1
+            continue
+
+        chunk.append(
+            SchoolSupport(
+                child_id=child["pk"],
+                school_id=school,
+                academic_year=academic_year,
+                school_fees=cost[0],
+                materials_cost=cost[1],
+            )
+        )
+        if len(chunk) >= chunk_size:
+            flush()
+    if chunk:
+        flush()
+
+    # ignore_conflicts does not tell which rows were inserted.
+    summary["created"] = supports.filter(academic_year=academic_year).count() - existing
+    if summary["created"]:
+        bump_version(SchoolSupport)
+    return summary
@@ -1,9 +1,62 @@
+from django.db.models import Q
 from rest_framework import filters
+from rest_framework.settings import api_settings
+
+from utils.full_text import prefix_query, rank_by
+from utils.postgres import is_postgres
+
 
 class CustomSearchFilter(filters.SearchFilter):
     search_param = 'search'
-    
+
     def get_search_terms(self, request):
         params = request.query_params.get(self.search_param, '')
         params = params.replace(',', ' ')
         return params.split()
+
+
+class FullTextSearchFilter(CustomSearchFilter):
+    """
+    Search filter using the model's stored search vector on Postgres.
+
+    `search_fields` covered by the model's `search_vector_fields` are matched
+    through the GIN-indexed vector; other search fields (related columns...)
+    keep their `icontains` lookup. Results are ranked unless the client asked
+    for an `?ordering=`, so this backend goes after OrderingFilter. On other
+    databases it behaves like CustomSearchFilter.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        field_names = getattr(queryset.model, "search_vector_field_names", None)
+        vector_fields = set(field_names()) if field_names else set()
+        if not vector_fields or not is_postgres(queryset.db):
+            return super().filter_queryset(request, queryset, view)
+
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        if not search_fields or not search_terms:
+            return queryset
+
+        other_lookups = [
+            self.construct_search(str(field), queryset)
+            for field in search_fields
+            if str(field) not in vector_fields
+        ]
+
+        for term in search_terms:
+            condition = Q()
+            query = prefix_query(term)
+            if query is not None:
+                condition |= Q(search_vector=query)
+            for lookup in other_lookups:
+                condition |= Q(**{lookup: term})
+            if condition:
+                queryset = queryset.filter(condition)
+
+        if self.must_call_distinct(queryset, search_fields):
+            queryset = queryset.distinct()
+
+        query = prefix_query(" ".join(search_terms))
+        if query is None or request.query_params.get(api_settings.ORDERING_PARAM):
+            return queryset
+        return rank_by(queryset, query)
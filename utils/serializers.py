@@ -0,0 +1,62 @@
+"""
+Sparse fieldsets and opt-in expansions for read serializers.
+
+A serializer using `SparseFieldsetMixin` renders, on GET requests:
+
+- `?fields=a,b`: only the listed fields;
+- `?omit=a,b`: every field but the listed ones;
+- `?expand=a,b`: the listed `Meta.expandable_fields`, which list views
+  leave out by default (detail views always render them). Naming an
+  expandable field in `?fields=` expands it as well.
+
+Fields are pruned when the serializer is built, before the view plans its
+queryset (see utils/query_planner.py), so `only()` and the prefetches
+follow the fields that are actually rendered. Only the top-level
+serializer of a response is pruned; nested serializers render in full.
+"""
+
+from rest_framework import serializers
+
+FIELDS_PARAM = "fields"
+OMIT_PARAM = "omit"
+EXPAND_PARAM = "expand"
+
+
+def _names(request, param):
+    value = request.query_params.get(param, "")
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+class SparseFieldsetMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        view = self.context.get("view")
+        if getattr(view, "swagger_fake_view", False):
+            # Schema generation documents every field.
+            return
+        if request is not None and request.method in ("GET", "HEAD"):
+            self.prune_fields(request)
+
+    def prune_fields(self, request):
+        expandable = set(getattr(self.Meta, "expandable_fields", ()))
+        only = _names(request, FIELDS_PARAM)
+        omit = _names(request, OMIT_PARAM)
+        expand = _names(request, EXPAND_PARAM)
+
+        unknown = (only | omit) - set(self.fields)
+        unknown |= expand - expandable
+        if unknown:
+            raise serializers.ValidationError(
+                {"fields": f"Unknown fields: {', '.join(sorted(unknown))}"}
+            )
+
+        expand |= only & expandable
+        view = self.context.get("view")
+        if getattr(view, "action", None) == "list":
+            omit |= expandable - expand
+        if only:
+            omit |= set(self.fields) - only - expand
+
+        for name in omit:
+            self.fields.pop(name, None)
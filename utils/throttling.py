@@ -0,0 +1,143 @@
+"""
+Sliding-window throttles for the public and authentication endpoints.
+
+A view opts in with `throttle_scope` and the throttle classes; the rates
+are `REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"][scope]` per client IP and
+`[f"{scope}_email"]` per email address submitted. A scope without a rate is
+not throttled.
+
+Counts live in the default cache (Redis in production, where INCR is
+atomic across workers; local memory otherwise). Each window is a counter
+key and the rate is estimated over a sliding window by weighting the
+previous window's count by how much of it still overlaps. DRF runs
+throttles before the handler, so a throttled request never reaches
+password hashing, email sending or upload parsing, and gets a
+`Retry-After` header.
+"""
+
+import hashlib
+import time
+
+from django.core.cache import cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+KEY_PREFIX = "throttle"
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    rate_suffix = ""
+    cache = cache
+    timer = time.time
+
+    def __init__(self):
+        self.wait_seconds = None
+
+    def get_rate(self, view):
+        scope = getattr(view, "throttle_scope", None)
+        if scope is None:
+            return None, None
+        name = f"{scope}{self.rate_suffix}"
+        return name, api_settings.DEFAULT_THROTTLE_RATES.get(name)
+
+    def parse_rate(self, rate):
+        count, period = rate.split("/")
+        duration = {"s": 1, "m": 60, "h": 3600, "d": 86400}[period[0]]
+        return int(count), duration
+
+    def get_ident_value(self, request, view):
+        raise NotImplementedError(".get_ident_value() must be overridden")
+
+    def allow_request(self, request, view):
+        name, rate = self.get_rate(view)
+        if rate is None:
+            return True
+        ident = self.get_ident_value(request, view)
+        if ident is None:
+            return True
+
+        limit, window = self.parse_rate(rate)
+        now = self.timer()
+        current = int(now // window)
+        elapsed = now - current * window
+        keys = [f"{KEY_PREFIX}:{name}:{ident}:{number}" for number in (current - 1, current)]
+
+        # Count this request first and decide from the count incr() returns:
+        # concurrent requests each get their own count, so a burst cannot all
+        # pass a check made against the same earlier read.
+        count = self.increment(keys[1], window)
+        previous = self.cache.get(keys[0], 0)
+        estimate = previous * (window - elapsed) / window + count
+        if estimate > limit:
+            # A refused request does not use up the window.
+            try:
+                self.cache.decr(keys[1])
+            except ValueError:
+                pass
+            self.wait_seconds = self.get_wait(
+                previous, limit, window, elapsed, estimate - 1
+            )
+            return False
+        return True
+
+    def increment(self, key, window):
+        # add() creates the counter with an expiry; incr() is atomic on Redis.
+        if self.cache.add(key, 1, timeout=2 * window):
+            return 1
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            # Expired between add() and incr().
+            self.cache.set(key, 1, timeout=2 * window)
+            return 1
+
+    def get_wait(self, previous, limit, window, elapsed, estimate):
+        # The estimate drops by previous / window per second as the previous
+        # window slides out; when that is not enough, wait for the next one.
+        excess = estimate - limit + 1
+        if previous and excess <= previous * (window - elapsed) / window:
+            return excess * window / previous
+        return window - elapsed
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class ScopedIPThrottle(SlidingWindowThrottle):
+    """
+    Per client IP address, using the view's `throttle_scope` rate.
+
+    X-Forwarded-For is only read behind the `NUM_PROXIES` trusted proxies:
+    with the setting unset, DRF would take the header as sent by the
+    client, and a new value per request would get a new bucket.
+    """
+
+    def get_ident_value(self, request, view):
+        if api_settings.NUM_PROXIES is None:
+            return request.META.get("REMOTE_ADDR")
+        return self.get_ident(request)
+
+
+class PublicIPThrottle(ScopedIPThrottle):
+    """
+    Per client IP address, for anonymous requests only.
+    """
+
+    def get_ident_value(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return None
+        return super().get_ident_value(request, view)
+
+
+class ScopedEmailThrottle(SlidingWindowThrottle):
+    """
+    Per submitted email address, using the `{throttle_scope}_email` rate.
+    """
+
+    rate_suffix = "_email"
+
+    def get_ident_value(self, request, view):
+        email = request.data.get("email") if hasattr(request.data, "get") else None
+        if not isinstance(email, str) or not email.strip():
+            return None
+        return hashlib.sha256(email.strip().lower().encode()).hexdigest()[:32]
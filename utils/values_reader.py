@@ -0,0 +1,163 @@
+"""
+values()-based read path for list endpoints.
+
+`ValuesReader` compiles a ModelSerializer (an instance, so sparse fieldsets
+and the request context apply) into a `values_list()` query and a row
+mapper: every rendered field becomes the index of its column in the row
+and a converter, chosen once. Rows are mapped without model instances,
+`get_attribute()` or `SerializerMethodField` dispatch, and the output is
+the same as `serializer.data`.
+
+Plain columns, forward foreign keys rendered as primary keys and dotted
+sources through foreign keys are compiled from the serializer. Other
+fields (method fields, properties) are declared on the serializer Meta
+with the lookups they read and a function of those values:
+
+    class Meta:
+        values_sources = {
+            "child_name": (["child__first_name", "child__last_name"], full_name),
+        }
+
+`ValuesListMixin` serves a viewset's `list` through the reader.
+"""
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db.models.fields.files import FieldFile, FileField
+from rest_framework import fields as drf_fields
+from rest_framework import serializers
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.response import Response
+
+# Fields whose to_representation() returns the database value unchanged.
+IDENTITY_FIELDS = (
+    drf_fields.BooleanField,
+    drf_fields.ReadOnlyField,
+    PrimaryKeyRelatedField,
+)
+IDENTITY_EXACT_FIELDS = (
+    drf_fields.CharField,
+    drf_fields.EmailField,
+    drf_fields.ChoiceField,
+)
+
+
+def _column_converter(field, model_field):
+    if isinstance(model_field, FileField):
+        return lambda name: field.to_representation(FieldFile(None, model_field, name))
+    if isinstance(field, IDENTITY_FIELDS) or type(field) in IDENTITY_EXACT_FIELDS:
+        return None
+    return field.to_representation
+
+
+class ValuesReader:
+    def __init__(self, serializer):
+        if isinstance(serializer, serializers.ListSerializer):
+            serializer = serializer.child
+        self.serializer = serializer
+        self.model = serializer.Meta.model
+        self.columns = []
+        self.mappers = []
+        declared = getattr(serializer.Meta, "values_sources", {})
+
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if name in declared:
+                lookups, func = declared[name]
+                indexes = tuple(self.column(lookup) for lookup in lookups)
+                self.mappers.append((name, indexes, func, False))
+                continue
+            lookup, model_field = self.resolve(name, field)
+            converter = _column_converter(field, model_field)
+            self.mappers.append((name, (self.column(lookup),), converter, True))
+
+    def column(self, lookup):
+        if lookup not in self.columns:
+            self.columns.append(lookup)
+        return self.columns.index(lookup)
+
+    def resolve(self, name, field):
+        """
+        The values() lookup and model field behind a serializer field.
+        """
+        if field.source == "*" or isinstance(field, serializers.BaseSerializer):
+            raise self.undeclared(name)
+        model = self.model
+        path = []
+        for index, attr in enumerate(field.source_attrs):
+            try:
+                model_field = model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                raise self.undeclared(name)
+            path.append(model_field.name)
+            is_last = index == len(field.source_attrs) - 1
+
+            if not model_field.is_relation:
+                if not is_last:
+                    raise self.undeclared(name)
+                return "__".join(path), model_field
+
+            forward = model_field.concrete and (
+                model_field.many_to_one or model_field.one_to_one
+            )
+            if not forward or (
+                is_last and not isinstance(field, PrimaryKeyRelatedField)
+            ):
+                raise self.undeclared(name)
+            if is_last:
+                return "__".join(path), model_field
+            model = model_field.related_model
+
+    def undeclared(self, name):
+        return ImproperlyConfigured(
+            f"{type(self.serializer).__name__}.{name} cannot be read from "
+            "values(); declare it in Meta.values_sources."
+        )
+
+    def queryset(self, queryset, extra=()):
+        """
+        `queryset` as named rows of the reader's columns, plus the `extra`
+        lookups (such as the ordering columns a keyset paginator reads).
+        """
+        for lookup in extra:
+            self.column(lookup)
+        return queryset.prefetch_related(None).values_list(*self.columns, named=True)
+
+    def rows(self, rows):
+        mappers = self.mappers
+        data = []
+        for row in rows:
+            item = {}
+            for name, indexes, convert, is_column in mappers:
+                if is_column:
+                    value = row[indexes[0]]
+                    if value is not None and convert is not None:
+                        value = convert(value)
+                else:
+                    value = convert(*[row[index] for index in indexes])
+                item[name] = value
+            data.append(item)
+        return data
+
+
+class ValuesListMixin:
+    """
+    Renders `list` from `values_list()` rows through `ValuesReader`.
+    """
+
+    def list(self, request, *args, **kwargs):
+        reader = ValuesReader(self.get_serializer())
+        queryset = self.filter_queryset(self.get_queryset())
+        # Keyset pagination reads the ordering values of the edge rows.
+        pk_name = self.queryset.model._meta.pk.name
+        ordering = [
+            pk_name if field.lstrip("-") == "pk" else field.lstrip("-")
+            for field in (queryset.query.order_by or self.queryset.model._meta.ordering)
+            if isinstance(field, str) and field != "?"
+        ]
+        queryset = reader.queryset(queryset, extra=[*ordering, pk_name])
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(reader.rows(page))
+        return Response(reader.rows(queryset))